@@ -4,24 +4,14 @@ Built with Streamlit for PM Internship Scheme
 """
 
 import streamlit as st
+import os
 import sys
 sys.path.append('.')
 
-from data.real_internships import get_all_internships, get_statistics
-from models.recommender import InternshipRecommender, calculate_profile_strength
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 
-def generate_roadmap(skill_gaps):
-    roadmap = {}
-    weeks = ["Week 1", "Week 2", "Week 3", "Week 4"]
-    
-    for i, skill in enumerate(skill_gaps[:4]):
-        roadmap[weeks[i]] = f"Learn {skill} fundamentals and build 1 small project"
-    
-    return roadmap
+# Heavy libraries (pandas, plotly, numpy via the recommender) are imported
+# inside the pages that use them so the sidebar renders without paying for them.
 
 # Page configuration
 st.set_page_config(
@@ -183,24 +173,173 @@ if 'student_profile' not in st.session_state:
     st.session_state.student_profile = None
 if 'recommendations' not in st.session_state:
     st.session_state.recommendations = None
+if 'session_id' not in st.session_state:
+    import uuid
+    st.session_state.session_id = uuid.uuid4().hex
+    st.session_state.shown_cards = set()
 
-# Initialize components
+# Initialize components (loaded on first use by the page that needs them)
 @st.cache_resource
 def load_recommender():
+    from models.recommender import InternshipRecommender
     return InternshipRecommender()
 
+@st.cache_resource
+def collaborative_slot():
+    # Modification time of the collaborative model file the recommender has loaded
+    import threading
+    return {'mtime': None, 'lock': threading.Lock()}
+
+def get_recommender():
+    # Collaborative factor from logged Apply/Save events, once
+    # `python -m models.collaborative build` has produced a model; reloaded
+    # whenever `update` rewrites the file
+    recommender = load_recommender()
+    from models.collaborative import CollaborativeModel, DEFAULT_PATH
+    try:
+        mtime = os.stat(DEFAULT_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    slot = collaborative_slot()
+    if slot['mtime'] != mtime:
+        with slot['lock']:
+            if slot['mtime'] != mtime:
+                if mtime is None:
+                    recommender.disable_collaborative()
+                else:
+                    try:
+                        recommender.enable_collaborative(CollaborativeModel.load(DEFAULT_PATH))
+                    except (OSError, ValueError, KeyError) as e:
+                        print(f"⚠️ Collaborative model not loaded: {e}")
+                slot['mtime'] = mtime
+    return recommender
+
+def student_key(email):
+    # Stable across sessions, so logged events and the collaborative model follow the student
+    import hashlib
+    return hashlib.sha256(email.strip().lower().encode('utf-8')).hexdigest()[:16]
+
+@st.cache_resource
+def load_artifacts():
+    # Set INTERNSHIP_ARTIFACTS to a directory built with
+    # `python data/real_internships.py build` to start from its files
+    directory = os.environ.get('INTERNSHIP_ARTIFACTS')
+    if not directory:
+        return None
+    from data.real_internships import load_artifacts as read_artifacts
+    try:
+        return read_artifacts(directory)
+    except (OSError, ValueError, KeyError, IndexError) as e:
+        print(f"⚠️ Artifacts in {directory} not used: {e}")
+        return None
+
 @st.cache_data
 def load_internships():
+    artifacts = load_artifacts()
+    if artifacts is not None:
+        return artifacts['internships']
+    from data.real_internships import get_all_internships
     return get_all_internships()
 
+@st.cache_resource
+def load_shared_reader():
+    # Set INTERNSHIP_SHARED_INDEX to attach to a catalog published with
+    # `python -m models.shared_index publish` instead of a per-process copy
+    directory = os.environ.get('INTERNSHIP_SHARED_INDEX')
+    if not directory:
+        return None
+    from models.shared_index import SharedCatalogReader
+    return SharedCatalogReader(directory)
+
+@st.cache_resource
+def load_batcher():
+    # Shared by every session: concurrent recommend calls are scored in micro-batches
+    from models.batching import RecommendationBatcher
+    # Derived features are reused from disk across restarts (models/feature_cache.py)
+    from models.feature_cache import load_or_build, DEFAULT_DIR
+    artifacts = load_artifacts()
+    features_dir = artifacts['features_dir'] if artifacts and artifacts['features_dir'] else DEFAULT_DIR
+    index = load_or_build(load_internships(), get_recommender(), features_dir)
+    return RecommendationBatcher(get_recommender(), index, max_wait_ms=2.0)
+
+@st.cache_resource
+def shared_batcher_slot():
+    # The batcher of the shared catalog version in use; replaced (and the old
+    # one closed, releasing its index) when a newer version is published
+    import threading
+    return {'version': None, 'batcher': None, 'lock': threading.Lock()}
+
+def get_batcher():
+    reader = load_shared_reader()
+    if reader is None:
+        return load_batcher()
+    reader.refresh()
+    snapshot = reader.current
+    slot = shared_batcher_slot()
+    with slot['lock']:
+        if slot['version'] != snapshot.version:
+            from models.batching import RecommendationBatcher
+            from models.catalog_index import CatalogIndex
+            old = slot['batcher']
+            index = CatalogIndex.from_snapshot(snapshot)
+            slot['batcher'] = RecommendationBatcher(get_recommender(), index, max_wait_ms=2.0)
+            slot['version'] = snapshot.version
+            if old is not None:
+                # Queued requests finish first; later submits see it closed
+                old.close()
+        return slot['batcher']
+
+@st.cache_resource
+def load_skill_graph():
+    # Prerequisite graph behind the learning roadmaps (data/skill_graph.json)
+    from models.roadmap import SkillGraph
+    return SkillGraph.load()
+
+@st.cache_resource
+def load_event_store():
+    # Impressions and Apply/Save/Share clicks; writes are queued and group-committed
+    # off the script thread (models/event_store.py). INTERNSHIP_EVENT_STORE=off disables it
+    from models.event_store import EventStore, DEFAULT_PATH
+    if DEFAULT_PATH == 'off':
+        return None
+    try:
+        return EventStore(DEFAULT_PATH)
+    except Exception as e:
+        print(f"⚠️ Event store unavailable: {e}")
+        return None
+
+@st.cache_resource
+def load_trending():
+    # Sliding-window view/save/apply counters shared by every session
+    # (models/trending.py), seeded with the last week of logged events
+    from models.trending import TrendingCounters
+    from models.event_store import DEFAULT_PATH, read_events
+    trending = TrendingCounters()
+    if DEFAULT_PATH != 'off':
+        skills = {i.get('id'): i.get('required_skills', []) for i in load_internships()}
+        week_ago = datetime.now().timestamp() - 7 * 86400
+        try:
+            trending.replay(read_events(DEFAULT_PATH, since=week_ago), lambda posting_id: skills.get(posting_id, ()))
+        except Exception as e:
+            print(f"⚠️ Trending counters start empty: {e}")
+    return trending
+
+def log_event(event_type, rec, rank):
+    store = load_event_store()
+    if store is not None:
+        store.record(event_type, rec.get('id', ''), st.session_state.session_id, rank, rec.get('match_score'))
+    from models.trending import EVENT_STORE_TYPES
+    if event_type in EVENT_STORE_TYPES:
+        load_trending().record(EVENT_STORE_TYPES[event_type], rec.get('id', ''), rec.get('required_skills', []))
+
 @st.cache_data
 def load_stats():
+    artifacts = load_artifacts()
+    if artifacts is not None:
+        return artifacts['statistics']
+    from data.real_internships import get_statistics
     return get_statistics()
 
-recommender = load_recommender()
-all_internships = load_internships()
-stats = load_stats()
-
 # Sidebar
 with st.sidebar:
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -243,6 +382,7 @@ with st.sidebar:
     
     st.markdown("---")
     st.markdown("### Stats")
+    stats = load_stats()
     st.metric("Total Internships", stats['total_internships'])
     st.metric("Companies", stats['total_companies'])
     st.metric("Avg Stipend", f"₹{stats['avg_stipend']:,.0f}")
@@ -348,9 +488,24 @@ if "🏠 Home" in page:
     st.markdown("<br>", unsafe_allow_html=True)
     st.subheader("🔥 Top Skills in Demand")
     
+    import plotly.express as px
+    
+    # Live activity (views, saves and applies of postings needing each skill)
+    # when there is some in the chosen window, else the catalog-wide ranking
+    trending = load_trending()
+    window = st.radio("Trending over", ["Last hour", "Last day", "Last week"], index=2, horizontal=True)
+    window = window.split()[-1]
+    trending_skills = trending.top('skill', window, n=10)
+    
     # Create bar chart
-    top_skills = stats['top_skills'][:10]
-    skill_counts = list(range(len(top_skills), 0, -1))  # Descending counts
+    if trending_skills:
+        top_skills = [skill for skill, _ in trending_skills]
+        skill_counts = [round(score, 1) for _, score in trending_skills]
+        st.caption("Weighted by student activity: view 1, save 3, apply 5")
+    else:
+        top_skills = stats['top_skills'][:10]
+        skill_counts = list(range(len(top_skills), 0, -1))  # Descending counts
+        st.caption(f"No student activity in the last {window} yet - showing the most requested skills")
     
     fig = px.bar(
         x=skill_counts,
@@ -367,7 +522,13 @@ if "🏠 Home" in page:
     st.markdown("<br>", unsafe_allow_html=True)
     st.subheader("💼 Featured Companies Hiring")
     
-    companies = stats['companies'][:12]
+    # Companies of trending postings first, then the rest alphabetically
+    internships_by_id = {i.get('id'): i for i in load_internships()}
+    trending_companies = [
+        internships_by_id[posting_id]['company']
+        for posting_id, _ in trending.top('posting', window, n=50) if posting_id in internships_by_id
+    ]
+    companies = list(dict.fromkeys(trending_companies + stats['companies']))[:12]
     cols = st.columns(4)
     for idx, company in enumerate(companies):
         with cols[idx % 4]:
@@ -484,10 +645,13 @@ elif "👤 Create Profile" in page:
                     'skills': all_skills,
                     'interests': interests,
                     'career_goals': career_goals,
+                    'student_id': student_key(email),
                     'created_at': datetime.now().isoformat()
                 }
                 
                 st.session_state.student_profile = profile
+                # Events from now on are logged under the student, not the browser session
+                st.session_state.session_id = profile['student_id']
                 # ===== RESUME ANALYSIS =====
                 if uploaded_resume:
                     resume_lower = resume_text.lower()
@@ -503,12 +667,37 @@ elif "👤 Create Profile" in page:
                     if missing_skills:
                         st.warning(f"Consider adding these skills in your resume: {', '.join(missing_skills[:5])}")
                 # Calculate profile strength
+                from models.recommender import calculate_profile_strength
                 strength = calculate_profile_strength(profile)
                 
                 # Generate recommendations
-                with st.spinner("🤖 AI is analyzing your profile and matching internships..."):
-                    recommendations = recommender.recommend(profile, all_internships, top_k=10)
+                batcher = get_batcher()
+                if batcher.index.size >= 20000:
+                    # Large catalogs: show the best matches found so far while scoring continues
+                    progress = st.progress(0.0, text="🤖 AI is analyzing your profile and matching internships...")
+                    preview = st.empty()
+                    snapshots = get_recommender().iter_recommendations(
+                        profile, batcher.index, top_k=10, compact=True
+                    )
+                    for scored, recommendations in snapshots:
+                        progress.progress(scored / batcher.index.size, text=f"Scored {scored:,} of {batcher.index.size:,} internships")
+                        preview.markdown("**Top matches so far:** " + ", ".join(
+                            f"{batcher.index.get(pid)['company']} ({score * 100:.0f}%)"
+                            for pid, score, _ in list(recommendations)[:5]
+                        ))
+                    progress.empty()
+                    preview.empty()
                     st.session_state.recommendations = recommendations
+                else:
+                    with st.spinner("🤖 AI is analyzing your profile and matching internships..."):
+                        # Only ids, scores and breakdowns are kept per session;
+                        # the Recommendations page hydrates them from the catalog
+                        try:
+                            recommendations = batcher.recommend(profile, top_k=10, compact=True)
+                        except RuntimeError:
+                            # Swapped out for a newer catalog version meanwhile
+                            recommendations = get_batcher().recommend(profile, top_k=10, compact=True)
+                        st.session_state.recommendations = recommendations
                 
                 st.success(f"✅ Profile created successfully! Found {len(recommendations)} matching internships.")
                 st.balloons()
@@ -539,10 +728,27 @@ elif "🎯 Recommendations" in page:
         if st.button("Create Profile Now"):
             st.switch_page("pages/01_Create_Profile.py")
     else:
-        recommendations = st.session_state.recommendations
         profile = st.session_state.student_profile
+        batcher = get_batcher()
+        recommender = get_recommender()
+        # Without logged events the student is scored without the collaborative factor
+        active_weights = recommender.weights_for(profile)
         
-        st.markdown(f'<div class="sub-header">Hi {profile["name"]}! We found {len(recommendations)} perfect matches for you</div>', unsafe_allow_html=True)
+        # Factor weights (re-ranking reuses the factor scores, no rescoring)
+        with st.expander("⚖️ Adjust Matching Weights"):
+            factor_labels = {
+                'skills_match': "Skills", 'interest_alignment': "Interests", 'experience_fit': "Experience",
+                'location_match': "Location", 'career_goals': "Career Goals", 'collaborative': "Similar Students"
+            }
+            factor_labels = {f: label for f, label in factor_labels.items() if f in active_weights}
+            weight_cols = st.columns(len(factor_labels))
+            weights = {
+                factor: weight_cols[n].slider(label, 0, 100, int(round(active_weights[factor] * 100)),
+                                              key=f"weight_{factor}")
+                for n, (factor, label) in enumerate(factor_labels.items())
+            }
+        
+        header = st.container()
         
         # Filters
         with st.expander("🔍 Filter Recommendations"):
@@ -550,17 +756,29 @@ elif "🎯 Recommendations" in page:
             with col1:
                 min_score = st.slider("Minimum Match Score (%)", 0, 100, 50)
             with col2:
-                locations = st.multiselect("Locations", list(set(r['location'] for r in recommendations)))
+                locations = st.multiselect("Locations", sorted(batcher.index.location_values))
             with col3:
                 min_stipend = st.number_input("Min Stipend (₹)", min_value=0, value=0, step=5000)
         
-        # Apply filters
-        filtered_recs = [
-            r for r in recommendations
-            if r['match_percentage'] >= min_score
-            and (not locations or r['location'] in locations)
-            and r['stipend'] >= min_stipend
-        ]
+        # Location and stipend filters are applied before ranking, so the top
+        # matches are picked among every qualifying posting
+        from models.constraints import RecommendationConstraints
+        constraints = RecommendationConstraints(locations=locations or None, min_stipend=min_stipend or None)
+        default_weights = all(weights[f] == int(round(w * 100)) for f, w in active_weights.items())
+        if sum(weights.values()) == 0:
+            st.warning("⚠️ Give at least one factor some weight")
+            default_weights, weights = True, active_weights
+        
+        if default_weights and constraints.is_empty:
+            compact = st.session_state.recommendations
+        else:
+            compact = recommender.rerank(profile, batcher.index, weights, top_k=10, compact=True, constraints=constraints)
+        recommendations = recommender.hydrate(compact, profile, batcher.index)
+        
+        header.markdown(f'<div class="sub-header">Hi {profile["name"]}! We found {len(recommendations)} perfect matches for you</div>', unsafe_allow_html=True)
+        
+        # Match score only trims the ranked list (top-k above a score is a prefix of top-k)
+        filtered_recs = [r for r in recommendations if r['match_percentage'] >= min_score]
         
         st.info(f"Showing {len(filtered_recs)} internships")
         
@@ -590,8 +808,8 @@ elif "🎯 Recommendations" in page:
                     gaps_html = " ".join([f'<span class="skill-tag skill-gap">{gap}</span>' for gap in rec['skill_gaps']])
                     st.markdown(gaps_html, unsafe_allow_html=True)
                 if rec['skill_gaps']:
-                    st.markdown("### 🛣 Personalized 4-Week Roadmap")
-                    roadmap = generate_roadmap(rec['skill_gaps'])
+                    roadmap = load_skill_graph().roadmap(rec['skill_gaps'], profile.get('skills', []))
+                    st.markdown(f"### 🛣 Personalized {len(roadmap)}-Week Roadmap")
     
                     for week, task in roadmap.items():
                         st.write(f"**{week}:** {task}")
@@ -608,11 +826,23 @@ elif "🎯 Recommendations" in page:
                 # Actions
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.button(f"🚀 Apply Now", key=f"apply_{idx}", type="primary")
+                    if st.button(f"🚀 Apply Now", key=f"apply_{idx}", type="primary"):
+                        log_event('apply', rec, idx)
+                        st.success(f"Apply at {rec.get('apply_link', rec['company'])}")
                 with col2:
-                    st.button(f"💾 Save for Later", key=f"save_{idx}")
+                    if st.button(f"💾 Save for Later", key=f"save_{idx}"):
+                        log_event('save', rec, idx)
+                        st.toast(f"💾 Saved {rec['title']} at {rec['company']}")
                 with col3:
-                    st.button(f"📤 Share", key=f"share_{idx}")
+                    if st.button(f"📤 Share", key=f"share_{idx}"):
+                        log_event('share', rec, idx)
+                        st.code(f"{rec['title']} at {rec['company']} - {rec.get('apply_link', '')}", language=None)
+                
+                # One impression per card and position per session (reruns don't repeat it)
+                card = (rec.get('id'), idx)
+                if card not in st.session_state.shown_cards:
+                    st.session_state.shown_cards.add(card)
+                    log_event('impression', rec, idx)
                 
                 st.markdown("---")
 
@@ -620,6 +850,9 @@ elif "🎯 Recommendations" in page:
 elif "📊 Analytics" in page:
     st.markdown('<div class="main-header">Platform Analytics</div>', unsafe_allow_html=True)
     
+    import plotly.express as px
+    all_internships = load_internships()
+    
     # Overall stats
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Total Internships", stats['total_internships'])
@@ -690,26 +923,14 @@ elif "💼 Browse Internships" in page:
         min_stipend_filter = st.number_input("Min Stipend", min_value=0, value=0, step=5000)
     
     # Filter internships
-    filtered = all_internships
-    
-    if search:
-        search_lower = search.lower()
-        filtered = [
-            i for i in filtered
-            if search_lower in i['company'].lower()
-            or search_lower in i['title'].lower()
-            or any(search_lower in skill.lower() for skill in i['required_skills'])
-        ]
-    
-    if location_filter:
-        filtered = [i for i in filtered if i['location'] in location_filter]
-    
-    if min_stipend_filter > 0:
-        filtered = [i for i in filtered if i['stipend'] >= min_stipend_filter]
+    from data.real_internships import filter_internships
+    all_internships = load_internships()
+    filtered = filter_internships(all_internships, search, location_filter, min_stipend_filter)
     
     st.info(f"Showing {len(filtered)} of {len(all_internships)} internships")
     
     # Display as table
+    import pandas as pd
     df = pd.DataFrame(filtered)
     df = df[['company', 'title', 'location', 'stipend', 'duration_months', 'department']]
     df = df.rename(columns={
@@ -0,0 +1,108 @@
+"""
+Event store write throughput
+Producer threads record() impression/click events as fast as they can; the
+clock stops once every event is committed. Also reports how long record()
+itself takes, which is all a UI thread ever waits for.
+
+Run:
+    python benchmarks/bench_events.py --events 200000 --producers 1,4 --batch-sizes 1,256,2048
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from benchmarks.bench_recommend import git_commit
+from models.event_store import EventStore
+
+# Roughly what the Recommendations page emits: ten impressions per click
+EVENT_MIX = ['impression'] * 30 + ['save'] * 1 + ['apply'] * 1 + ['share'] * 1
+
+def _produce(store: EventStore, n: int, seed: int, latencies: List[float]):
+    rng = random.Random(seed)
+    session = f"bench-{seed}"
+    samples = []
+    for i in range(n):
+        event_type = rng.choice(EVENT_MIX)
+        t0 = time.perf_counter()
+        store.record(event_type, f"P{rng.randrange(100000)}", session, rank=i % 10 + 1, score=rng.random())
+        if i % 16 == 0:
+            samples.append(time.perf_counter() - t0)
+    latencies.extend(samples)
+
+def measure(n_events: int, producers: int, max_batch_size: int, max_wait_ms: float, directory: str) -> Dict:
+    """Commit n_events from `producers` threads into a fresh database"""
+    path = os.path.join(directory, f"events-{producers}-{max_batch_size}.db")
+    store = EventStore(path, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, max_pending=n_events + 1)
+    latencies: List[float] = []
+    per_thread = n_events // producers
+    threads = [
+        threading.Thread(target=_produce, args=(store, per_thread, seed, latencies))
+        for seed in range(producers)
+    ]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    enqueued_s = time.perf_counter() - started
+    store.flush()
+    elapsed = time.perf_counter() - started
+    stats = store.stats()
+    store.close()
+
+    latencies.sort()
+    committed = stats['written']
+    return {
+        'events': committed,
+        'producers': producers,
+        'max_batch_size': max_batch_size,
+        'events_per_s': round(committed / elapsed, 1),
+        'enqueue_s': round(enqueued_s, 3),
+        'commit_s': round(elapsed, 3),
+        'record_p50_us': round(latencies[len(latencies) // 2] * 1e6, 2),
+        'record_p99_us': round(latencies[int(len(latencies) * 0.99)] * 1e6, 2),
+        'batches': stats['batches'],
+        'avg_batch_size': stats['avg_batch_size'],
+        'dropped': stats['dropped']
+    }
+
+def run(n_events: int, producer_counts: List[int], batch_sizes: List[int], max_wait_ms: float) -> Dict:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for producers in producer_counts:
+            for max_batch_size in batch_sizes:
+                result = measure(n_events, producers, max_batch_size, max_wait_ms, directory)
+                results.append(result)
+                print(f"   producers={producers:<3} batch<={max_batch_size:<6} {result['events_per_s']:>11,.0f} events/s  "
+                      f"record p50 {result['record_p50_us']:>6} µs  p99 {result['record_p99_us']:>7} µs  "
+                      f"avg batch {result['avg_batch_size']}")
+    return {'commit': git_commit(), 'cpu_count': os.cpu_count(), 'max_wait_ms': max_wait_ms, 'results': results}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event store write throughput")
+    parser.add_argument("--events", type=int, default=200000, help="events per measurement")
+    parser.add_argument("--producers", default="1,4", help="comma-separated producer thread counts")
+    parser.add_argument("--batch-sizes", default="1,256,2048", help="comma-separated max_batch_size values")
+    parser.add_argument("--max-wait-ms", type=float, default=50.0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    print(f"⏱️  {os.cpu_count()} CPUs, {args.events:,} events per run")
+    report = run(args.events, [int(p) for p in args.producers.split(',')],
+                 [int(b) for b in args.batch_sizes.split(',')], args.max_wait_ms)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Saved results to {args.output}")
@@ -0,0 +1,184 @@
+"""
+Synthetic-scale benchmark suite for the recommendation path
+Measures latency percentiles, throughput and peak memory per catalog size
+and writes machine-readable results that can be compared across commits.
+
+Run:
+    python benchmarks/bench_recommend.py --sizes 1000,10000,100000
+    python benchmarks/bench_recommend.py --sizes 1000000 --ops recommend_indexed,browse_search
+    python benchmarks/bench_recommend.py --compare benchmarks/results/OLD.json benchmarks/results/NEW.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from itertools import cycle
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from benchmarks.synthetic import CatalogDistributions, synthesize_catalog, synthesize_profiles
+from data.real_internships import filter_internships, get_statistics
+from models.catalog_index import CatalogIndex
+from models.recommender import InternshipRecommender
+
+RESULTS_DIR = ROOT / 'benchmarks' / 'results'
+SEARCH_TERMS = ['python', 'google', 'data', 'engineer', 'react', 'sql', 'product', 'ml']
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+def measure(
+    op: Callable[[int], object],
+    min_iters: int = 5,
+    max_iters: int = 200,
+    budget_s: float = 5.0
+) -> Dict:
+    """
+    Time op(i) repeatedly until max_iters or the time budget is spent
+
+    Peak memory comes from one extra, separately traced call so tracing
+    overhead does not leak into the latencies.
+    """
+    op(0)  # warm-up
+    latencies = []
+    started = time.perf_counter()
+    for i in range(max_iters):
+        t0 = time.perf_counter()
+        op(i)
+        latencies.append(time.perf_counter() - t0)
+        if len(latencies) >= min_iters and time.perf_counter() - started > budget_s:
+            break
+    total = sum(latencies)
+
+    tracemalloc.start()
+    op(len(latencies))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'iterations': len(latencies),
+        'mean_ms': round(total / len(latencies) * 1000, 3),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'stdev_ms': round(statistics.pstdev(latencies) * 1000, 3),
+        'throughput_per_s': round(len(latencies) / total, 2) if total else None,
+        'peak_mem_bytes': peak,
+    }
+
+def build_ops(catalog: List[Dict], profiles: List[Dict], recommender: InternshipRecommender) -> Dict[str, Callable]:
+    """Benchmarked operations for one catalog; each takes an iteration number"""
+    catalog_json = json.dumps(catalog)
+    index = CatalogIndex(catalog)
+    locations = sorted({i['location'] for i in catalog})
+
+    def browse_args(i):
+        return SEARCH_TERMS[i % len(SEARCH_TERMS)], locations[:1 + i % 3] if i % 2 else None, (i % 4) * 10000
+
+    return {
+        'catalog_load': lambda i: json.loads(catalog_json),
+        'index_build': lambda i: CatalogIndex(catalog),
+        'recommend': lambda i: recommender.recommend(profiles[i % len(profiles)], catalog, top_k=10),
+        'recommend_indexed': lambda i: recommender.recommend_indexed(profiles[i % len(profiles)], index, top_k=10),
+        'get_statistics': lambda i: get_statistics(catalog),
+        'browse_filter': lambda i: filter_internships(catalog, *browse_args(i)),
+        'browse_search': lambda i: index.search(*browse_args(i)),
+    }
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def run_suite(sizes: List[int], ops: List[str], budget_s: float, profiles_n: int = 200, seed: int = 0) -> Dict:
+    """Benchmark every op at every catalog size"""
+    recommender = InternshipRecommender()
+    dist = CatalogDistributions()
+    profiles = synthesize_profiles(profiles_n, seed=seed + 1, dist=dist)
+
+    results = []
+    for size in sizes:
+        catalog = synthesize_catalog(size, seed=seed, dist=dist)
+        available = build_ops(catalog, profiles, recommender)
+        for name in ops:
+            stats = measure(available[name], budget_s=budget_s)
+            results.append({'op': name, 'size': size, **stats})
+            print(f"   {name:<18} n={size:<9,} p50 {stats['p50_ms']:>10} ms  p99 {stats['p99_ms']:>10} ms  "
+                  f"{stats['throughput_per_s']:>9}/s  peak {stats['peak_mem_bytes'] / 2**20:8.1f} MiB")
+
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'budget_s': budget_s,
+        'seed': seed,
+        'results': results,
+    }
+
+def compare(base_path: str, new_path: str, metric: str = 'p50_ms'):
+    """Print metric ratios (new / base) for every (op, size) in both files"""
+    with open(base_path, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(new_path, encoding='utf-8') as f:
+        new = json.load(f)
+    base_index = {(r['op'], r['size']): r for r in base['results']}
+
+    print(f"🔍 {metric}: {base['commit']} → {new['commit']}")
+    for r in new['results']:
+        old = base_index.get((r['op'], r['size']))
+        if old is None or not old[metric]:
+            continue
+        ratio = r[metric] / old[metric]
+        flag = '🔺' if ratio > 1.1 else '🟢' if ratio < 0.9 else '  '
+        print(f"   {flag} {r['op']:<18} n={r['size']:<9,} {old[metric]:>10} → {r[metric]:>10}  ({ratio:.2f}x)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Synthetic-scale recommendation benchmarks")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated catalog sizes")
+    parser.add_argument("--ops", default="catalog_load,index_build,recommend,recommend_indexed,"
+                                         "get_statistics,browse_filter,browse_search")
+    parser.add_argument("--budget", type=float, default=5.0, help="seconds per op and size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help=f"results file (default: {RESULTS_DIR.relative_to(ROOT)}/<commit>-<time>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two results files")
+    parser.add_argument("--metric", default="p50_ms", help="metric used by --compare")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare, metric=args.metric)
+        sys.exit(0)
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    ops = args.ops.split(',')
+    print(f"⏱️  Benchmarking {', '.join(ops)} at sizes {sizes}")
+    report = run_suite(sizes, ops, args.budget, seed=args.seed)
+
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output = RESULTS_DIR / f"{report['commit']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Saved results to {output}")
@@ -0,0 +1,109 @@
+"""
+Recall vs. latency of the approximate candidate retrieval stage
+Compares CandidateRetriever.recommend() against exact recommend_indexed()
+over a grid of n_probe / n_candidates settings.
+
+Run:
+    python benchmarks/bench_retrieval.py --sizes 10000,100000
+    python benchmarks/bench_retrieval.py --sizes 1000000 --probes 4,16 --candidates 2000,5000
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from benchmarks.bench_recommend import git_commit, percentile
+from benchmarks.synthetic import CatalogDistributions, synthesize_catalog, synthesize_profiles
+from models.catalog_index import CatalogIndex
+from models.recommender import InternshipRecommender
+from models.retrieval import CandidateRetriever
+
+def _timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - t0
+
+def _latency_stats(latencies: List[float]) -> Dict:
+    latencies = sorted(latencies)
+    return {
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 3),
+    }
+
+def run(
+    sizes: List[int],
+    probes: List[int],
+    candidates: List[int],
+    top_k: int = 10,
+    queries: int = 50,
+    seed: int = 0
+) -> Dict:
+    """Recall@top_k and latency per (size, n_probe, n_candidates)"""
+    recommender = InternshipRecommender()
+    dist = CatalogDistributions()
+    profiles = synthesize_profiles(queries, seed=seed + 1, dist=dist)
+    results = []
+
+    for size in sizes:
+        catalog = synthesize_catalog(size, seed=seed, dist=dist)
+        index = CatalogIndex(catalog)
+        retriever, build_s = _timed(lambda: CandidateRetriever(index, recommender, seed=seed))
+        print(f"🔧 n={size:,}: retriever built in {build_s:.2f}s ({len(retriever.centroids)} lists)")
+
+        exact, exact_latencies = [], []
+        for profile in profiles:
+            result, elapsed = _timed(lambda: recommender.recommend_indexed(profile, index, top_k, compact=True))
+            exact.append(set(result.ids))
+            exact_latencies.append(elapsed)
+        exact_stats = _latency_stats(exact_latencies)
+        results.append({'size': size, 'mode': 'exact', 'recall': 1.0, **exact_stats})
+        print(f"   exact                        recall 1.000  p50 {exact_stats['p50_ms']:>9} ms")
+
+        for n_probe in probes:
+            for n_candidates in candidates:
+                hits, total, latencies = 0, 0, []
+                for profile, expected in zip(profiles, exact):
+                    result, elapsed = _timed(lambda: retriever.recommend(
+                        profile, top_k, n_candidates=n_candidates, n_probe=n_probe, compact=True
+                    ))
+                    latencies.append(elapsed)
+                    hits += len(expected & set(result.ids))
+                    total += len(expected)
+                recall = hits / total if total else 1.0
+                stats = _latency_stats(latencies)
+                results.append({'size': size, 'mode': 'ann', 'n_probe': n_probe,
+                                'n_candidates': n_candidates, 'recall': round(recall, 4), **stats})
+                print(f"   probe={n_probe:<3} candidates={n_candidates:<6} recall {recall:.3f}  "
+                      f"p50 {stats['p50_ms']:>9} ms")
+
+    return {'commit': git_commit(), 'top_k': top_k, 'queries': queries, 'seed': seed, 'results': results}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Candidate retrieval recall vs. latency")
+    parser.add_argument("--sizes", default="10000,100000", help="comma-separated catalog sizes")
+    parser.add_argument("--probes", default="2,8,32", help="comma-separated n_probe values")
+    parser.add_argument("--candidates", default="1000,2000,5000", help="comma-separated n_candidates values")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    report = run(
+        [int(s) for s in args.sizes.split(',')],
+        [int(p) for p in args.probes.split(',')],
+        [int(c) for c in args.candidates.split(',')],
+        args.top_k, args.queries, args.seed
+    )
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Saved results to {args.output}")
@@ -0,0 +1,80 @@
+"""
+Scaling of sharded parallel recommend
+Compares ShardedRecommender at several shard counts with single-process
+recommend_indexed() on the same synthetic catalog.
+
+Run:
+    python benchmarks/bench_sharding.py --sizes 100000,1000000 --shards 1,2,4,8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from benchmarks.bench_recommend import git_commit, measure
+from benchmarks.synthetic import CatalogDistributions, synthesize_catalog, synthesize_profiles
+from models.catalog_index import CatalogIndex
+from models.recommender import InternshipRecommender
+from models.sharding import ShardedRecommender
+
+def run(sizes: List[int], shard_counts: List[int], budget_s: float, batch: int = 32, seed: int = 0) -> Dict:
+    """Single-query latency and batched throughput per (size, shard count)"""
+    recommender = InternshipRecommender()
+    recommender.factor_cache_size = 0
+    dist = CatalogDistributions()
+    profiles = synthesize_profiles(200, seed=seed + 1, dist=dist)
+    batches = [profiles[n:n + batch] for n in range(0, len(profiles), batch)]
+    results = []
+
+    for size in sizes:
+        catalog = synthesize_catalog(size, seed=seed, dist=dist)
+        index = CatalogIndex(catalog)
+        baseline = measure(lambda i: recommender.recommend_indexed(profiles[i % len(profiles)], index, 10, compact=True),
+                           budget_s=budget_s)
+        results.append({'size': size, 'shards': 0, **baseline})
+        print(f"   n={size:<9,} in-process   p50 {baseline['p50_ms']:>9} ms")
+
+        for shards in shard_counts:
+            started = time.perf_counter()
+            with ShardedRecommender(catalog, n_shards=shards, recommender=recommender) as pool:
+                startup_s = time.perf_counter() - started
+                single = measure(lambda i: pool.recommend(profiles[i % len(profiles)], 10, compact=True),
+                                 budget_s=budget_s)
+                batched = measure(lambda i: pool.recommend_batch(batches[i % len(batches)], 10, compact=True),
+                                  budget_s=budget_s)
+            speedup = baseline['p50_ms'] / single['p50_ms'] if single['p50_ms'] else None
+            results.append({
+                'size': size, 'shards': shards, 'startup_s': round(startup_s, 3), **single,
+                'batch_size': batch,
+                'batch_profiles_per_s': round(batch * batched['throughput_per_s'], 2),
+                'speedup': round(speedup, 2) if speedup else None,
+            })
+            print(f"   n={size:<9,} shards={shards:<4} p50 {single['p50_ms']:>9} ms  ({speedup:.2f}x)  "
+                  f"batched {batch * batched['throughput_per_s']:>9.1f} profiles/s  start {startup_s:.1f}s")
+
+    return {'commit': git_commit(), 'cpu_count': os.cpu_count(), 'seed': seed, 'results': results}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sharded recommend scaling")
+    parser.add_argument("--sizes", default="100000", help="comma-separated catalog sizes")
+    parser.add_argument("--shards", default="1,2,4", help="comma-separated shard counts")
+    parser.add_argument("--budget", type=float, default=3.0, help="seconds per measurement")
+    parser.add_argument("--batch", type=int, default=32, help="profiles per batched request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    print(f"⏱️  {os.cpu_count()} CPUs")
+    report = run([int(s) for s in args.sizes.split(',')], [int(s) for s in args.shards.split(',')],
+                 args.budget, args.batch, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Saved results to {args.output}")
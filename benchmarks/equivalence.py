@@ -0,0 +1,280 @@
+"""
+Golden-ranking equivalence harness
+Runs randomized profiles and catalogs through the reference recommend() and
+an alternate engine, and reports any divergence with a minimal reproducer.
+
+Run:
+    python benchmarks/equivalence.py --engine indexed --cases 2000
+    python benchmarks/equivalence.py --engine all --cases 500 --output divergences.json
+    python benchmarks/equivalence.py --engine all --collaborative
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic import CatalogDistributions, synthesize_catalog, synthesize_events, synthesize_profiles
+from models.catalog_index import CatalogIndex
+from models.collaborative import CollaborativeModel
+from models.recommender import InternshipRecommender
+from models.sharding import ShardedRecommender
+
+# engine(profile, catalog, top_k) -> recommendations, built from a recommender
+Engine = Callable[[Dict, List[Dict], int], List[Dict]]
+
+def _cached_index(build: Callable[[List[Dict]], object]) -> Callable[[List[Dict]], object]:
+    """Reuse the derived structure while the same catalog list is passed in"""
+    cache = {}
+
+    def get(catalog):
+        if cache.get('catalog') is not catalog:
+            cache['catalog'], cache['index'] = catalog, build(catalog)
+        return cache['index']
+    return get
+
+def indexed_engine(recommender: InternshipRecommender) -> Engine:
+    index_for = _cached_index(CatalogIndex)
+    return lambda profile, catalog, top_k: recommender.recommend_indexed(profile, index_for(catalog), top_k)
+
+def batch_engine(recommender: InternshipRecommender) -> Engine:
+    index_for = _cached_index(CatalogIndex)
+    return lambda profile, catalog, top_k: recommender.recommend_batch([profile], index_for(catalog), top_k)[0]
+
+def compact_engine(recommender: InternshipRecommender) -> Engine:
+    index_for = _cached_index(CatalogIndex)
+
+    def run(profile, catalog, top_k):
+        index = index_for(catalog)
+        return recommender.hydrate(recommender.recommend_indexed(profile, index, top_k, compact=True), profile, index)
+    return run
+
+def streaming_engine(recommender: InternshipRecommender) -> Engine:
+    index_for = _cached_index(CatalogIndex)
+
+    def run(profile, catalog, top_k):
+        # Tiny chunks so snapshots are merged many times per catalog
+        snapshots = recommender.iter_recommendations(profile, index_for(catalog), top_k, first_chunk=3, chunk_size=17)
+        return list(snapshots)[-1][1]
+    return run
+
+def sharded_engine(recommender: InternshipRecommender) -> Engine:
+    def build(catalog):
+        # One pool per catalog; stop the previous catalog's processes first
+        if pools:
+            pools.pop().close()
+        pools.append(ShardedRecommender(catalog, n_shards=3, recommender=recommender))
+        return pools[-1]
+
+    pools = []
+    pool_for = _cached_index(build)
+    return lambda profile, catalog, top_k: pool_for(catalog).recommend(profile, top_k)
+
+# name -> factory(recommender) -> Engine; faster scoring paths register here
+ENGINES: Dict[str, Callable[[InternshipRecommender], Engine]] = {
+    'indexed': indexed_engine,
+    'batch': batch_engine,
+    'compact': compact_engine,
+    'streaming': streaming_engine,
+    'sharded': sharded_engine,
+}
+
+def compare_results(expected: List[Dict], actual: List[Dict], tolerance: float = 1e-9) -> Optional[Dict]:
+    """First divergence between two recommendation lists, or None"""
+    expected_ids = [r['id'] for r in expected]
+    actual_ids = [r['id'] for r in actual]
+    if expected_ids != actual_ids:
+        position = next(
+            (n for n, (a, b) in enumerate(zip(expected_ids, actual_ids)) if a != b),
+            min(len(expected_ids), len(actual_ids))
+        )
+        return {
+            'kind': 'ranking',
+            'position': position,
+            'expected': expected_ids,
+            'actual': actual_ids,
+            'expected_scores': [r['match_score'] for r in expected],
+            'actual_scores': [r['match_score'] for r in actual],
+        }
+
+    for position, (exp, act) in enumerate(zip(expected, actual)):
+        for field in ('match_score', 'match_percentage', 'success_probability'):
+            if abs(exp[field] - act[field]) > tolerance:
+                return {'kind': field, 'position': position, 'id': exp['id'],
+                        'expected': exp[field], 'actual': act[field]}
+        for factor, value in exp['breakdown'].items():
+            if factor not in act['breakdown'] or abs(value - act['breakdown'][factor]) > tolerance:
+                return {'kind': 'breakdown', 'position': position, 'id': exp['id'], 'factor': factor,
+                        'expected': value, 'actual': act['breakdown'].get(factor)}
+        # Gap order comes from set iteration and carries no meaning
+        if sorted(exp['skill_gaps']) != sorted(act['skill_gaps']):
+            return {'kind': 'skill_gaps', 'position': position, 'id': exp['id'],
+                    'expected': sorted(exp['skill_gaps']), 'actual': sorted(act['skill_gaps'])}
+        if list(exp['match_reasons']) != list(act['match_reasons']):
+            return {'kind': 'match_reasons', 'position': position, 'id': exp['id'],
+                    'expected': list(exp['match_reasons']), 'actual': list(act['match_reasons'])}
+        extra = {k for k in exp if k not in act}
+        if extra:
+            return {'kind': 'missing_fields', 'position': position, 'id': exp['id'], 'fields': sorted(extra)}
+
+    return None
+
+def _outcome(engine: Engine, profile: Dict, catalog: List[Dict], top_k: int):
+    """Engine result, or the exception it raised"""
+    try:
+        return engine(profile, catalog, top_k)
+    except Exception as e:
+        return e
+
+def perturb_profile(rng: random.Random, profile: Dict) -> Dict:
+    """Edge cases the UI can produce: stray case/whitespace, duplicates, empty fields"""
+    profile = dict(profile)
+    roll = rng.random()
+    if roll < 0.15:
+        profile['skills'] = [f"  {s.upper()} " if rng.random() < 0.5 else s for s in profile['skills']]
+    elif roll < 0.25:
+        profile['skills'] = profile['skills'] + profile['skills'][:2] + ['Unknown Skill']
+    elif roll < 0.35:
+        field = rng.choice(['skills', 'interests', 'preferred_locations', 'career_goals', 'education'])
+        profile[field] = '' if field in ('career_goals', 'education') else []
+    elif roll < 0.40:
+        profile = {'name': profile['name']}
+    if rng.random() < 0.1:
+        profile['preferred_locations'] = ['bengaluru'] + list(profile.get('preferred_locations', []))
+    return profile
+
+def minimize(
+    check: Callable[[Dict, List[Dict], int], bool],
+    profile: Dict,
+    catalog: List[Dict],
+    top_k: int
+) -> Dict:
+    """
+    Shrink a failing case while check() keeps reporting a divergence
+
+    Greedily drops postings (halves first, then one at a time) and then
+    list entries / fields of the profile.
+    """
+    # Postings
+    chunk = max(len(catalog) // 2, 1)
+    while chunk >= 1:
+        start = 0
+        while start < len(catalog):
+            candidate = catalog[:start] + catalog[start + chunk:]
+            if candidate and check(profile, candidate, top_k):
+                catalog = candidate
+            else:
+                start += chunk
+        chunk //= 2
+
+    # Profile fields and list items
+    for key in list(profile):
+        value = profile[key]
+        if isinstance(value, list):
+            for item in list(value):
+                candidate = {**profile, key: [v for v in profile[key] if v != item]}
+                if check(candidate, catalog, top_k):
+                    profile = candidate
+        trimmed = {k: v for k, v in profile.items() if k != key}
+        if check(trimmed, catalog, top_k):
+            profile = trimmed
+
+    # Smallest top_k that still diverges
+    for k in range(1, top_k):
+        if check(profile, catalog, k):
+            top_k = k
+            break
+
+    return {'profile': profile, 'catalog': catalog, 'top_k': top_k}
+
+def run_harness(
+    engine_name: str,
+    cases: int = 1000,
+    seed: int = 0,
+    max_catalog: int = 400,
+    tolerance: float = 1e-9,
+    shrink: bool = True,
+    max_reports: int = 5,
+    collaborative: bool = False
+) -> Dict:
+    """Compare one engine against recommend() over randomized cases"""
+    recommender = InternshipRecommender()
+    if collaborative:
+        # Profiles get student ids S0001-S0300; ids above 200 have no events (cold start)
+        recommender.enable_collaborative(CollaborativeModel().fit(synthesize_events(20000, n_postings=max_catalog, seed=seed)))
+    engine = ENGINES[engine_name](recommender)
+    dist = CatalogDistributions()
+    rng = random.Random(seed)
+
+    def check(profile, catalog, top_k):
+        expected = _outcome(recommender.recommend, profile, catalog, top_k)
+        actual = _outcome(engine, profile, catalog, top_k)
+        if isinstance(expected, Exception) or isinstance(actual, Exception):
+            if type(expected) is type(actual):
+                return None
+            return {'kind': 'exception', 'position': 0, 'expected': repr(expected), 'actual': repr(actual)}
+        return compare_results(expected, actual, tolerance)
+
+    def diverges(profile, catalog, top_k):
+        return check(profile, catalog, top_k) is not None
+
+    divergences = []
+    failed = 0
+    catalog = None
+    for case in range(cases):
+        # A new catalog every 25 cases keeps per-catalog indexes exercised
+        if case % 25 == 0:
+            catalog = synthesize_catalog(rng.randint(1, max_catalog), seed=rng.randrange(2**31), dist=dist)
+        profile = perturb_profile(rng, synthesize_profiles(1, seed=rng.randrange(2**31), dist=dist)[0])
+        if collaborative:
+            profile['student_id'] = f"S{rng.randint(1, 300):04d}"
+        top_k = rng.choice([1, 3, 5, 10, 10, 25, 50])
+
+        divergence = check(profile, catalog, top_k)
+        if divergence is None:
+            continue
+        failed += 1
+        if len(divergences) < max_reports:
+            report = {'case': case, **divergence}
+            if shrink:
+                report['reproducer'] = minimize(diverges, profile, list(catalog), top_k)
+            divergences.append(report)
+
+    return {'engine': engine_name, 'cases': cases, 'seed': seed, 'collaborative': collaborative,
+            'failed': failed, 'divergences': divergences}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Golden-ranking equivalence against recommend()")
+    parser.add_argument("--engine", default="all", help=f"one of {', '.join(ENGINES)} or 'all'")
+    parser.add_argument("--cases", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-catalog", type=int, default=400, help="largest random catalog")
+    parser.add_argument("--tolerance", type=float, default=1e-9, help="absolute score tolerance")
+    parser.add_argument("--no-shrink", action="store_true", help="skip reproducer minimization")
+    parser.add_argument("--collaborative", action="store_true", help="score with the collaborative factor enabled")
+    parser.add_argument("--output", help="write divergence reports as JSON to this file")
+    args = parser.parse_args()
+
+    names = list(ENGINES) if args.engine == 'all' else [args.engine]
+    reports = []
+    for name in names:
+        report = run_harness(name, args.cases, args.seed, args.max_catalog, args.tolerance, not args.no_shrink,
+                             collaborative=args.collaborative)
+        reports.append(report)
+        status = '✅' if not report['failed'] else '❌'
+        print(f"{status} {name:<10} {report['cases'] - report['failed']}/{report['cases']} cases identical")
+        for d in report['divergences']:
+            repro = d.get('reproducer')
+            size = f" (reproducer: {len(repro['catalog'])} postings, top_k={repro['top_k']})" if repro else ''
+            print(f"   case {d['case']}: {d['kind']} at position {d['position']}{size}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2, ensure_ascii=False)
+        print(f"✅ Saved reports to {args.output}")
+
+    sys.exit(1 if any(r['failed'] for r in reports) else 0)
@@ -0,0 +1,195 @@
+"""
+Load generator for the headless recommendation service
+Reports throughput and tail latency per endpoint mix
+"""
+
+import argparse
+import http.client
+import json
+import math
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlparse
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from data.real_internships import get_all_internships
+
+INTERESTS = ["Artificial Intelligence", "Web Development", "Mobile Apps", "Data Science",
+             "Cloud Computing", "Cybersecurity", "DevOps", "Product Management"]
+
+GOALS = [
+    "I want to become a Machine Learning Engineer working on AI products",
+    "Build scalable backend systems and distributed services",
+    "Work as a data analyst turning data into business insights",
+    "",
+]
+
+def random_profile(rng: random.Random, skills: List[str], locations: List[str]) -> Dict:
+    """A plausible student profile drawn from the catalog vocabulary"""
+    return {
+        'name': f"Student {rng.randint(1, 10**6)}",
+        'education': rng.choice(["B.Tech in Computer Science", "M.Tech", "B.E", "BCA"]),
+        'gpa': round(rng.uniform(6.0, 9.8), 1),
+        'experience_months': rng.choice([0, 0, 0, 3, 6, 12]),
+        'preferred_locations': rng.sample(locations, rng.randint(1, 2)),
+        'skills': rng.sample(skills, rng.randint(2, 8)),
+        'interests': rng.sample(INTERESTS, rng.randint(1, 3)),
+        'career_goals': rng.choice(GOALS),
+    }
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+class LoadGenerator:
+    """Closed-loop load: each client thread sends its next request when the last returns"""
+
+    def __init__(self, url: str, concurrency: int, duration_s: float, mix: Dict[str, float],
+                 top_k: int = 10, batch_size: int = 8, seed: int = 42):
+        parsed = urlparse(url)
+        self.host, self.port = parsed.hostname, parsed.port or 80
+        self.concurrency = concurrency
+        self.duration_s = duration_s
+        self.mix = mix
+        self.top_k = top_k
+        self.batch_size = batch_size
+        self.seed = seed
+
+        catalog = get_all_internships()
+        self.skills = sorted({s for i in catalog for s in i['required_skills'] + i['preferred_skills']})
+        self.locations = sorted({i['location'] for i in catalog})
+
+        self.latencies = {name: [] for name in mix}
+        self.errors = {name: 0 for name in mix}
+        self._lock = threading.Lock()
+
+    def _request(self, rng: random.Random, endpoint: str):
+        """Build (method, path, body) for one request of the given kind"""
+        if endpoint == 'recommend':
+            body = {'profile': random_profile(rng, self.skills, self.locations), 'top_k': self.top_k}
+            return 'POST', '/recommend', body
+        if endpoint == 'batch':
+            profiles = [random_profile(rng, self.skills, self.locations) for _ in range(self.batch_size)]
+            return 'POST', '/recommend/batch', {'profiles': profiles, 'top_k': self.top_k}
+        if endpoint == 'strength':
+            return 'POST', '/profile-strength', {'profile': random_profile(rng, self.skills, self.locations)}
+        skill = rng.choice(self.skills).replace(' ', '+')
+        return 'GET', f'/internships/search?q={skill}&limit=20', None
+
+    def _client(self, worker: int, deadline: float):
+        rng = random.Random(self.seed + worker)
+        names, weights = zip(*self.mix.items())
+        while time.perf_counter() < deadline:
+            endpoint = rng.choices(names, weights)[0]
+            method, path, body = self._request(rng, endpoint)
+            payload = json.dumps(body).encode('utf-8') if body is not None else None
+            headers = {'Content-Type': 'application/json'} if payload else {}
+
+            start = time.perf_counter()
+            ok = False
+            try:
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=30)
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                ok = response.status == 200
+                conn.close()
+            except OSError:
+                pass
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                if ok:
+                    self.latencies[endpoint].append(elapsed)
+                else:
+                    self.errors[endpoint] += 1
+
+    def run(self) -> Dict:
+        deadline = time.perf_counter() + self.duration_s
+        started = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._client, args=(n, deadline), daemon=True)
+            for n in range(self.concurrency)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - started
+
+        report = {'concurrency': self.concurrency, 'duration_s': round(wall, 3), 'endpoints': {}}
+        all_latencies = []
+        for name, values in self.latencies.items():
+            values.sort()
+            all_latencies.extend(values)
+            report['endpoints'][name] = _summary(values, wall, self.errors[name])
+        all_latencies.sort()
+        report['total'] = _summary(all_latencies, wall, sum(self.errors.values()))
+        return report
+
+def _summary(sorted_latencies: List[float], wall_s: float, errors: int) -> Dict:
+    return {
+        'requests': len(sorted_latencies),
+        'errors': errors,
+        'throughput_rps': round(len(sorted_latencies) / wall_s, 1) if wall_s else 0.0,
+        'p50_ms': round(percentile(sorted_latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(sorted_latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(sorted_latencies, 99) * 1000, 2),
+        'max_ms': round(sorted_latencies[-1] * 1000, 2) if sorted_latencies else 0.0,
+    }
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """'recommend=6,batch=1,strength=2,search=1' -> weights"""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name not in ('recommend', 'batch', 'strength', 'search'):
+            raise argparse.ArgumentTypeError(f"Unknown endpoint '{name}'")
+        mix[name] = float(weight or 1)
+    return mix
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load generator for recommendation_service.py")
+    parser.add_argument("--url", help="service base URL (default: start one in-process)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("recommend=6,batch=1,strength=2,search=1"))
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=8, help="worker threads for the in-process server")
+    parser.add_argument("--batch-wait-ms", type=float, default=0.0, help="batching window for the in-process server")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        from recommendation_service import create_server
+        server = create_server(port=0, workers=args.workers, batch_wait_ms=args.batch_wait_ms)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    report = LoadGenerator(url, args.concurrency, args.duration, args.mix,
+                           top_k=args.top_k, batch_size=args.batch_size).run()
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    print(f"📈 {url} — {args.concurrency} clients for {report['duration_s']}s")
+    for name, r in {**report['endpoints'], 'TOTAL': report['total']}.items():
+        print(f"   {name:<10} {r['requests']:>7} req  {r['throughput_rps']:>8} req/s  "
+              f"p50 {r['p50_ms']:>7} ms  p95 {r['p95_ms']:>7} ms  p99 {r['p99_ms']:>7} ms  errors {r['errors']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Saved report to {args.output}")
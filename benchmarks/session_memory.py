@@ -0,0 +1,65 @@
+"""
+Per-session memory of stored recommendations
+Compares full recommendation dicts against compact id/score records
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Dict
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.load_generator import random_profile
+from data.real_internships import get_all_internships
+from models.catalog_index import CatalogIndex
+from models.compact_results import deep_sizeof
+from models.recommender import InternshipRecommender
+
+def measure(sessions: int = 1000, top_k: int = 10, seed: int = 7) -> Dict:
+    """Bytes held per session for both representations"""
+    catalog = get_all_internships()
+    index = CatalogIndex(catalog)
+    recommender = InternshipRecommender()
+    skills = sorted({s for i in catalog for s in i['required_skills'] + i['preferred_skills']})
+    locations = sorted({i['location'] for i in catalog})
+    rng = random.Random(seed)
+
+    full_total = compact_total = hydrated_equal = 0
+    for _ in range(sessions):
+        profile = random_profile(rng, skills, locations)
+        compact = recommender.recommend_indexed(profile, index, top_k, compact=True)
+        full = recommender.hydrate(compact, profile, index)
+        # Each session's state is measured on its own: the app's cached catalog
+        # is a per-call copy, so full dicts do not share posting fields
+        full_total += deep_sizeof(full)
+        compact_total += deep_sizeof(compact)
+        hydrated_equal += full == recommender.recommend_indexed(profile, index, top_k)
+
+    return {
+        'sessions': sessions,
+        'top_k': top_k,
+        'full_bytes_per_session': round(full_total / sessions),
+        'compact_bytes_per_session': round(compact_total / sessions),
+        'reduction': round(full_total / max(compact_total, 1), 1),
+        'hydration_matches': hydrated_equal == sessions,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-session recommendation memory")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    result = measure(args.sessions, args.top_k)
+    print(f"🧠 Full dicts:    {result['full_bytes_per_session']:>8,} bytes/session")
+    print(f"   Compact:       {result['compact_bytes_per_session']:>8,} bytes/session ({result['reduction']}x smaller)")
+    print(f"   Hydration identical to full results: {result['hydration_matches']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"✅ Saved results to {args.output}")
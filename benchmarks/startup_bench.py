@@ -0,0 +1,102 @@
+"""
+Cold-start benchmark for the Streamlit app
+Measures time to first render and the import cost of each page
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PAGES = ["🏠 Home", "👤 Create Profile", "🎯 Recommendations", "📊 Analytics", "💼 Browse Internships"]
+
+# Executed in a fresh interpreter for every sample so nothing is warm
+_CHILD = r"""
+import json, sys, time
+t_start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t_streamlit = time.perf_counter()
+
+at = AppTest.from_file("app.py", default_timeout=60)
+at.run()
+t_first = time.perf_counter()
+modules_first = set(sys.modules)
+
+page = sys.argv[1]
+page_s = 0.0
+if page != at.sidebar.radio[0].value:
+    t0 = time.perf_counter()
+    at.sidebar.radio[0].set_value(page).run()
+    page_s = time.perf_counter() - t0
+new_modules = sorted(m for m in set(sys.modules) - modules_first if '.' not in m)
+
+print(json.dumps({
+    'streamlit_import_s': t_streamlit - t_start,
+    'first_render_s': t_first - t_streamlit,
+    'page_render_s': page_s,
+    'page_new_modules': new_modules,
+    'errors': len(at.exception),
+}))
+"""
+
+def run_sample(page: str) -> Dict:
+    """Run one cold process and return its timings"""
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, page],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    # The recommender prints on init, so the JSON line is the last one
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def summarize(samples: List[float]) -> Dict:
+    """Median / min / max of a list of timings (milliseconds)"""
+    return {
+        'median_ms': round(statistics.median(samples) * 1000, 2),
+        'min_ms': round(min(samples) * 1000, 2),
+        'max_ms': round(max(samples) * 1000, 2),
+    }
+
+def run_benchmark(repeats: int = 5) -> Dict:
+    """Benchmark first render plus the cold cost of every page"""
+    results = {'repeats': repeats, 'python': sys.version.split()[0], 'pages': {}}
+    first_render = []
+    
+    for page in PAGES:
+        samples = [run_sample(page) for _ in range(repeats)]
+        first_render.extend(s['first_render_s'] for s in samples)
+        results['pages'][page] = {
+            **summarize([s['page_render_s'] or s['first_render_s'] for s in samples]),
+            'new_modules': samples[-1]['page_new_modules'],
+            'errors': max(s['errors'] for s in samples),
+        }
+    
+    results['time_to_first_render'] = summarize(first_render)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for app.py")
+    parser.add_argument("--repeats", type=int, default=5, help="fresh processes per page")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+    
+    results = run_benchmark(args.repeats)
+    
+    print(f"⏱️  Time to first render: {results['time_to_first_render']['median_ms']} ms (median)")
+    for page, r in results['pages'].items():
+        print(f"   {page:<24} {r['median_ms']:>9} ms  new modules: {', '.join(r['new_modules']) or '-'}")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"✅ Saved results to {args.output}")
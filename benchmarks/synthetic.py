@@ -0,0 +1,149 @@
+"""
+Synthetic catalog and profile generators
+Scales REAL_INTERNSHIPS_2025 to any size while keeping its skill, location
+and stipend distributions
+"""
+
+import random
+import sys
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Dict, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from data.real_internships import REAL_INTERNSHIPS_2025
+
+INTERESTS = ["Artificial Intelligence", "Web Development", "Mobile Apps", "Data Science",
+             "Cloud Computing", "Cybersecurity", "Blockchain", "IoT", "AR/VR",
+             "Product Management", "UI/UX Design", "DevOps", "Game Development"]
+
+EDUCATION = ["B.Tech in Computer Science", "B.E in Electronics", "M.Tech in AI", "BCA", "MCA", "PhD in CS", ""]
+
+GOAL_TEMPLATES = [
+    "I want to become a {role} at a top tech company",
+    "Looking to grow as a {role} working on real products",
+    "My goal is to work as a {role} and build scalable systems",
+    "{role} focused on data, machine learning and impact",
+]
+
+class CatalogDistributions:
+    """Empirical distributions measured on the real catalog"""
+
+    def __init__(self, catalog: List[Dict] = None):
+        catalog = catalog or REAL_INTERNSHIPS_2025
+        self.templates = catalog
+        self.skills = Counter(s for i in catalog for s in i['required_skills'] + i['preferred_skills'])
+        self.required_skills = Counter(s for i in catalog for s in i['required_skills'])
+        self.preferred_skills = Counter(s for i in catalog for s in i['preferred_skills'])
+        self.locations = Counter(i['location'] for i in catalog)
+        self.stipends = [i['stipend'] for i in catalog]
+        self.experience = [i['experience_required'] for i in catalog]
+        self.roles = [i['title'].split(' - ')[0].replace(' Intern', '') for i in catalog]
+
+def _weighted(rng: random.Random, counter: Counter, k: int) -> List[str]:
+    """k distinct items drawn in proportion to their counts"""
+    items, weights = zip(*counter.items())
+    chosen = []
+    while len(chosen) < min(k, len(items)):
+        item = rng.choices(items, weights)[0]
+        if item not in chosen:
+            chosen.append(item)
+    return chosen
+
+def synthesize_catalog(
+    n: int,
+    seed: int = 0,
+    end_date: date = date(2025, 1, 31),
+    span_days: int = 365,
+    dist: CatalogDistributions = None
+) -> List[Dict]:
+    """
+    n postings shaped like the real catalog
+
+    Each posting starts from a random real template (keeping title,
+    description and department consistent with its skills), swaps some
+    skills for frequency-weighted ones, resamples location, and jitters the
+    stipend. posted_date is spread over `span_days` before `end_date`.
+    """
+    rng = random.Random(seed)
+    dist = dist or CatalogDistributions()
+    locations, location_weights = zip(*dist.locations.items())
+    catalog = []
+
+    for n_id in range(n):
+        template = rng.choice(dist.templates)
+
+        required = list(template['required_skills'])
+        for pos in range(len(required)):
+            if rng.random() < 0.3:
+                required[pos] = _weighted(rng, dist.required_skills, 1)[0]
+        preferred = list(template['preferred_skills'])
+        for pos in range(len(preferred)):
+            if rng.random() < 0.3:
+                preferred[pos] = _weighted(rng, dist.preferred_skills, 1)[0]
+
+        stipend = int(round(rng.choice(dist.stipends) * rng.lognormvariate(0, 0.15), -3))
+
+        catalog.append({
+            **template,
+            'id': f"SYN{n_id + 1:07d}",
+            'location': rng.choices(locations, location_weights)[0],
+            'stipend': stipend,
+            'required_skills': list(dict.fromkeys(required)),
+            'preferred_skills': list(dict.fromkeys(preferred)),
+            'experience_required': rng.choice(dist.experience),
+            'posted_date': (end_date - timedelta(days=rng.randrange(span_days))).isoformat(),
+        })
+
+    return catalog
+
+def synthesize_profiles(n: int, seed: int = 1, dist: CatalogDistributions = None) -> List[Dict]:
+    """n student profiles using the catalog's skill and location frequencies"""
+    rng = random.Random(seed)
+    dist = dist or CatalogDistributions()
+    profiles = []
+
+    for n_id in range(n):
+        profiles.append({
+            'name': f"Student {n_id + 1}",
+            'email': f"student{n_id + 1}@university.edu",
+            'education': rng.choice(EDUCATION),
+            'gpa': round(rng.uniform(5.5, 9.8), 1),
+            'experience_months': rng.choice([0, 0, 0, 2, 3, 6, 12]),
+            'preferred_locations': _weighted(rng, dist.locations, rng.randint(0, 3)),
+            'skills': _weighted(rng, dist.skills, rng.randint(1, 10)),
+            'interests': rng.sample(INTERESTS, rng.randint(0, 4)),
+            'career_goals': rng.choice(GOAL_TEMPLATES + [""]).format(role=rng.choice(dist.roles)),
+        })
+
+    return profiles
+
+def synthesize_events(
+    n: int,
+    n_students: int = 200,
+    n_postings: int = 1000,
+    seed: int = 2,
+    event_types: List[str] = ('impression', 'impression', 'impression', 'save', 'apply', 'share')
+) -> List[Tuple]:
+    """
+    n event store rows (id, ts, session_id, event_type, posting_id)
+
+    Students S0001... favour a few "taste" clusters of postings SYN0000001...
+    (the ids synthesize_catalog gives), so the log has collaborative structure.
+    """
+    rng = random.Random(seed)
+    clusters = [rng.sample(range(1, n_postings + 1), min(20, n_postings)) for _ in range(10)]
+    tastes = [rng.sample(range(len(clusters)), 2) for _ in range(n_students)]
+    events = []
+
+    for event_id in range(1, n + 1):
+        student = rng.randrange(n_students)
+        if rng.random() < 0.8:
+            posting = rng.choice(clusters[rng.choice(tastes[student])])
+        else:
+            posting = rng.randint(1, n_postings)
+        events.append((event_id, 1.7e9 + event_id, f"S{student + 1:04d}", rng.choice(event_types), f"SYN{posting:07d}"))
+
+    return events
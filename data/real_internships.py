@@ -3,9 +3,15 @@ Real Internship Data Collector
 Fetches actual internship data from multiple sources
 """
 
+import argparse
 import json
+import os
 import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict
 
 # Real company data with actual internship programs
@@ -381,6 +387,50 @@ def save_to_json(filename: str = "real_internships_2025.json"):
     print(f"✅ Saved {len(data)} real internships to {filename}")
     return data
 
+# Fields every posting needs (the app and the recommender read them directly)
+REQUIRED_FIELDS = {
+    'company': str,
+    'title': str,
+    'location': str,
+    'description': str,
+    'stipend': (int, float),
+    'required_skills': list,
+    'preferred_skills': list
+}
+
+def validate_internships(internships: List[Dict]) -> List[Dict]:
+    """
+    Check a raw catalog before anything is built from it
+    
+    Missing ids are assigned (INT001, ...); every problem found is reported
+    at once in a ValueError.
+    """
+    problems = []
+    validated = []
+    seen = set()
+    
+    for n, internship in enumerate(internships):
+        where = internship.get('id') or f"posting #{n + 1}"
+        for field, kind in REQUIRED_FIELDS.items():
+            value = internship.get(field)
+            if not isinstance(value, kind) or isinstance(value, bool):
+                problems.append(f"{where}: '{field}' is missing or has the wrong type")
+            elif kind is list and not all(isinstance(skill, str) for skill in value):
+                problems.append(f"{where}: '{field}' must be a list of strings")
+        
+        posting = dict(internship)
+        posting.setdefault('id', f"INT{n + 1:03d}")
+        if posting['id'] in seen:
+            problems.append(f"{where}: duplicate id")
+        seen.add(posting['id'])
+        validated.append(posting)
+    
+    if problems:
+        shown = '\n'.join(f"  - {p}" for p in problems[:20])
+        more = f"\n  ... and {len(problems) - 20} more" if len(problems) > 20 else ''
+        raise ValueError(f"{len(problems)} catalog problems:\n{shown}{more}")
+    return validated
+
 def get_internships_by_company(company_name: str) -> List[Dict]:
     """Filter internships by company"""
     all_internships = get_all_internships()
@@ -401,9 +451,36 @@ def get_internships_by_skill(skill: str) -> List[Dict]:
             results.append(i)
     return results
 
-def get_statistics():
-    """Get internship statistics"""
-    data = get_all_internships()
+def filter_internships(
+    internships: List[Dict],
+    search: str = '',
+    locations: List[str] = None,
+    min_stipend: float = 0
+) -> List[Dict]:
+    """Browse-page filtering: text search, location and minimum stipend"""
+    filtered = internships
+    
+    if search:
+        search_lower = search.lower()
+        filtered = [
+            i for i in filtered
+            if search_lower in i['company'].lower()
+            or search_lower in i['title'].lower()
+            or any(search_lower in skill.lower() for skill in i['required_skills'])
+        ]
+    
+    if locations:
+        filtered = [i for i in filtered if i['location'] in locations]
+    
+    if min_stipend > 0:
+        filtered = [i for i in filtered if i['stipend'] >= min_stipend]
+    
+    return filtered
+
+def get_statistics(data: List[Dict] = None):
+    """Get internship statistics (of the built-in catalog unless one is given)"""
+    if data is None:
+        data = get_all_internships()
     
     all_skills = []
     companies = set()
@@ -430,7 +507,117 @@ def get_statistics():
         'locations': sorted(list(locations))
     }
 
-if __name__ == "__main__":
+def _load_catalog(path: str) -> List[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path: str, data) -> str:
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+# Build stages run after validation; each reads the validated catalog file
+# and returns the paths it wrote
+def _stage_statistics(catalog_path: str, output: str) -> List[str]:
+    return [_write_json(os.path.join(output, 'statistics.json'), get_statistics(_load_catalog(catalog_path)))]
+
+def _stage_features(catalog_path: str, output: str, career_goal_method: str) -> List[str]:
+    # Skill bitmaps, token sets and search fields; with bm25 also the BM25 search index
+    from models.feature_cache import cache_key, cache_path, load_or_build
+    from models.recommender import InternshipRecommender
+    internships = _load_catalog(catalog_path)
+    recommender = InternshipRecommender(career_goal_method)
+    directory = os.path.join(output, 'features')
+    load_or_build(internships, recommender, directory)
+    return [cache_path(cache_key(internships, recommender), directory)]
+
+def _stage_shared_index(catalog_path: str, output: str) -> List[str]:
+    from models.shared_index import publish_catalog, _segment_path
+    directory = os.path.join(output, 'shared_index')
+    version = publish_catalog(_load_catalog(catalog_path), directory)
+    return [_segment_path(directory, version)]
+
+def _timed(stage, *args):
+    start = time.perf_counter()
+    paths = stage(*args)
+    return paths, time.perf_counter() - start
+
+def build_artifacts(internships: List[Dict], output: str, workers: int = None) -> Dict:
+    """
+    Validate a raw catalog and build every derived artifact the app loads
+    
+    Validation runs first; the remaining stages run in parallel worker
+    processes. Writes manifest.json (catalog hash, artifacts, per-stage
+    seconds) into `output` and returns it.
+    """
+    from models.feature_cache import cache_key
+    
+    os.makedirs(output, exist_ok=True)
+    timings = {}
+    artifacts = {}
+    
+    start = time.perf_counter()
+    internships = validate_internships(internships)
+    validated_path = _write_json(os.path.join(output, 'catalog.json'), internships)
+    timings['validate'] = time.perf_counter() - start
+    artifacts['validate'] = [validated_path]
+    
+    stages = {
+        'statistics': (_stage_statistics, validated_path, output),
+        'features': (_stage_features, validated_path, output, 'overlap'),
+        'search_index': (_stage_features, validated_path, output, 'bm25'),
+        'shared_index': (_stage_shared_index, validated_path, output)
+    }
+    with ProcessPoolExecutor(max_workers=workers or min(len(stages), os.cpu_count() or 1)) as pool:
+        futures = {name: pool.submit(_timed, *stage) for name, stage in stages.items()}
+        for name, future in futures.items():
+            artifacts[name], timings[name] = future.result()
+    
+    manifest = {
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+        'internships': len(internships),
+        'catalog_hash': cache_key(internships),
+        'artifacts': {name: [os.path.relpath(p, output) for p in paths] for name, paths in artifacts.items()},
+        'seconds': {name: round(seconds, 3) for name, seconds in timings.items()},
+        'total_seconds': round(time.perf_counter() - start, 3)
+    }
+    _write_json(os.path.join(output, 'manifest.json'), manifest)
+    return manifest
+
+def load_artifacts(directory: str) -> Dict:
+    """
+    Read a directory written by build_artifacts()
+    
+    Returns the manifest, the validated catalog, its statistics and the
+    feature cache directory (None if it was not built). Raises ValueError
+    when the catalog's content hash differs from the manifest's, e.g. after
+    catalog.json was replaced or the build ran under another Python version
+    (whose feature cache would not match either).
+    """
+    from models.feature_cache import cache_key
+    
+    with open(os.path.join(directory, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    paths = {name: [os.path.join(directory, p) for p in files] for name, files in manifest['artifacts'].items()}
+    internships = _load_catalog(paths['validate'][0])
+    if cache_key(internships) != manifest['catalog_hash']:
+        raise ValueError(f"{directory}: catalog.json does not match the catalog the artifacts were built from")
+    with open(paths['statistics'][0], 'r', encoding='utf-8') as f:
+        statistics = json.load(f)
+    
+    features = os.path.join(directory, 'features')
+    return {
+        'manifest': manifest,
+        'internships': internships,
+        'statistics': statistics,
+        'features_dir': features if os.path.isdir(features) else None
+    }
+
+def collect():
+    """Dump the built-in catalog to JSON and print its statistics"""
     print("=" * 70)
     print("REAL INTERNSHIP DATA COLLECTOR - 2025")
     print("=" * 70)
@@ -455,3 +642,29 @@ if __name__ == "__main__":
         print(f"   - {company}")
     
     print("\n✅ Data collection complete!")
+
+if __name__ == "__main__":
+    # Build stages import from models/
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    
+    parser = argparse.ArgumentParser(description="Collect the internship catalog or build its app artifacts")
+    parser.add_argument("command", nargs="?", default="collect", choices=["collect", "build"])
+    parser.add_argument("--catalog", help="raw catalog JSON to build from (default: built-in 2025 data)")
+    parser.add_argument("--output", default="artifacts", help="artifact directory")
+    parser.add_argument("--workers", type=int, help="parallel build processes (default: one per stage, up to the CPU count)")
+    args = parser.parse_args()
+    
+    if args.command == "build":
+        internships = _load_catalog(args.catalog) if args.catalog else get_all_internships()
+        try:
+            manifest = build_artifacts(internships, args.output, args.workers)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        
+        print(f"✅ Built artifacts for {manifest['internships']} internships in {args.output}")
+        for stage, seconds in manifest['seconds'].items():
+            print(f"   {stage:<14} {seconds:>8.3f}s  {', '.join(manifest['artifacts'][stage])}")
+        print(f"   {'total':<14} {manifest['total_seconds']:>8.3f}s")
+    else:
+        collect()
@@ -0,0 +1,176 @@
+"""
+Micro-batching request coalescer
+Collects recommend calls arriving within a few milliseconds and scores them as one batch
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Dict, Union
+
+from models.catalog_index import CatalogIndex
+from models.compact_results import CompactRecommendations
+from models.recommender import InternshipRecommender
+
+class RecommendationBatcher:
+    """
+    Front end for InternshipRecommender.recommend_batch().
+
+    Callers submit one profile each; a single worker thread waits up to
+    max_wait_ms after the first pending request (or until max_batch_size
+    requests are queued) and hands the batch to one recommend_batch() call.
+    That call still scores students one after another; the batch saves the
+    per-call overhead and shares factor columns between students with equal
+    inputs (same locations, education, ...). Every caller gets back exactly
+    its own top-k.
+    """
+
+    def __init__(
+        self,
+        recommender: InternshipRecommender,
+        index: CatalogIndex,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative")
+
+        self.recommender = recommender
+        self.index = index
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._queue = queue.Queue()
+        self._closed = False
+        # Makes "not closed, then enqueue" atomic with close() queueing the sentinel
+        self._submit_lock = threading.Lock()
+        self._batches = 0
+        self._requests = 0
+        self._largest_batch = 0
+        self._worker = threading.Thread(target=self._run, name='recommend-batcher', daemon=True)
+        self._worker.start()
+
+    def submit(self, student_profile: Dict, top_k: int = 5, compact: bool = False) -> Future:
+        """Queue one profile; the Future resolves to its recommendation list"""
+        future = Future()
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("RecommendationBatcher is closed")
+            self._queue.put((student_profile, top_k, compact, future))
+        return future
+
+    def recommend(
+        self,
+        student_profile: Dict,
+        top_k: int = 5,
+        timeout: float = None,
+        compact: bool = False
+    ) -> Union[List[Dict], CompactRecommendations]:
+        """Blocking call with the same result as recommender.recommend_indexed()"""
+        return self.submit(student_profile, top_k, compact).result(timeout)
+
+    async def recommend_async(
+        self,
+        student_profile: Dict,
+        top_k: int = 5,
+        compact: bool = False
+    ) -> Union[List[Dict], CompactRecommendations]:
+        """Awaitable variant for asyncio callers"""
+        return await asyncio.wrap_future(self.submit(student_profile, top_k, compact))
+
+    def stats(self) -> Dict:
+        """Batching counters since start"""
+        return {
+            'batches': self._batches,
+            'requests': self._requests,
+            'avg_batch_size': round(self._requests / self._batches, 2) if self._batches else 0.0,
+            'largest_batch': self._largest_batch,
+            'pending': self._queue.qsize()
+        }
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        """Finish queued work and stop the worker"""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+
+    def _collect(self) -> List:
+        """Block for the first request, then gather more until full or the wait expires"""
+        first = self._queue.get()
+        if first is None:
+            return []
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Re-queue the sentinel so the loop exits after this batch
+                self._queue.put(None)
+                break
+            batch.append(item)
+
+        return batch
+
+    def _fail_pending(self):
+        """Resolve anything still queued after the sentinel so no caller waits forever"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and item[3].set_running_or_notify_cancel():
+                item[3].set_exception(RuntimeError("RecommendationBatcher is closed"))
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if not batch:
+                self._fail_pending()
+                return
+
+            # Callers that gave up (cancelled futures) are dropped from the batch
+            batch = [item for item in batch if item[3].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            profiles = [profile for profile, _, _, _ in batch]
+            top_ks = [top_k for _, top_k, _, _ in batch]
+            try:
+                results = self.recommender.recommend_batch(profiles, self.index, top_ks, compact=True)
+            except Exception:
+                # One malformed profile must not fail its neighbours: retry singly
+                results = []
+                for profile, top_k, _, _ in batch:
+                    try:
+                        results.append(self.recommender.recommend_batch([profile], self.index, top_k, compact=True)[0])
+                    except Exception as e:
+                        results.append(e)
+
+            for (profile, _, compact, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                    continue
+                try:
+                    future.set_result(result if compact else self.recommender.hydrate(result, profile, self.index))
+                except Exception as e:
+                    future.set_exception(e)
+
+            self._batches += 1
+            self._requests += len(batch)
+            self._largest_batch = max(self._largest_batch, len(batch))
@@ -0,0 +1,364 @@
+"""
+Catalog Index - Precomputed posting features
+Built once per catalog and shared by every recommend call
+"""
+
+import numpy as np
+from functools import cached_property
+from typing import List, Dict, Optional, Iterable, Tuple, Union
+
+from models.constraints import CATEGORY_FIELDS, RecommendationConstraints
+from models.skill_vocab import SkillVocabulary, popcount_rows
+from models.text_relevance import TextRelevanceIndex
+
+def normalize_skills(skills: Iterable[str]) -> frozenset:
+    """Lowercase/strip a skill list the same way the recommender does"""
+    return frozenset(s.lower().strip() for s in skills)
+
+class TokenSets:
+    """
+    One set of string tokens per posting, stored as CSR arrays of token ids.
+
+    Tokens of posting n are ids[indptr[n]:indptr[n + 1]] (distinct).
+    overlap() counts how many of a query's tokens each set contains with
+    array operations instead of one Python set intersection per posting.
+    """
+
+    def __init__(self, vocabulary: Dict[str, int], ids: np.ndarray, indptr: np.ndarray):
+        self.vocabulary = vocabulary
+        self.ids = ids
+        self.indptr = indptr
+
+    @classmethod
+    def from_sets(cls, sets: Iterable[Iterable[str]]) -> 'TokenSets':
+        vocabulary: Dict[str, int] = {}
+        ids, lengths = [], []
+        for tokens in sets:
+            row = {vocabulary.setdefault(token, len(vocabulary)) for token in tokens}
+            ids.extend(row)
+            lengths.append(len(row))
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        return cls(vocabulary, np.array(ids, dtype=np.int32), indptr)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def sets(self) -> List[frozenset]:
+        """The token sets as Python frozensets"""
+        names = list(self.vocabulary)
+        tokens = [names[n] for n in self.ids.tolist()]
+        bounds = self.indptr.tolist()
+        return [frozenset(tokens[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+    def take(self, rows: np.ndarray) -> 'TokenSets':
+        """Sets of the given rows, in that order"""
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        gather = np.repeat(starts - indptr[:-1], lengths) + np.arange(indptr[-1])
+        return TokenSets(self.vocabulary, self.ids[gather], indptr)
+
+    def overlap(self, tokens: Iterable[str]) -> np.ndarray:
+        """Number of the given (distinct) tokens found in each set"""
+        wanted = np.zeros(len(self.vocabulary), dtype=bool)
+        for token in set(tokens):
+            n = self.vocabulary.get(token)
+            if n is not None:
+                wanted[n] = True
+        hits = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        np.cumsum(wanted[self.ids], out=hits[1:])
+        return hits[self.indptr[1:]] - hits[self.indptr[:-1]]
+
+class CatalogIndex:
+    """
+    Per-posting features derived from the raw catalog, computed once.
+
+    The recommender re-derives these (lowercasing, splitting, set building)
+    for every posting on every request; keeping them here turns repeated
+    recommend calls into set lookups and array operations.
+    """
+
+    def __init__(self, internships: List[Dict], snapshot=None):
+        self.internships = internships
+        self.size = len(internships)
+
+        # Stable posting ids (catalog order is the tie-breaker for ranking)
+        self.ids = [i.get('id', f"ROW{n}") for n, i in enumerate(internships)]
+        self.position = {pid: n for n, pid in enumerate(self.ids)}
+
+        # Text used by interest and career-goal matching
+        self.interest_text = [
+            f"{i['description']} {i.get('department', '')}".lower() for i in internships
+        ]
+        self.career_token_sets = TokenSets.from_sets(
+            f"{i['title']} {i['description']}".lower().split() for i in internships
+        )
+
+        if snapshot is not None:
+            # Columns come from a shared, read-only mapping (models.shared_index)
+            if snapshot.ids != self.ids:
+                raise ValueError("Shared catalog snapshot does not match these internships")
+            self.version = snapshot.version
+            self.vocabulary = snapshot.vocabulary
+            self.location_values = snapshot.location_values
+            self.location_codes = snapshot.arrays['location_codes']
+            self.experience_required = snapshot.arrays['experience_required']
+            self.stipend = snapshot.arrays['stipend']
+            self.required_bitmap = snapshot.arrays['required_skills']
+            self.preferred_bitmap = snapshot.arrays['preferred_skills']
+        else:
+            self.version = None
+            self.vocabulary = SkillVocabulary.from_catalog(internships)
+
+            # Locations are scored once per distinct value
+            self.location_values, self.location_codes = self._encode(
+                [i.get('location', '') for i in internships]
+            )
+
+            # Numeric columns
+            self.experience_required = np.array(
+                [i.get('experience_required', 0) for i in internships], dtype=np.float64
+            )
+            self.stipend = np.array([i.get('stipend', 0) for i in internships], dtype=np.float64)
+
+            # Skill bitmaps (one row of uint64 words per posting)
+            self.required_bitmap = self.vocabulary.encode_matrix([i['required_skills'] for i in internships])
+            self.preferred_bitmap = self.vocabulary.encode_matrix(
+                [i.get('preferred_skills', []) for i in internships]
+            )
+
+        # Browse search fields
+        self._search_company = [i['company'].lower() for i in internships]
+        self._search_title = [i['title'].lower() for i in internships]
+        self._search_skills = ['\x00'.join(s.lower() for s in i['required_skills']) for i in internships]
+
+    def to_features(self) -> Dict[str, object]:
+        """
+        Everything derived from the catalog as arrays and string lists
+        (the layout models.feature_cache persists)
+        """
+        features = {
+            'ids': self.ids,
+            'interest_text': self.interest_text,
+            'career_vocabulary': list(self.career_token_sets.vocabulary),
+            'career_token_ids': self.career_token_sets.ids,
+            'career_token_indptr': self.career_token_sets.indptr,
+            'vocabulary': self.vocabulary.skills,
+            'location_values': self.location_values,
+            'location_codes': self.location_codes,
+            'experience_required': self.experience_required,
+            'stipend': self.stipend,
+            'required_bitmap': self.required_bitmap,
+            'preferred_bitmap': self.preferred_bitmap,
+            'required_counts': self.required_counts,
+            'preferred_counts': self.preferred_counts,
+            'search_company': self._search_company,
+            'search_title': self._search_title,
+            'search_skills': self._search_skills
+        }
+        if 'text_relevance' in vars(self):
+            features.update({f"bm25_{name}": value for name, value in self.text_relevance.to_features().items()})
+        return features
+
+    @classmethod
+    def from_features(cls, internships: List[Dict], features: Dict[str, object]) -> 'CatalogIndex':
+        """Index over `internships` rebuilt from to_features() output without re-deriving anything"""
+        if len(features['ids']) != len(internships):
+            raise ValueError("Cached features do not match these internships")
+        index = object.__new__(cls)
+        index.internships = internships
+        index.size = len(internships)
+        index.version = None
+        index.ids = list(features['ids'])
+        index.position = {pid: n for n, pid in enumerate(index.ids)}
+        index.interest_text = list(features['interest_text'])
+        index.career_token_sets = TokenSets(
+            {token: n for n, token in enumerate(features['career_vocabulary'])},
+            features['career_token_ids'],
+            features['career_token_indptr']
+        )
+        index.vocabulary = SkillVocabulary(features['vocabulary'])
+        index.location_values = list(features['location_values'])
+        for name in ('location_codes', 'experience_required', 'stipend', 'required_bitmap', 'preferred_bitmap',
+                     'required_counts', 'preferred_counts'):
+            setattr(index, name, features[name])
+        index._search_company = list(features['search_company'])
+        index._search_title = list(features['search_title'])
+        index._search_skills = list(features['search_skills'])
+
+        bm25 = {name[5:]: value for name, value in features.items() if name.startswith('bm25_')}
+        if bm25:
+            index.text_relevance = TextRelevanceIndex.from_features(bm25)
+        return index
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> 'CatalogIndex':
+        """Index over a shared catalog version, reusing its mapped arrays"""
+        return cls(snapshot.internships(), snapshot)
+
+    @staticmethod
+    def _encode(values: List[str]):
+        """Dictionary-encode a string column into (distinct values, int codes)"""
+        lookup = {}
+        codes = np.empty(len(values), dtype=np.int32)
+        for n, value in enumerate(values):
+            codes[n] = lookup.setdefault(value, len(lookup))
+        return list(lookup), codes
+
+    # Attributes describing the whole catalog rather than one entry per posting
+    _CATALOG_ATTRS = ('location_values', 'vocabulary', 'version')
+
+    # Lookup structures holding row numbers; a sub-index rebuilds its own
+    _ROW_INDEX_ATTRS = ('range_columns', 'category_postings')
+
+    def take(self, rows: Union[Iterable[int], slice]) -> 'CatalogIndex':
+        """
+        Sub-index over the given rows (kept in the order given)
+
+        Per-posting lists and arrays are sliced; catalog-wide tables are
+        shared. Pass rows in ascending order to keep catalog tie-breaking.
+        A slice of consecutive rows is cheaper: arrays become views.
+        """
+        if isinstance(rows, slice):
+            positions = np.arange(*rows.indices(self.size))
+        else:
+            rows = positions = np.asarray(rows, dtype=np.int64)
+        sub = object.__new__(type(self))
+        for name, value in vars(self).items():
+            if name in self._CATALOG_ATTRS:
+                setattr(sub, name, value)
+            elif name in self._ROW_INDEX_ATTRS:
+                continue
+            elif isinstance(value, np.ndarray) and value.ndim and value.shape[0] == self.size:
+                setattr(sub, name, value[rows])
+            elif isinstance(value, list) and len(value) == self.size:
+                setattr(sub, name, value[rows] if isinstance(rows, slice) else [value[r] for r in rows.tolist()])
+            elif isinstance(value, (TextRelevanceIndex, TokenSets)):
+                setattr(sub, name, value.take(positions))
+            else:
+                setattr(sub, name, value)
+        sub.size = len(positions)
+        sub.position = {pid: n for n, pid in enumerate(sub.ids)}
+        return sub
+
+    @cached_property
+    def required_skills(self) -> List[frozenset]:
+        """Normalized required skills per posting"""
+        return [normalize_skills(i['required_skills']) for i in self.internships]
+
+    @cached_property
+    def preferred_skills(self) -> List[frozenset]:
+        """Normalized preferred skills per posting"""
+        return [normalize_skills(i.get('preferred_skills', [])) for i in self.internships]
+
+    @cached_property
+    def career_tokens(self) -> List[frozenset]:
+        """Lowercased title + description words per posting"""
+        return self.career_token_sets.sets()
+
+    @cached_property
+    def required_counts(self) -> np.ndarray:
+        """Distinct required skills per posting"""
+        return popcount_rows(self.required_bitmap)
+
+    @cached_property
+    def preferred_counts(self) -> np.ndarray:
+        """Distinct preferred skills per posting"""
+        return popcount_rows(self.preferred_bitmap)
+
+    @cached_property
+    def text_relevance(self) -> TextRelevanceIndex:
+        """BM25 index over titles and descriptions, built on first use"""
+        return TextRelevanceIndex.from_internships(self.internships)
+
+    @cached_property
+    def range_columns(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Numeric filter fields as (values sorted ascending, rows in that order)"""
+        columns = {
+            'stipend': self.stipend,
+            'experience_required': self.experience_required,
+            'duration_months': np.array([i.get('duration_months', 0) for i in self.internships], dtype=np.float64)
+        }
+        sorted_columns = {}
+        for field, values in columns.items():
+            order = np.argsort(values, kind='stable')
+            sorted_columns[field] = (values[order], order)
+        return sorted_columns
+
+    @cached_property
+    def category_postings(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Categorical filter fields as value -> ascending rows with that value"""
+        postings = {}
+        for field in CATEGORY_FIELDS.values():
+            if field == 'location':
+                values, codes = self.location_values, self.location_codes
+            else:
+                values, codes = self._encode([i.get(field) for i in self.internships])
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(values) + 1))
+            postings[field] = {
+                value: order[bounds[n]:bounds[n + 1]] for n, value in enumerate(values)
+            }
+        return postings
+
+    def select(self, constraints: RecommendationConstraints) -> Optional[np.ndarray]:
+        """
+        Ascending rows passing every constraint (None when nothing is filtered)
+
+        Ranges are two binary searches over a sorted column, categories a
+        union of postings lists; the smallest candidate set is intersected
+        with the rest.
+        """
+        if constraints is None or constraints.is_empty:
+            return None
+
+        candidates = []
+        for field, (low, high) in constraints.ranges.items():
+            values, order = self.range_columns[field]
+            lo, hi = np.searchsorted(values, low, 'left'), np.searchsorted(values, high, 'right')
+            candidates.append(np.sort(order[lo:hi]))
+        for field, wanted in constraints.categories.items():
+            postings = self.category_postings[field]
+            lists = [postings[value] for value in wanted if value in postings]
+            candidates.append(np.sort(np.concatenate(lists)) if lists else np.empty(0, dtype=np.int64))
+
+        candidates.sort(key=len)
+        rows = candidates[0]
+        for other in candidates[1:]:
+            if not len(rows):
+                break
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return rows.astype(np.int64, copy=False)
+
+    def get(self, posting_id: str) -> Optional[Dict]:
+        """Look up a posting by id"""
+        pos = self.position.get(posting_id)
+        return None if pos is None else self.internships[pos]
+
+    def search(
+        self,
+        query: str = '',
+        locations: Optional[List[str]] = None,
+        min_stipend: float = 0
+    ) -> List[Dict]:
+        """Catalog search with the same semantics as the Browse page"""
+
+        mask = np.ones(self.size, dtype=bool)
+
+        if query:
+            q = query.lower()
+            mask &= np.array([
+                q in company or q in title or q in skills
+                for company, title, skills in zip(self._search_company, self._search_title, self._search_skills)
+            ], dtype=bool)
+
+        if locations:
+            wanted = [n for n, loc in enumerate(self.location_values) if loc in set(locations)]
+            mask &= np.isin(self.location_codes, wanted)
+
+        if min_stipend > 0:
+            mask &= self.stipend >= min_stipend
+
+        return [self.internships[n] for n in np.flatnonzero(mask)]
@@ -0,0 +1,289 @@
+"""
+Cohort Analytics - Whole-cohort profile scoring with array operations
+Same rules as calculate_profile_strength and _identify_skill_gaps, applied to
+a table of profiles at once
+
+Reports:
+    python -m models.cohort strength --profiles cohort.json
+    python -m models.cohort strength --synthetic 100000
+    python -m models.cohort gaps --synthetic 20000 --top-k 10
+"""
+
+import argparse
+import json
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from models.catalog_index import CatalogIndex
+
+# Feedback flag column -> message calculate_profile_strength shows for it
+FEEDBACK_ITEMS = OrderedDict([
+    ('missing_skills', "Add more skills"),
+    ('missing_experience', "Consider adding internship/project experience"),
+    ('missing_education', "Add education details"),
+    ('short_career_goals', "Expand your career goals description"),
+    ('missing_career_goals', "Add detailed career goals"),
+    ('missing_interests', "Add more interests"),
+])
+
+RATINGS = ['Excellent', 'Good', 'Average']
+
+def _lengths(column) -> np.ndarray:
+    """len() of every list/str cell; missing cells count as empty"""
+    return np.fromiter(
+        (len(v) if isinstance(v, (list, tuple, str)) else 0 for v in column), dtype=np.int64, count=len(column)
+    )
+
+def _numbers(table: pd.DataFrame, name: str) -> np.ndarray:
+    if name not in table:
+        return np.zeros(len(table))
+    return pd.to_numeric(table[name], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+def _round1(values: np.ndarray) -> np.ndarray:
+    # round() is correctly rounded; np.round scales by 10 first and can land
+    # on the other side of .x5, which would disagree with the scalar version
+    return np.array([round(v, 1) for v in values.tolist()], dtype=np.float64)
+
+def _column(table: pd.DataFrame, name: str) -> pd.Series:
+    return table[name] if name in table else pd.Series([None] * len(table), index=table.index)
+
+def profile_strength_table(profiles: Union[pd.DataFrame, List[Dict], Dict[str, list]]) -> pd.DataFrame:
+    """
+    calculate_profile_strength for every profile in a columnar table
+
+    Args:
+        profiles: DataFrame (or list of profile dicts / dict of columns) with
+            the profile fields skills, experience_months, education,
+            career_goals, interests and gpa
+
+    Returns:
+        DataFrame with score, max_score, percentage, rating and one boolean
+        column per FEEDBACK_ITEMS flag, in input row order
+    """
+    table = profiles if isinstance(profiles, pd.DataFrame) else pd.DataFrame(profiles)
+
+    n_skills = _lengths(_column(table, 'skills'))
+    n_interests = _lengths(_column(table, 'interests'))
+    goals_length = _lengths(_column(table, 'career_goals'))
+    has_education = _lengths(_column(table, 'education')) > 0
+    experience = _numbers(table, 'experience_months')
+    gpa = _numbers(table, 'gpa')
+
+    score = (
+        np.minimum(n_skills * 5, 30)
+        + np.minimum(experience / 2, 20)
+        + np.where(has_education, 15, 0)
+        + np.select([goals_length > 50, goals_length > 20], [15, 10], 0)
+        + np.minimum(n_interests * 3, 10)
+        + np.select([gpa >= 8.0, gpa >= 7.0, gpa > 0], [10, 7, 5], 0)
+    )
+
+    return pd.DataFrame({
+        'score': _round1(score),
+        'max_score': 100,
+        'percentage': _round1(score / 100 * 100),
+        'rating': np.select([score >= 80, score >= 60], RATINGS[:2], RATINGS[2]),
+        'n_skills': n_skills,
+        'missing_skills': n_skills < 5,
+        'missing_experience': experience == 0,
+        'missing_education': ~has_education,
+        'short_career_goals': (goals_length > 20) & (goals_length <= 50),
+        'missing_career_goals': goals_length <= 20,
+        'missing_interests': n_interests < 3,
+    }, index=table.index)
+
+def feedback_for(row: pd.Series) -> List[str]:
+    """Feedback messages of one result row, worded like calculate_profile_strength"""
+    feedback = []
+    for flag, message in FEEDBACK_ITEMS.items():
+        if row[flag]:
+            feedback.append(f"{message} (currently {row['n_skills']})" if flag == 'missing_skills' else message)
+    return feedback
+
+def cohort_summary(strength: pd.DataFrame) -> Dict:
+    """Score distribution, rating counts and the most common missing items"""
+    total = len(strength)
+    flags = strength[list(FEEDBACK_ITEMS)].sum()
+    return {
+        'profiles': total,
+        'mean_score': round(float(strength['score'].mean()), 1) if total else 0.0,
+        'median_score': round(float(strength['score'].median()), 1) if total else 0.0,
+        'score_percentiles': {
+            f"p{p}": round(float(np.percentile(strength['score'], p)), 1) if total else 0.0
+            for p in (10, 25, 75, 90)
+        },
+        'rating_distribution': {
+            rating: int((strength['rating'] == rating).sum()) for rating in RATINGS
+        },
+        'missing_items': [
+            {'item': FEEDBACK_ITEMS[flag], 'profiles': int(count),
+             'percentage': round(count / total * 100, 1) if total else 0.0}
+            for flag, count in flags.sort_values(ascending=False, kind='stable').items()
+        ],
+    }
+
+class CohortSkillGaps:
+    """
+    Missing required skills of a whole cohort, counted per student and skill.
+
+    A student's gaps for a posting are the posting's required skills minus
+    the student's synonym-expanded skills (as in _identify_skill_gaps),
+    computed as required_bitmap & ~student_bitmap. Counts cover either the
+    whole catalog or each student's top-k recommendations, and are also
+    aggregated by posting department and location.
+    """
+
+    def __init__(
+        self,
+        profiles: List[Dict],
+        index: CatalogIndex,
+        recommender,
+        top_k: Optional[int] = None,
+        batch_size: int = 2048
+    ):
+        self.index = index
+        self.skills = index.vocabulary.skills
+        self.top_k = top_k
+        self.departments, department_codes = CatalogIndex._encode(
+            [i.get('department', '') for i in index.internships]
+        )
+        self.locations = index.location_values
+
+        vocabulary = index.vocabulary
+        student_bitmap = vocabulary.encode_matrix([
+            recommender._expand_skills(set(s.lower().strip() for s in p.get('skills', []))) for p in profiles
+        ])
+        n_students, n_skills = len(profiles), len(self.skills)
+        groups = {'department': (department_codes, len(self.departments)),
+                  'location': (index.location_codes, len(self.locations))}
+
+        # gap_counts[s, j]: postings in scope that require skill j which student s lacks
+        self.gap_counts = np.zeros((n_students, n_skills), dtype=np.int32)
+        self.blocked_pairs = {name: np.zeros((size, n_skills), dtype=np.int64) for name, (_, size) in groups.items()}
+        self.students_blocked = {name: np.zeros((size, n_skills), dtype=np.int64) for name, (_, size) in groups.items()}
+
+        if top_k is None:
+            # Every posting is in scope: counts follow from per-skill demand
+            lacking = ~vocabulary.unpack(student_bitmap)
+            required = vocabulary.unpack(index.required_bitmap)
+            self.gap_counts[:] = lacking * required.sum(axis=0)
+            students_lacking = lacking.sum(axis=0)
+            for name, (codes, size) in groups.items():
+                demand = np.zeros((size, n_skills), dtype=np.int64)
+                np.add.at(demand, codes, required)
+                self.blocked_pairs[name] = demand * students_lacking
+                self.students_blocked[name] = (demand > 0) * students_lacking
+        else:
+            for start in range(0, n_students, batch_size):
+                batch = profiles[start:start + batch_size]
+                results = recommender.recommend_batch(batch, index, top_k, compact=True)
+                students = np.array([n for n, r in enumerate(results) for _ in r.ids], dtype=np.int64)
+                postings = np.array([index.position[pid] for r in results for pid in r.ids], dtype=np.int64)
+                gaps = vocabulary.unpack(
+                    index.required_bitmap[postings] & ~student_bitmap[start + students]
+                ) if len(postings) else np.zeros((0, n_skills), dtype=bool)
+
+                np.add.at(self.gap_counts, start + students, gaps)
+                for name, (codes, size) in groups.items():
+                    np.add.at(self.blocked_pairs[name], codes[postings], gaps)
+                    per_student = np.zeros((len(batch), size, n_skills), dtype=bool)
+                    np.logical_or.at(per_student, (students, codes[postings]), gaps)
+                    self.students_blocked[name] += per_student.sum(axis=0)
+
+    def gaps_of(self, student: int) -> Dict[str, int]:
+        """Missing skill -> number of postings it blocks, for one student"""
+        row = self.gap_counts[student]
+        return {self.skills[j]: int(row[j]) for j in np.flatnonzero(row)}
+
+    def by_skill(self) -> pd.DataFrame:
+        """Per skill: students missing it and (student, posting) pairs it blocks"""
+        frame = pd.DataFrame({
+            'skill': self.skills,
+            'students_blocked': (self.gap_counts > 0).sum(axis=0),
+            'blocked_pairs': self.gap_counts.sum(axis=0, dtype=np.int64),
+        })
+        frame = frame[frame['blocked_pairs'] > 0]
+        return frame.sort_values(['blocked_pairs', 'students_blocked'], ascending=False, kind='stable') \
+            .reset_index(drop=True)
+
+    def by_department(self) -> pd.DataFrame:
+        return self._grouped('department', self.departments)
+
+    def by_location(self) -> pd.DataFrame:
+        return self._grouped('location', self.locations)
+
+    def _grouped(self, name: str, values: List[str]) -> pd.DataFrame:
+        groups, skills = np.nonzero(self.blocked_pairs[name])
+        frame = pd.DataFrame({
+            name: [values[g] for g in groups],
+            'skill': [self.skills[j] for j in skills],
+            'students_blocked': self.students_blocked[name][groups, skills],
+            'blocked_pairs': self.blocked_pairs[name][groups, skills],
+        })
+        return frame.sort_values(['blocked_pairs', 'students_blocked'], ascending=False, kind='stable') \
+            .reset_index(drop=True)
+
+def _load_profiles(args) -> List[Dict]:
+    if args.profiles:
+        with open(args.profiles, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    from benchmarks.synthetic import synthesize_profiles
+    return synthesize_profiles(args.synthetic, seed=args.seed)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cohort-wide profile reports")
+    parser.add_argument("command", choices=["strength", "gaps"])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--profiles", help="JSON list of student profiles")
+    source.add_argument("--synthetic", type=int, help="generate this many synthetic profiles")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--catalog", help="catalog JSON for gaps (default: built-in 2025 data)")
+    parser.add_argument("--top-k", type=int, help="gaps: only count each student's top-k recommendations")
+    parser.add_argument("--limit", type=int, default=15, help="gaps: rows to print per table")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    args = parser.parse_args()
+
+    profiles = _load_profiles(args)
+
+    if args.command == "strength":
+        start = time.perf_counter()
+        strength = profile_strength_table(pd.DataFrame(profiles))
+        report = cohort_summary(strength)
+        elapsed = time.perf_counter() - start
+
+        print(f"📊 {report['profiles']:,} profiles scored in {elapsed:.2f}s")
+        print(f"   Mean score {report['mean_score']}, median {report['median_score']}")
+        for rating, count in report['rating_distribution'].items():
+            print(f"   {rating:<10} {count:>8,}")
+        print("   Most common missing items:")
+        for item in report['missing_items']:
+            print(f"   - {item['item']:<48} {item['profiles']:>8,} ({item['percentage']}%)")
+    else:
+        from models.recommender import InternshipRecommender
+        if args.catalog:
+            with open(args.catalog, 'r', encoding='utf-8') as f:
+                internships = json.load(f)
+        else:
+            from data.real_internships import get_all_internships
+            internships = get_all_internships()
+
+        start = time.perf_counter()
+        gaps = CohortSkillGaps(profiles, CatalogIndex(internships), InternshipRecommender(), args.top_k)
+        elapsed = time.perf_counter() - start
+
+        scope = f"top-{args.top_k} recommendations" if args.top_k else f"all {len(internships):,} postings"
+        print(f"📚 Skill gaps of {len(profiles):,} students over {scope} in {elapsed:.2f}s")
+        tables = {'skill': gaps.by_skill(), 'department': gaps.by_department(), 'location': gaps.by_location()}
+        for name, frame in tables.items():
+            print(f"\n   Top blockers by {name}:")
+            print(frame.head(args.limit).to_string(index=False))
+        report = {name: frame.to_dict('records') for name, frame in tables.items()}
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=int)
+        print(f"✅ Saved report to {args.output}")
@@ -0,0 +1,293 @@
+"""
+Collaborative Filtering - Implicit-feedback ALS over logged Apply/Save events
+Students (event store sessions) x postings are factorized offline; scoring a
+student then costs one dot product per posting against precomputed vectors.
+
+Build / update from the event store:
+    python -m models.collaborative build
+    python -m models.collaborative update
+
+Set INTERNSHIP_CF_MODEL to another model file.
+"""
+
+import argparse
+import itertools
+import os
+import threading
+import weakref
+from typing import List, Dict, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+from models.event_store import DEFAULT_PATH as EVENTS_PATH, read_events
+
+DEFAULT_PATH = os.environ.get('INTERNSHIP_CF_MODEL') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'internship_events', 'cf_model.npz'
+)
+
+# Implicit feedback strength per event type (impressions and shares carry none)
+EVENT_WEIGHTS = {'apply': 2.0, 'save': 1.0}
+
+# Model versions are unique in the process, so a reloaded model never
+# shares a cache key with the one it replaces
+_VERSIONS = itertools.count(1)
+
+class InteractionMatrix:
+    """Sparse student x posting feedback, accumulated event by event"""
+
+    def __init__(self):
+        self.users: List[str] = []
+        self.items: List[str] = []
+        self.user_pos: Dict[str, int] = {}
+        self.item_pos: Dict[str, int] = {}
+        self._values: Dict[Tuple[int, int], float] = {}
+
+    @property
+    def nnz(self) -> int:
+        return len(self._values)
+
+    def add(self, user: str, item: str, weight: float) -> Tuple[int, int]:
+        u = self.user_pos.get(user)
+        if u is None:
+            u = self.user_pos[user] = len(self.users)
+            self.users.append(user)
+        i = self.item_pos.get(item)
+        if i is None:
+            i = self.item_pos[item] = len(self.items)
+            self.items.append(item)
+        self._values[(u, i)] = self._values.get((u, i), 0.0) + weight
+        return u, i
+
+    def coo(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = len(self._values)
+        pairs = np.fromiter((x for pair in self._values for x in pair), dtype=np.int64, count=2 * n).reshape(n, 2)
+        return pairs[:, 0], pairs[:, 1], np.fromiter(self._values.values(), dtype=np.float64, count=n)
+
+    def csr(self, by: str = 'user') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(indptr, indices, values) with one row per user (or per item)"""
+        users, items, values = self.coo()
+        rows, cols, n_rows = (users, items, len(self.users)) if by == 'user' else (items, users, len(self.items))
+        order = np.argsort(rows, kind='stable')
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+        return indptr, cols[order], values[order]
+
+def _solve_rows(
+    fixed: np.ndarray,
+    csr: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    rows: Iterable[int],
+    regularization: float,
+    alpha: float
+) -> np.ndarray:
+    """
+    Implicit ALS least squares for the given rows with the other side fixed
+
+    Preference is 1 for observed pairs and 0 otherwise, with confidence
+    1 + alpha * value; the shared Y^T Y term is computed once per sweep.
+    """
+    indptr, indices, values = csr
+    k = fixed.shape[1]
+    gram = fixed.T @ fixed + regularization * np.eye(k)
+    rows = list(rows)
+    solved = np.zeros((len(rows), k))
+    for n, r in enumerate(rows):
+        cols = indices[indptr[r]:indptr[r + 1]]
+        if not len(cols):
+            continue
+        confidence = alpha * values[indptr[r]:indptr[r + 1]]
+        Y = fixed[cols]
+        A = gram + (Y.T * confidence) @ Y
+        b = Y.T @ (1.0 + confidence)
+        solved[n] = np.linalg.solve(A, b)
+    return solved
+
+class CollaborativeModel:
+    """
+    Student and posting factor vectors learned with implicit-feedback ALS.
+
+    fit() runs full alternating sweeps. update() folds new events in with
+    a warm start: existing vectors are kept, new students and postings are
+    initialized small, and only rows touched by the new events are re-solved.
+    last_event_id records how far into the event store the model has read.
+
+    Students without interactions are not scored at all (see knows()); the
+    recommender leaves the factor out for them. For a known student, a
+    posting nobody has interacted with scores 0.0.
+    """
+
+    def __init__(self, factors: int = 16, regularization: float = 0.1, alpha: float = 10.0, seed: int = 0):
+        if factors < 1:
+            raise ValueError("factors must be at least 1")
+        self.factors = factors
+        self.regularization = regularization
+        self.alpha = alpha
+        self.matrix = InteractionMatrix()
+        self.user_factors = np.zeros((0, factors))
+        self.item_factors = np.zeros((0, factors))
+        self.last_event_id = 0
+        self.version = next(_VERSIONS)
+        self._rng = np.random.default_rng(seed)
+        self._init_state()
+
+    def _init_state(self):
+        self._lock = threading.Lock()
+        self._aligned = weakref.WeakKeyDictionary()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['_lock'], state['_aligned']
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._init_state()
+
+    def add_events(self, events: Iterable[Tuple]) -> Tuple[Set[int], Set[int]]:
+        """Accumulate read_events() rows; returns the touched user and item positions"""
+        users, items = set(), set()
+        for event_id, _, session_id, event_type, posting_id in events:
+            self.last_event_id = max(self.last_event_id, event_id)
+            weight = EVENT_WEIGHTS.get(event_type)
+            if not weight or not session_id:
+                continue
+            u, i = self.matrix.add(session_id, posting_id, weight)
+            users.add(u)
+            items.add(i)
+        return users, items
+
+    def _grow(self):
+        """Small random vectors for students and postings seen for the first time"""
+        scale = 0.01
+        new_users = len(self.matrix.users) - len(self.user_factors)
+        if new_users:
+            self.user_factors = np.vstack([self.user_factors, self._rng.normal(0, scale, (new_users, self.factors))])
+        new_items = len(self.matrix.items) - len(self.item_factors)
+        if new_items:
+            self.item_factors = np.vstack([self.item_factors, self._rng.normal(0, scale, (new_items, self.factors))])
+
+    def fit(self, events: Iterable[Tuple] = (), iterations: int = 10) -> 'CollaborativeModel':
+        """Add events, then run full alternating sweeps (warm-started from current vectors)"""
+        self.add_events(events)
+        self._grow()
+        if self.matrix.nnz:
+            by_user, by_item = self.matrix.csr('user'), self.matrix.csr('item')
+            for _ in range(iterations):
+                self.user_factors = _solve_rows(self.item_factors, by_user, range(len(self.matrix.users)),
+                                                self.regularization, self.alpha)
+                self.item_factors = _solve_rows(self.user_factors, by_item, range(len(self.matrix.items)),
+                                                self.regularization, self.alpha)
+        self._changed()
+        return self
+
+    def update(self, events: Iterable[Tuple], iterations: int = 2) -> Tuple[int, int]:
+        """Fold in new events, re-solving only the touched rows; returns (users, items) re-solved"""
+        users, items = self.add_events(events)
+        if not users:
+            return 0, 0
+        self._grow()
+        users, items = sorted(users), sorted(items)
+        by_user, by_item = self.matrix.csr('user'), self.matrix.csr('item')
+        for _ in range(iterations):
+            self.user_factors[users] = _solve_rows(self.item_factors, by_user, users, self.regularization, self.alpha)
+            self.item_factors[items] = _solve_rows(self.user_factors, by_item, items, self.regularization, self.alpha)
+        self._changed()
+        return len(users), len(items)
+
+    def _changed(self):
+        with self._lock:
+            self.version = next(_VERSIONS)
+            self._aligned = weakref.WeakKeyDictionary()
+
+    def knows(self, student_id: Optional[str]) -> bool:
+        """Whether the model has interactions (and so a vector) for a student"""
+        return bool(student_id) and student_id in self.matrix.user_pos
+
+    def user_vector(self, student_id: Optional[str]) -> Optional[np.ndarray]:
+        u = self.matrix.user_pos.get(student_id) if student_id else None
+        return None if u is None else self.user_factors[u]
+
+    def item_matrix(self, index) -> np.ndarray:
+        """Posting vectors in CatalogIndex row order (zeros for postings without feedback), cached per index"""
+        with self._lock:
+            aligned = self._aligned.get(index)
+            if aligned is None:
+                aligned = np.zeros((index.size, self.factors))
+                positions = [(row, self.matrix.item_pos.get(pid)) for row, pid in enumerate(index.ids)]
+                known = [(row, i) for row, i in positions if i is not None]
+                if known:
+                    rows, items = zip(*known)
+                    aligned[list(rows)] = self.item_factors[list(items)]
+                self._aligned[index] = aligned
+            return aligned
+
+    def scores(self, student_id: str, index) -> np.ndarray:
+        """Factor column over a CatalogIndex: predicted preference clipped to [0, 1]"""
+        u = self.user_vector(student_id)
+        if u is None:
+            raise KeyError(f"No interactions for student {student_id!r}")
+        # Row-wise multiply + sum, the same arithmetic as score() per posting
+        return np.clip((self.item_matrix(index) * u).sum(axis=1), 0.0, 1.0)
+
+    def score(self, student_id: str, posting_id: Optional[str]) -> float:
+        """Factor value for one student and posting"""
+        u = self.user_vector(student_id)
+        if u is None:
+            raise KeyError(f"No interactions for student {student_id!r}")
+        i = self.matrix.item_pos.get(posting_id)
+        if i is None:
+            return 0.0
+        return float(np.clip((self.item_factors[i] * u).sum(), 0.0, 1.0))
+
+    def save(self, path: str = DEFAULT_PATH):
+        """Write the model (with its interactions, so updates can continue) atomically"""
+        users, items, values = self.matrix.coo()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                config=np.array([self.factors, self.regularization, self.alpha]),
+                last_event_id=np.array(self.last_event_id),
+                user_ids=np.array(self.matrix.users, dtype=str),
+                item_ids=np.array(self.matrix.items, dtype=str),
+                rows=users, cols=items, values=values,
+                user_factors=self.user_factors, item_factors=self.item_factors
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH) -> 'CollaborativeModel':
+        with np.load(path, allow_pickle=False) as data:
+            factors, regularization, alpha = data['config'].tolist()
+            model = cls(int(factors), regularization, alpha)
+            model.last_event_id = int(data['last_event_id'])
+            matrix = model.matrix
+            matrix.users = data['user_ids'].tolist()
+            matrix.items = data['item_ids'].tolist()
+            matrix.user_pos = {u: n for n, u in enumerate(matrix.users)}
+            matrix.item_pos = {i: n for n, i in enumerate(matrix.items)}
+            matrix._values = dict(zip(zip(data['rows'].tolist(), data['cols'].tolist()), data['values'].tolist()))
+            model.user_factors = data['user_factors']
+            model.item_factors = data['item_factors']
+        return model
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or update the collaborative-filtering model from logged events")
+    parser.add_argument("command", choices=["build", "update"])
+    parser.add_argument("--events", default=EVENTS_PATH, help="event store database")
+    parser.add_argument("--model", default=DEFAULT_PATH, help="model file")
+    parser.add_argument("--factors", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == "update" and os.path.exists(args.model):
+        model = CollaborativeModel.load(args.model)
+        users, items = model.update(read_events(args.events, model.last_event_id, EVENT_WEIGHTS),
+                                    iterations=min(args.iterations, 2))
+        print(f"✅ Updated {users} students and {items} postings (events up to #{model.last_event_id})")
+    else:
+        model = CollaborativeModel(args.factors).fit(read_events(args.events, 0, EVENT_WEIGHTS), args.iterations)
+        print(f"✅ Fitted {len(model.matrix.users)} students x {len(model.matrix.items)} postings "
+              f"({model.matrix.nnz} interactions)")
+    model.save(args.model)
+    print(f"📦 Saved model to {args.model}")
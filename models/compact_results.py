@@ -0,0 +1,72 @@
+"""
+Compact Recommendation Records
+Per-session results kept as posting ids + score arrays, hydrated on display
+"""
+
+import sys
+import numpy as np
+from typing import List, Tuple, Optional
+
+class CompactRecommendations:
+    """
+    Top-k results without any copied posting fields.
+
+    Holds only what cannot be re-derived from the catalog: the ranked posting
+    ids, their raw scores and the factor breakdown (one row per result,
+    columns in `factors` order). InternshipRecommender.hydrate() rebuilds the
+    full recommendation dicts from the shared catalog.
+    """
+
+    __slots__ = ('ids', 'scores', 'breakdown', 'factors', 'catalog_version')
+
+    def __init__(
+        self,
+        ids: Tuple[str, ...],
+        scores: np.ndarray,
+        breakdown: np.ndarray,
+        factors: Tuple[str, ...],
+        catalog_version: Optional[int] = None
+    ):
+        self.ids = ids
+        self.scores = scores
+        self.breakdown = breakdown
+        self.factors = factors
+        self.catalog_version = catalog_version
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(zip(self.ids, self.scores.tolist(), self.breakdown.tolist()))
+
+    def __repr__(self) -> str:
+        return f"CompactRecommendations({len(self)} results, {self.nbytes} bytes)"
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this record"""
+        return deep_sizeof(self)
+
+def deep_sizeof(obj, _seen: Optional[set] = None) -> int:
+    """
+    Recursive memory estimate of a session-state value
+
+    Follows dicts, lists, tuples, sets and __slots__ objects; NumPy arrays
+    count their buffer. Shared objects are counted once.
+    """
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj)  # includes the buffer when the array owns it
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, '__slots__'):
+        size += sum(deep_sizeof(getattr(obj, name), seen) for name in obj.__slots__ if hasattr(obj, name))
+    return size
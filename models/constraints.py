@@ -0,0 +1,107 @@
+"""
+Recommendation Constraints - Hard filters applied before scoring
+Resolved against CatalogIndex range columns and postings lists, so only
+postings that pass every filter are scored
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+# Numeric filters: constraint name -> posting field (missing values count as 0)
+RANGE_FIELDS = {
+    'stipend': 'stipend',
+    'duration': 'duration_months',
+    'experience': 'experience_required'
+}
+
+# Categorical filters: constraint name -> posting field (exact value match)
+CATEGORY_FIELDS = {
+    'locations': 'location',
+    'industries': 'industry',
+    'company_sizes': 'company_size',
+    'departments': 'department'
+}
+
+class RecommendationConstraints:
+    """
+    Structured filters for recommend() and friends.
+
+    Ranges are inclusive and either end may be left open. Category filters
+    keep postings whose field equals any of the given values. A posting must
+    pass every filter that is set; top-k is then exact over what is left.
+    """
+
+    def __init__(
+        self,
+        locations: Optional[Iterable[str]] = None,
+        min_stipend: Optional[float] = None,
+        max_stipend: Optional[float] = None,
+        min_duration: Optional[float] = None,
+        max_duration: Optional[float] = None,
+        max_experience: Optional[float] = None,
+        industries: Optional[Iterable[str]] = None,
+        company_sizes: Optional[Iterable[str]] = None,
+        departments: Optional[Iterable[str]] = None
+    ):
+        bounds = {
+            'stipend': (min_stipend, max_stipend),
+            'duration': (min_duration, max_duration),
+            'experience': (None, max_experience)
+        }
+        self.ranges: Dict[str, Tuple[float, float]] = {}
+        for name, (low, high) in bounds.items():
+            if low is None and high is None:
+                continue
+            low = float('-inf') if low is None else float(low)
+            high = float('inf') if high is None else float(high)
+            if low > high:
+                raise ValueError(f"Empty {name} range: {low} > {high}")
+            self.ranges[RANGE_FIELDS[name]] = (low, high)
+
+        values = {
+            'locations': locations,
+            'industries': industries,
+            'company_sizes': company_sizes,
+            'departments': departments
+        }
+        self.categories: Dict[str, frozenset] = {
+            CATEGORY_FIELDS[name]: frozenset(wanted)
+            for name, wanted in values.items() if wanted is not None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> 'RecommendationConstraints':
+        """Constraints from a JSON-style dict using the constructor's argument names"""
+        data = data or {}
+        if not isinstance(data, dict):
+            raise ValueError("'constraints' must be a JSON object")
+        names = {f"{end}_{name}" for name in ('stipend', 'duration') for end in ('min', 'max')}
+        names |= {'max_experience'} | set(CATEGORY_FIELDS)
+        unknown = set(data) - names
+        if unknown:
+            raise ValueError(f"Unknown constraints: {', '.join(sorted(unknown))}")
+        for name, value in data.items():
+            if name in CATEGORY_FIELDS:
+                if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                    raise ValueError(f"'{name}' must be a list of strings")
+            elif value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise ValueError(f"'{name}' must be a number")
+        return cls(**data)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.ranges and not self.categories
+
+    def matches(self, internship: Dict) -> bool:
+        """Whether one posting passes every filter (reference for CatalogIndex.select)"""
+        for field, (low, high) in self.ranges.items():
+            if not low <= internship.get(field, 0) <= high:
+                return False
+        for field, wanted in self.categories.items():
+            if internship.get(field) not in wanted:
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        parts = [f"{field} in [{low}, {high}]" for field, (low, high) in self.ranges.items()]
+        parts += [f"{field} in {sorted(wanted)}" for field, wanted in self.categories.items()]
+        return f"RecommendationConstraints({', '.join(parts)})"
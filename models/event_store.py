@@ -0,0 +1,260 @@
+"""
+Event Store - Local SQLite log of recommendation impressions and clicks
+record() only enqueues; one writer thread group-commits queued events in a
+single transaction, so callers (Streamlit script threads) never wait on disk.
+
+Set INTERNSHIP_EVENT_STORE to another database file, or to "off" to disable.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Iterable, Optional, Tuple
+
+EVENT_TYPES = ('impression', 'apply', 'save', 'share')
+
+DEFAULT_PATH = os.environ.get('INTERNSHIP_EVENT_STORE') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'internship_events', 'events.db'
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    session_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    posting_id TEXT NOT NULL,
+    rank INTEGER,
+    score REAL
+);
+CREATE INDEX IF NOT EXISTS events_posting ON events (posting_id, event_type);
+"""
+
+INSERT = "INSERT INTO events (ts, session_id, event_type, posting_id, rank, score) VALUES (?, ?, ?, ?, ?, ?)"
+
+def read_events(
+    path: str = DEFAULT_PATH,
+    after_id: int = 0,
+    event_types: Optional[Iterable[str]] = None,
+    since: Optional[float] = None
+) -> List[Tuple]:
+    """Committed (id, ts, session_id, event_type, posting_id) rows with id > after_id, oldest first"""
+    sql = "SELECT id, ts, session_id, event_type, posting_id FROM events WHERE id > ?"
+    params: List = [after_id]
+    if since is not None:
+        sql += " AND ts >= ?"
+        params.append(since)
+    if event_types is not None:
+        event_types = list(event_types)
+        sql += f" AND event_type IN ({', '.join('?' * len(event_types))})"
+        params += event_types
+    if not os.path.exists(path):
+        return []
+    with _ReadConnection(path) as conn:
+        return conn.execute(sql + " ORDER BY id", params).fetchall()
+
+class EventStore:
+    """
+    Append-only interaction log in a WAL-mode SQLite database.
+
+    Events wait in a bounded in-memory queue. The writer takes the first
+    pending event, gathers more until max_batch_size or max_wait_ms, and
+    commits them with one executemany. When the queue is full (the disk
+    cannot keep up) new events are dropped and counted rather than making
+    the caller wait. Reads use their own connection, which WAL lets run
+    alongside the writer.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        max_batch_size: int = 2048,
+        max_wait_ms: float = 50.0,
+        max_pending: int = 100000
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative")
+
+        self.path = path
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Opened here so a bad path fails in the caller; only the writer uses it afterwards
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: commits skip fsync, a crash can lose only the last few batches
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        self._queue = queue.Queue(max_pending)
+        # Held by record()/flush() and by close() while it queues the final marker,
+        # so nothing can be queued behind it
+        self._lock = threading.Lock()
+        self._closed = False
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
+        self._largest_batch = 0
+        self._worker = threading.Thread(target=self._run, name='event-store-writer', daemon=True)
+        self._worker.start()
+
+    def record(
+        self,
+        event_type: str,
+        posting_id: str,
+        session_id: str = '',
+        rank: Optional[int] = None,
+        score: Optional[float] = None
+    ) -> bool:
+        """Queue one event without blocking; False if it was dropped because the queue is full"""
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"event_type must be one of {EVENT_TYPES}")
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EventStore is closed")
+            try:
+                self._queue.put_nowait((time.time(), session_id, event_type, str(posting_id), rank, score))
+                return True
+            except queue.Full:
+                self._dropped += 1
+                return False
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until everything queued before this call is committed"""
+        done = threading.Event()
+        with self._lock:
+            if self._closed:
+                return True
+            self._queue.put(done)
+        return done.wait(timeout)
+
+    def counts(self, posting_id: Optional[str] = None, session_id: Optional[str] = None) -> Dict[str, int]:
+        """Committed events per type, optionally for one posting and/or session"""
+        clauses, params = [], []
+        if posting_id is not None:
+            clauses.append("posting_id = ?")
+            params.append(str(posting_id))
+        if session_id is not None:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        counts = dict.fromkeys(EVENT_TYPES, 0)
+        with _ReadConnection(self.path) as conn:
+            for event_type, count in conn.execute(
+                f"SELECT event_type, COUNT(*) FROM events {where} GROUP BY event_type", params
+            ):
+                counts[event_type] = count
+        return counts
+
+    def postings(self, event_type: str, session_id: Optional[str] = None) -> List[str]:
+        """Posting ids with at least one committed event of a type, most recent first"""
+        sql = "SELECT posting_id, MAX(ts) FROM events WHERE event_type = ?"
+        params = [event_type]
+        if session_id is not None:
+            sql += " AND session_id = ?"
+            params.append(session_id)
+        with _ReadConnection(self.path) as conn:
+            rows = conn.execute(sql + " GROUP BY posting_id ORDER BY MAX(ts) DESC", params).fetchall()
+        return [posting_id for posting_id, _ in rows]
+
+    def stats(self) -> Dict:
+        """Writer counters since start"""
+        return {
+            'written': self._written,
+            'dropped': self._dropped,
+            'batches': self._batches,
+            'avg_batch_size': round(self._written / self._batches, 2) if self._batches else 0.0,
+            'largest_batch': self._largest_batch,
+            'pending': self._queue.qsize()
+        }
+
+    def close(self):
+        """Commit queued events and stop the writer"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _collect(self) -> List:
+        """Block for the first event, then gather more until full, the wait expires or a marker arrives"""
+        first = self._queue.get()
+        batch = [first]
+        if not isinstance(first, tuple):
+            return batch
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+            if not isinstance(item, tuple):
+                break
+
+        return batch
+
+    def _remaining(self) -> List:
+        """Whatever is still queued behind the final marker"""
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _write(self, batch: List):
+        rows = [item for item in batch if isinstance(item, tuple)]
+        if rows:
+            try:
+                with self._conn:
+                    self._conn.executemany(INSERT, rows)
+                self._written += len(rows)
+                self._batches += 1
+                self._largest_batch = max(self._largest_batch, len(rows))
+            except sqlite3.Error as e:
+                # A failed batch is dropped; the UI must keep working without the log
+                with self._lock:
+                    self._dropped += len(rows)
+                print(f"⚠️ Could not write {len(rows)} events to {self.path}: {e}")
+
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            self._write(batch)
+            if batch[-1] is None:
+                # Nothing is accepted after close(), but commit anything that still got in
+                self._write(self._remaining())
+                return
+
+class _ReadConnection:
+    """Short-lived read connection closed on exit (sqlite3's own context manager only commits)"""
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path)
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __exit__(self, *exc):
+        self._conn.close()
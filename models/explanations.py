@@ -0,0 +1,103 @@
+"""
+Lazy Match Explanations
+Recommendations carry the few facts behind their "Why This Matches" text and
+render it only when a page actually reads it
+"""
+
+from functools import lru_cache
+from typing import Callable, List, Tuple
+
+TOP_COMPANIES = ('google', 'microsoft', 'amazon', 'meta', 'apple')
+MAX_REASONS = 5
+
+# (strong skills, experience fit, location, career goals,
+#  student skills, required skills, experience months, company, stipend)
+Facts = Tuple[bool, bool, bool, bool, Tuple[str, ...], Tuple[str, ...], int, str, int]
+
+@lru_cache(maxsize=1 << 14)
+def render_match_reasons(facts: Facts) -> Tuple[str, ...]:
+    """Human-readable match reasons; memoized, so each (profile, posting) pair renders once"""
+    strong_skills, experience_fit, location, career_goals, student_skills, required_skills, \
+        experience_months, company, stipend = facts
+    reasons = []
+
+    # Skills (listed in the order the student entered them)
+    if strong_skills:
+        required = set(s.lower() for s in required_skills)
+        matched_skills = [s for s in dict.fromkeys(s.lower() for s in student_skills) if s in required]
+        if matched_skills:
+            reasons.append(f"✅ Strong skill match: {', '.join(matched_skills[:3])}")
+
+    # Experience
+    if experience_fit:
+        if experience_months > 0:
+            reasons.append(f"✅ Your {experience_months} months experience aligns well")
+        else:
+            reasons.append("✅ Perfect for entry-level candidates")
+
+    # Location
+    if location:
+        reasons.append("✅ Matches your location preference")
+
+    # Career goals
+    if career_goals:
+        reasons.append("✅ Aligns with your career aspirations")
+
+    # Company prestige
+    if any(name in company.lower() for name in TOP_COMPANIES):
+        reasons.append(f"🌟 Top-tier company: {company}")
+
+    # High stipend
+    if stipend >= 50000:
+        reasons.append(f"💰 Competitive stipend: ₹{stipend:,}/month")
+
+    return tuple(reasons[:MAX_REASONS])
+
+class MatchReasons:
+    """
+    Sequence of match reason strings, rendered on first access.
+
+    Behaves like the list _generate_match_reasons used to return
+    (iteration, len, indexing, comparison with lists), but holds only the
+    facts until something reads it.
+    """
+
+    __slots__ = ('facts', '_reasons', '_render')
+
+    def __init__(self, facts: Facts, render: Callable[[Facts], Tuple[str, ...]] = render_match_reasons):
+        self.facts = facts
+        self._reasons = None
+        # Swapped for a timed wrapper when the recommender is instrumented
+        self._render = render
+
+    @property
+    def reasons(self) -> Tuple[str, ...]:
+        if self._reasons is None:
+            self._reasons = self._render(self.facts)
+        return self._reasons
+
+    @property
+    def rendered(self) -> bool:
+        return self._reasons is not None
+
+    def __iter__(self):
+        return iter(self.reasons)
+
+    def __len__(self) -> int:
+        return len(self.reasons)
+
+    def __getitem__(self, item):
+        return list(self.reasons)[item] if isinstance(item, slice) else self.reasons[item]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MatchReasons):
+            return self.facts == other.facts or self.reasons == other.reasons
+        if isinstance(other, (list, tuple)):
+            return list(self.reasons) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self.reasons)) if self.rendered else "MatchReasons(<not rendered>)"
+
+    def to_list(self) -> List[str]:
+        return list(self.reasons)
@@ -0,0 +1,182 @@
+"""
+Feature Cache - Derived catalog features kept on disk between runs
+CatalogIndex.to_features() is written once per catalog and recommender config
+to an uncompressed .npz (arrays plus UTF-8 string tables); later cold starts
+load it instead of re-normalizing, re-encoding and re-tokenizing the catalog.
+
+Build / inspect:
+    python -m models.feature_cache build [--catalog data/real_internships_2025.json]
+    python -m models.feature_cache info
+
+Set INTERNSHIP_FEATURE_CACHE to another directory, or to "off" to disable.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import pickle
+import sys
+import zipfile
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from models.catalog_index import CatalogIndex
+from models.text_relevance import TOKEN_PATTERN, STOPWORDS
+
+FORMAT_VERSION = 1
+DEFAULT_DIR = os.environ.get('INTERNSHIP_FEATURE_CACHE') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'internship_features'
+)
+
+# Feature files kept per directory (older catalogs' files are removed)
+KEEP_FILES = 4
+
+def cache_key(internships: List[Dict], recommender=None) -> str:
+    """Content hash of the catalog, the recommender config and the feature format"""
+    config = {
+        'format': FORMAT_VERSION,
+        'python': sys.version_info[:2],
+        'career_goal_method': getattr(recommender, 'career_goal_method', None),
+        'skill_synonyms': getattr(recommender, 'skill_synonyms', None),
+        'token_pattern': TOKEN_PATTERN.pattern,
+        'stopwords': sorted(STOPWORDS)
+    }
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8'))
+    try:
+        # pickle is ~3x faster than JSON here. With the memo off ("fast" mode)
+        # the bytes depend only on content, not on which strings happen to be
+        # shared objects (a JSON-loaded catalog and the built-in one hash alike)
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=5)
+        pickler.fast = True
+        pickler.dump(internships)
+        digest.update(buffer.getvalue())
+    except (pickle.PicklingError, TypeError, AttributeError, ValueError):
+        digest.update(json.dumps(internships, ensure_ascii=False, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+def cache_path(key: str, directory: str = DEFAULT_DIR) -> str:
+    return os.path.join(directory, f"features-{key[:32]}.npz")
+
+def _pack_strings(strings: List[str]) -> Dict[str, np.ndarray]:
+    lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+    return {
+        'utf8': np.frombuffer(''.join(strings).encode('utf-8'), dtype=np.uint8),
+        'offsets': np.concatenate([[0], np.cumsum(lengths)])
+    }
+
+def _unpack_strings(utf8: np.ndarray, offsets: np.ndarray) -> List[str]:
+    text = utf8.tobytes().decode('utf-8')
+    bounds = offsets.tolist()
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+def save_features(index: CatalogIndex, path: str, key: str):
+    """Write an index's features atomically (a temporary file is renamed into place)"""
+    arrays = {'__key__': np.array(key), '__format__': np.array(FORMAT_VERSION)}
+    kinds = {}
+    for name, value in index.to_features().items():
+        if isinstance(value, np.ndarray):
+            arrays[name], kinds[name] = value, 'array'
+            continue
+        kinds[name] = 'strings'
+        arrays.update({f"{name}.{part}": array for part, array in _pack_strings(value).items()})
+    arrays['__kinds__'] = np.array(json.dumps(kinds))
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+def load_features(path: str, internships: List[Dict], key: str) -> CatalogIndex:
+    """CatalogIndex from a saved feature file; ValueError if it was built for something else"""
+    with np.load(path, allow_pickle=False) as data:
+        if int(data['__format__']) != FORMAT_VERSION or str(data['__key__']) != key:
+            raise ValueError("stale feature cache")
+        kinds = json.loads(str(data['__kinds__']))
+        grouped: Dict[str, Dict[str, np.ndarray]] = {}
+        for member in data.files:
+            name, _, part = member.partition('.')
+            if part:
+                grouped.setdefault(name, {})[part] = data[member]
+
+        features = {}
+        for name, kind in kinds.items():
+            if kind == 'array':
+                features[name] = data[name]
+            else:
+                features[name] = _unpack_strings(grouped[name]['utf8'], grouped[name]['offsets'])
+    return CatalogIndex.from_features(internships, features)
+
+def load_or_build(
+    internships: List[Dict],
+    recommender=None,
+    directory: Optional[str] = DEFAULT_DIR
+) -> CatalogIndex:
+    """
+    CatalogIndex for a catalog, from the feature cache when it has this catalog
+
+    A missing, stale or unreadable cache file is rebuilt and rewritten; with
+    directory None (or "off") the cache is bypassed.
+    """
+    if not directory or directory == 'off':
+        return CatalogIndex(internships)
+
+    key = cache_key(internships, recommender)
+    path = cache_path(key, directory)
+    if os.path.exists(path):
+        try:
+            return load_features(path, internships, key)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            print(f"⚠️ Rebuilding feature cache {path}: {e}")
+
+    index = CatalogIndex(internships)
+    if getattr(recommender, 'career_goal_method', None) == 'bm25':
+        index.text_relevance
+    try:
+        save_features(index, path, key)
+        _prune(directory)
+    except OSError as e:
+        print(f"⚠️ Could not write feature cache {path}: {e}")
+    return index
+
+def _prune(directory: str, keep: int = KEEP_FILES):
+    """Remove all but the `keep` most recently written feature files"""
+    paths = [os.path.join(directory, f) for f in os.listdir(directory) if f.startswith('features-') and f.endswith('.npz')]
+    for path in sorted(paths, key=os.path.getmtime, reverse=True)[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or inspect the catalog feature cache")
+    parser.add_argument("command", choices=["build", "info"])
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="cache directory")
+    parser.add_argument("--catalog", help="catalog JSON (default: built-in 2025 data)")
+    parser.add_argument("--career-goal-method", default="overlap", choices=["overlap", "bm25"])
+    args = parser.parse_args()
+
+    if args.command == "build":
+        from models.recommender import InternshipRecommender
+        if args.catalog:
+            with open(args.catalog, 'r', encoding='utf-8') as f:
+                internships = json.load(f)
+        else:
+            from data.real_internships import get_all_internships
+            internships = get_all_internships()
+        recommender = InternshipRecommender(args.career_goal_method)
+        path = cache_path(cache_key(internships, recommender), args.dir)
+        load_or_build(internships, recommender, args.dir)
+        print(f"✅ Cached features of {len(internships)} internships in {path}")
+    else:
+        files = sorted(f for f in os.listdir(args.dir) if f.endswith('.npz')) if os.path.isdir(args.dir) else []
+        print(f"📦 {len(files)} feature files in {args.dir}")
+        for name in files:
+            path = os.path.join(args.dir, name)
+            with np.load(path, allow_pickle=False) as data:
+                count = len(data['location_codes'])
+            print(f"   {name}  {count} internships  {os.path.getsize(path) / 1e6:.1f} MB")
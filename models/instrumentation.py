@@ -0,0 +1,101 @@
+"""
+Scoring Instrumentation - Per-factor timings and counters
+Attach to an InternshipRecommender with enable_instrumentation(); when it is
+not attached the engine runs its original, unwrapped methods.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Callable, Dict, List, Tuple
+
+# metric name -> (type, help)
+METRICS = {
+    'recommender_factor_seconds_total': ('counter', 'Time spent in each matching factor'),
+    'recommender_factor_postings_total': ('counter', 'Postings evaluated by each matching factor'),
+    'recommender_scoring_seconds_total': ('counter', 'Time spent computing weighted match scores'),
+    'recommender_postings_scored_total': ('counter', 'Postings scored'),
+    'recommender_postings_above_threshold_total': ('counter', 'Postings scoring above the minimum match threshold'),
+    'recommender_explanation_seconds_total': ('counter', 'Time spent collecting match reason facts'),
+    'recommender_explanation_render_seconds_total': ('counter', 'Time spent rendering match reason text on first read'),
+    'recommender_skill_gap_seconds_total': ('counter', 'Time spent identifying skill gaps'),
+    'recommender_explanations_total': ('counter', 'Recommendations explained'),
+    'recommender_explanations_rendered_total': ('counter', 'Match reason lists rendered to text'),
+}
+
+Listener = Callable[[str, float, Dict[str, str]], None]
+
+class ScoringInstrumentation:
+    """
+    Thread-safe counters fed by the recommender's scoring hooks.
+
+    Every recorded sample is also passed to registered listeners as
+    listener(metric, amount, labels), e.g. to forward to a metrics client.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, Tuple], float] = defaultdict(float)
+        self._listeners: List[Listener] = []
+
+    def add_listener(self, listener: Listener):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener):
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def record(self, metric: str, amount: float, **labels):
+        """Add `amount` to a counter"""
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] += amount
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(metric, amount, labels)
+
+    def timed(self, func: Callable, metric: str, count_metric: str = None, **labels) -> Callable:
+        """Wrap func so each call adds its duration (and one to count_metric)"""
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(metric, time.perf_counter() - start, **labels)
+                if count_metric:
+                    self.record(count_metric, 1, **labels)
+        return wrapper
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current values keyed as 'metric{label="value"}'"""
+        with self._lock:
+            items = list(self._values.items())
+        return {_series(metric, labels): value for (metric, labels), value in items}
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format"""
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = []
+        seen = set()
+        for (metric, labels), value in items:
+            if metric not in seen:
+                seen.add(metric)
+                kind, help_text = METRICS.get(metric, ('untyped', metric))
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} {kind}")
+            lines.append(f"{_series(metric, labels)} {value:.9g}")
+        return '\n'.join(lines) + '\n'
+
+def _series(metric: str, labels: Tuple) -> str:
+    if not labels:
+        return metric
+    inner = ','.join(f'{k}="{v}"' for k, v in labels)
+    return f"{metric}{{{inner}}}"
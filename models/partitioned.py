@@ -0,0 +1,253 @@
+"""
+Time-Partitioned Catalog - Postings grouped into posted_date segments
+Stale segments are dropped whole, and queries score only the live ones
+"""
+
+import heapq
+import itertools
+from datetime import date, timedelta
+from typing import List, Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from models.catalog_index import CatalogIndex
+from models.compact_results import CompactRecommendations
+from models.recommender import InternshipRecommender, MIN_MATCH_SCORE
+from models.text_relevance import TextRelevanceIndex
+
+GRANULARITIES = ('month', 'week')
+
+# Segment for postings without a parseable posted_date; never expires
+UNDATED = 'undated'
+
+def _parse_date(value) -> Optional[date]:
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+def segment_bounds(posted: Optional[date], granularity: str = 'month') -> Tuple[str, Optional[date], Optional[date]]:
+    """(segment key, first day, first day after) of the segment a posting date falls in"""
+    if posted is None:
+        return UNDATED, None, None
+    if granularity == 'week':
+        start = posted - timedelta(days=posted.weekday())
+        year, week, _ = start.isocalendar()
+        return f"{year}-W{week:02d}", start, start + timedelta(days=7)
+    start = posted.replace(day=1)
+    end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+    return f"{start.year}-{start.month:02d}", start, end
+
+class TimeSegment:
+    """Postings of one month (or week), indexed on first use after a change"""
+
+    def __init__(self, key: str, start: Optional[date], end: Optional[date]):
+        self.key = key
+        self.start = start
+        self.end = end
+        self.internships: List[Dict] = []
+        self._days: List[int] = []
+        self._index = None
+        self._posted_days = None
+
+    def __len__(self) -> int:
+        return len(self.internships)
+
+    def add(self, internship: Dict, posted: Optional[date]):
+        self.internships.append(internship)
+        self._days.append(posted.toordinal() if posted else 0)
+        self._index = self._posted_days = None
+
+    @property
+    def index(self) -> CatalogIndex:
+        if self._index is None:
+            self._index = CatalogIndex(self.internships)
+        return self._index
+
+    @property
+    def posted_days(self) -> np.ndarray:
+        """posted_date of every posting as a proleptic ordinal (0 when undated)"""
+        if self._posted_days is None:
+            self._posted_days = np.array(self._days, dtype=np.int64)
+        return self._posted_days
+
+class PartitionedCatalog:
+    """
+    Catalog split into posted_date segments, oldest first.
+
+    expire() drops every segment that ended before a cutoff by unlinking
+    it (no posting is touched), and recommend() only scores segments that
+    are still live. Without an age limit or decay, results equal
+    recommend_indexed() over `internships` (segments in date order, catalog
+    order inside each). BM25 career-goal statistics are those of all live
+    postings: each segment gets its slice of one catalog-wide index.
+    """
+
+    def __init__(
+        self,
+        internships: Iterable[Dict] = (),
+        recommender: Optional[InternshipRecommender] = None,
+        granularity: str = 'month'
+    ):
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"granularity must be one of {GRANULARITIES}")
+        self.granularity = granularity
+        self.recommender = recommender or InternshipRecommender()
+        self._segments: Dict[str, TimeSegment] = {}
+        # posting id -> (segment key, row in that segment); the latest add wins
+        self._locations: Dict[str, Tuple[str, int]] = {}
+        # Bumped on every change, so the catalog-wide BM25 index is rebuilt lazily
+        self._generation = 0
+        self._text_generation = None
+        self.add(internships)
+
+    def add(self, internships: Iterable[Dict]):
+        """Append postings to their segments (only touched segments are re-indexed)"""
+        new_segment = False
+        self._generation += 1
+        for internship in internships:
+            posted = _parse_date(internship.get('posted_date'))
+            key, start, end = segment_bounds(posted, self.granularity)
+            segment = self._segments.get(key)
+            if segment is None:
+                segment = self._segments[key] = TimeSegment(key, start, end)
+                new_segment = True
+            self._locations[internship.get('id', f"ROW{len(segment)}")] = (key, len(segment))
+            segment.add(internship, posted)
+
+        if new_segment:
+            # Keep segments oldest first (undated ones lead)
+            ordered = sorted(self._segments.values(), key=lambda s: s.start or date.min)
+            self._segments = {s.key: s for s in ordered}
+
+    def expire(self, before: Union[date, str]) -> List[str]:
+        """Drop every segment that ended on or before `before`; returns their keys"""
+        cutoff = _parse_date(before)
+        if cutoff is None:
+            raise ValueError(f"Not a date: {before!r}")
+        dropped = []
+        for key, segment in list(self._segments.items()):
+            if segment.end is None:
+                continue
+            if segment.end > cutoff:
+                break
+            self._remove(key)
+            dropped.append(key)
+        if dropped:
+            self._generation += 1
+        return dropped
+
+    def drop(self, key: str) -> bool:
+        """Remove one segment by key"""
+        if key not in self._segments:
+            return False
+        self._remove(key)
+        self._generation += 1
+        return True
+
+    def _remove(self, key: str):
+        segment = self._segments.pop(key)
+        for n, internship in enumerate(segment.internships):
+            posting_id = internship.get('id', f"ROW{n}")
+            if self._locations.get(posting_id, (None,))[0] == key:
+                del self._locations[posting_id]
+
+    @property
+    def segments(self) -> List[str]:
+        return list(self._segments)
+
+    @property
+    def size(self) -> int:
+        return sum(len(s) for s in self._segments.values())
+
+    @property
+    def internships(self) -> List[Dict]:
+        """Every live posting, in segment order"""
+        return [i for s in self._segments.values() for i in s.internships]
+
+    def get(self, posting_id: str) -> Optional[Dict]:
+        """Look up a posting by id (lets hydrate() use this object as its index)"""
+        location = self._locations.get(posting_id)
+        if location is None:
+            return None
+        key, row = location
+        return self._segments[key].internships[row]
+
+    def _share_text_relevance(self):
+        """Give every segment its slice of one BM25 index over all live postings"""
+        if self._text_generation == self._generation:
+            return
+        full = TextRelevanceIndex.from_internships(self.internships)
+        start = 0
+        for segment in self._segments.values():
+            segment.index.text_relevance = full.shard(start, start + len(segment))
+            start += len(segment)
+        self._text_generation = self._generation
+
+    def live_segments(self, as_of: Optional[date] = None, max_age_days: Optional[int] = None) -> List[TimeSegment]:
+        """Segments that can hold postings newer than as_of - max_age_days"""
+        if max_age_days is None:
+            return list(self._segments.values())
+        cutoff = (_parse_date(as_of) if as_of else date.today()) - timedelta(days=max_age_days)
+        return [s for s in self._segments.values() if s.end is None or s.end > cutoff]
+
+    def recommend(
+        self,
+        student_profile: Dict,
+        top_k: int = 5,
+        as_of: Optional[Union[date, str]] = None,
+        max_age_days: Optional[int] = None,
+        half_life_days: Optional[float] = None,
+        compact: bool = False
+    ) -> Union[List[Dict], CompactRecommendations]:
+        """
+        Top-k over the live segments
+
+        Args:
+            as_of: Reference day for ages (default today)
+            max_age_days: Skip postings older than this (whole segments are
+                skipped without being scored)
+            half_life_days: Multiply each match score by
+                0.5 ** (age / half_life_days). Eligibility still uses the
+                undecayed score, so decay reorders but never hides postings;
+                undated postings are not decayed.
+        """
+        if half_life_days is not None and half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+        today = (_parse_date(as_of) if as_of else date.today()).toordinal()
+        oldest = today - max_age_days if max_age_days is not None else None
+
+        rec = self.recommender
+        if rec.career_goal_method == 'bm25':
+            self._share_text_relevance()
+        factors = tuple(rec.weights_for(student_profile))
+        streams = []
+        for n, segment in enumerate(self.live_segments(as_of, max_age_days)):
+            index = segment.index
+            columns = rec._factor_columns(student_profile, index)
+            scores = rec._weighted_sum(columns, index.size)
+            eligible = scores > MIN_MATCH_SCORE
+
+            dated = segment.end is not None
+            if oldest is not None and dated:
+                eligible &= segment.posted_days >= oldest
+            if half_life_days is not None and dated:
+                age = np.maximum(today - segment.posted_days, 0)
+                scores = scores * 0.5 ** (age / half_life_days)
+
+            rows = rec._top_rows(scores, np.flatnonzero(eligible), top_k)
+            streams.append([
+                (-round(float(scores[r]), 3), n, r, index.ids[r], float(scores[r]), [columns[f][r] for f in factors])
+                for r in rows
+            ])
+
+        merged = list(itertools.islice(heapq.merge(*streams), top_k))
+        result = CompactRecommendations(
+            tuple(item[3] for item in merged),
+            np.array([item[4] for item in merged], dtype=np.float64),
+            np.array([item[5] for item in merged], dtype=np.float64).reshape(len(merged), len(factors)),
+            factors
+        )
+        return result if compact else rec.hydrate(result, student_profile, self)
@@ -3,17 +3,59 @@ AI Recommendation Engine - Optimized for Streamlit
 Multi-factor intelligent matching system
 """
 
+import math
 import numpy as np
-from typing import List, Dict, Tuple
-from collections import Counter
+from typing import List, Dict, Tuple, Optional, Union, Iterator
+from collections import Counter, OrderedDict
 import re
+import threading
+import time
+
+from models.catalog_index import CatalogIndex
+from models.compact_results import CompactRecommendations
+from models.constraints import RecommendationConstraints
+from models.explanations import MatchReasons, render_match_reasons
+from models.instrumentation import ScoringInstrumentation
+from models.skill_vocab import SKILLS, popcount, popcount_rows
+
+# Postings must score above this to be recommended
+MIN_MATCH_SCORE = 0.3
+
+# Scoring method -> factor it computes (used for instrumentation labels)
+FACTOR_METHODS = {
+    '_match_skills': 'skills_match',
+    '_match_interests': 'interest_alignment',
+    '_match_experience': 'experience_fit',
+    '_match_location': 'location_match',
+    '_match_career_goals': 'career_goals'
+}
+
+# How the career_goals factor is computed: raw word overlap with the posting
+# text, or BM25 relevance from the catalog's TextRelevanceIndex
+CAREER_GOAL_METHODS = ('overlap', 'bm25')
+
+# Profile fields the factors read (a profile's factor columns depend only on these)
+SCORING_FIELDS = ('skills', 'interests', 'experience_months', 'education', 'preferred_locations', 'career_goals')
+
+# Profiles whose factor columns are kept for rerank() (each holds 5 floats per posting)
+FACTOR_CACHE_SIZE = 8
+
+# Catalogs whose CatalogIndex recommend() keeps for BM25 scoring
+INDEX_CACHE_SIZE = 2
+
+# Default share of the score given to the optional collaborative factor
+COLLABORATIVE_WEIGHT = 0.10
 
 class InternshipRecommender:
     """
     Smart recommendation engine using multi-factor analysis
     """
     
-    def __init__(self):
+    def __init__(self, career_goal_method: str = 'overlap'):
+        if career_goal_method not in CAREER_GOAL_METHODS:
+            raise ValueError(f"career_goal_method must be one of {CAREER_GOAL_METHODS}")
+        self.career_goal_method = career_goal_method
+        
         # Configurable weights for different matching factors
         self.weights = {
             'skills_match': 0.35,
@@ -34,13 +76,137 @@ class InternshipRecommender:
             'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes']
         }
         
+        # Synonym expansions as bitmasks (rebuilt if skill_synonyms is replaced)
+        self._expansion_source = None
+        self._skill_expansions = {}
+        self._student_expansions = {}
+        
+        # Optional timing/counter hooks (see enable_instrumentation)
+        self.instrumentation = None
+        
+        # Factor columns of recent scoring runs, reused by rerank()
+        self.factor_cache_size = FACTOR_CACHE_SIZE
+        self._factor_cache = OrderedDict()
+        self._factor_cache_lock = threading.Lock()
+        
+        # Indexes of recent catalogs passed to recommend() (bm25 only)
+        self._index_cache = OrderedDict()
+        
+        # Optional sixth factor from logged interactions (see enable_collaborative)
+        self.collaborative = None
+        self.content_weights = None
+        
         print("✅ Recommendation engine initialized")
     
+    def enable_collaborative(self, model, weight: float = COLLABORATIVE_WEIGHT):
+        """
+        Add a 'collaborative' factor scored by a CollaborativeModel
+        
+        The content factors are scaled by (1 - weight) so weights still sum
+        to 1. Students the model has no events for are scored without the
+        factor, with the unscaled content weights, so their scores are the
+        content-only ones. Calling it again with the same weight only swaps
+        the model, so concurrent scoring never sees a half-updated state.
+        """
+        if not 0 < weight < 1:
+            raise ValueError("weight must be between 0 and 1")
+        if self.collaborative is not None and self.weights['collaborative'] == weight:
+            self.collaborative = model
+            return
+        self.disable_collaborative()
+        # Assigned in an order where a concurrent scorer only ever sees
+        # weights it has every factor column for
+        content_weights = self.weights
+        self.content_weights = content_weights
+        self.collaborative = model
+        self.weights = {**{key: w * (1 - weight) for key, w in content_weights.items()}, 'collaborative': weight}
+    
+    def disable_collaborative(self):
+        """Drop the collaborative factor and restore the content weights"""
+        if self.collaborative is None:
+            return
+        self.weights = self.content_weights
+        self.collaborative = None
+        self.content_weights = None
+    
+    def weights_for(self, student: Dict) -> Dict[str, float]:
+        """Factor weights a student is scored with (content-only for collaborative cold start)"""
+        model = self.collaborative
+        if model is None or model.knows(student.get('student_id')):
+            return self.weights
+        return self.content_weights
+    
+    def _active_weights(self, factors: Dict) -> Dict[str, float]:
+        """Weights matching a set of factor scores: the collaborative one is absent on cold start"""
+        if 'collaborative' in factors or self.collaborative is None:
+            return self.weights
+        return self.content_weights
+    
+    def enable_instrumentation(
+        self,
+        instrumentation: Optional[ScoringInstrumentation] = None
+    ) -> ScoringInstrumentation:
+        """
+        Start recording per-factor timings and counters
+        
+        Hooks are installed as instance attributes wrapping the scoring
+        methods, so an uninstrumented recommender runs the plain methods.
+        """
+        self.disable_instrumentation()
+        instr = instrumentation or ScoringInstrumentation()
+        
+        for method, factor in FACTOR_METHODS.items():
+            setattr(self, method, instr.timed(
+                getattr(self, method),
+                'recommender_factor_seconds_total',
+                'recommender_factor_postings_total',
+                factor=factor,
+                path='reference'
+            ))
+        
+        calculate_match_score = self._calculate_match_score
+        
+        def timed_match_score(student, internship):
+            start = time.perf_counter()
+            score, breakdown = calculate_match_score(student, internship)
+            instr.record('recommender_scoring_seconds_total', time.perf_counter() - start, path='reference')
+            instr.record('recommender_postings_scored_total', 1, path='reference')
+            if score > MIN_MATCH_SCORE:
+                instr.record('recommender_postings_above_threshold_total', 1, path='reference')
+            return score, breakdown
+        
+        self._calculate_match_score = timed_match_score
+        self._generate_match_reasons = instr.timed(
+            self._generate_match_reasons,
+            'recommender_explanation_seconds_total',
+            'recommender_explanations_total'
+        )
+        self._identify_skill_gaps = instr.timed(self._identify_skill_gaps, 'recommender_skill_gap_seconds_total')
+        # Reasons are rendered lazily, when a page first reads them; time that separately
+        self._render_match_reasons = instr.timed(
+            render_match_reasons,
+            'recommender_explanation_render_seconds_total',
+            'recommender_explanations_rendered_total'
+        )
+        
+        self.instrumentation = instr
+        return instr
+    
+    def disable_instrumentation(self):
+        """Remove instrumentation hooks and restore the plain methods"""
+        hooked = list(FACTOR_METHODS) + [
+            '_calculate_match_score', '_generate_match_reasons', '_identify_skill_gaps', '_render_match_reasons'
+        ]
+        for method in hooked:
+            self.__dict__.pop(method, None)
+        self.instrumentation = None
+    
     def recommend(
         self,
         student_profile: Dict,
         all_internships: List[Dict],
-        top_k: int = 5
+        top_k: int = 5,
+        constraints: Optional[RecommendationConstraints] = None
     ) -> List[Dict]:
         """
         Generate top-k personalized recommendations
@@ -49,44 +215,518 @@ class InternshipRecommender:
             student_profile: Student's profile with skills, interests, etc.
             all_internships: List of all available internships
             top_k: Number of top recommendations to return
+            constraints: Hard filters; only postings passing them are scored
             
         Returns:
             List of recommended internships with scores and explanations
         """
+        if self.career_goal_method != 'overlap':
+            # BM25 needs catalog-wide term statistics, only the index has them
+            return self.recommend_indexed(student_profile, self._catalog_index(all_internships), top_k,
+                                          constraints=constraints)
+        
+        if constraints is not None and not constraints.is_empty:
+            all_internships = [i for i in all_internships if constraints.matches(i)]
+        
         recommendations = []
         
         for internship in all_internships:
             # Calculate overall match score
             score, breakdown = self._calculate_match_score(student_profile, internship)
             
-            if score > 0.3:  # Minimum threshold
-                # Generate explanation
-                reasons = self._generate_match_reasons(breakdown, student_profile, internship)
-                
-                # Identify skill gaps
-                gaps = self._identify_skill_gaps(
-                    student_profile.get('skills', []),
-                    internship['required_skills']
+            if score > MIN_MATCH_SCORE:  # Minimum threshold
+                recommendations.append(
+                    self._build_recommendation(student_profile, internship, score, breakdown)
                 )
-                
-                # Success probability
-                success_prob = self._calculate_success_probability(score, breakdown)
-                
-                recommendations.append({
-                    **internship,
-                    'match_score': round(score, 3),
-                    'match_percentage': round(score * 100, 1),
-                    'match_reasons': reasons,
-                    'skill_gaps': gaps,
-                    'success_probability': round(success_prob, 3),
-                    'breakdown': breakdown
-                })
         
         # Sort by match score
         recommendations.sort(key=lambda x: x['match_score'], reverse=True)
         
         return recommendations[:top_k]
     
+    def recommend_indexed(
+        self,
+        student_profile: Dict,
+        index: CatalogIndex,
+        top_k: int = 5,
+        compact: bool = False,
+        constraints: Optional[RecommendationConstraints] = None
+    ) -> Union[List[Dict], CompactRecommendations]:
+        """
+        Same results as recommend(), scored against a prebuilt CatalogIndex
+        
+        Only the returned top-k get explanations and skill gaps. With
+        compact=True, ids/scores/breakdowns are returned instead and no
+        explanation work is done until hydrate(). With constraints, only the
+        postings passing them (see CatalogIndex.select) are scored.
+        """
+        candidates = self._constrained(index, constraints)
+        if candidates is not None:
+            columns = self._factor_columns(student_profile, candidates)
+            result = self._compact_top_k(columns, candidates, top_k)
+            return result if compact else self.hydrate(result, student_profile, index)
+        
+        columns = self._factor_columns(student_profile, index)
+        self._remember_columns(student_profile, index, columns)
+        result = self._compact_top_k(columns, index, top_k)
+        
+        return result if compact else self.hydrate(result, student_profile, index)
+        
+    def iter_recommendations(
+        self,
+        student_profile: Dict,
+        index: CatalogIndex,
+        top_k: int = 5,
+        first_chunk: int = 2048,
+        chunk_size: int = 32768,
+        compact: bool = False
+    ) -> Iterator[Tuple[int, Union[List[Dict], CompactRecommendations]]]:
+        """
+        recommend_indexed(), scored in catalog chunks with a snapshot per chunk
+        
+        Chunks start at `first_chunk` postings and double up to `chunk_size`,
+        so the first snapshot arrives quickly. Each snapshot is the exact top-k
+        of the postings scored so far; the last one equals recommend_indexed().
+        
+        Yields:
+            (postings scored so far, top-k of those postings)
+        """
+        if first_chunk < 1 or chunk_size < 1:
+            raise ValueError("Chunk sizes must be at least 1")
+        if self.career_goal_method == 'bm25':
+            # Build BM25 statistics over the whole catalog before slicing it
+            index.text_relevance
+        
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0)
+        best_breakdown = None
+        chunks = []
+        start, size = 0, min(first_chunk, chunk_size)
+        
+        while True:
+            stop = min(start + size, index.size)
+            columns = self._factor_columns(student_profile, index.take(slice(start, stop)))
+            chunks.append(columns)
+            factors = tuple(self._active_weights(columns))
+            if best_breakdown is None:
+                best_breakdown = np.empty((0, len(factors)))
+            scores = self._weighted_sum(columns, stop - start)
+            eligible = np.flatnonzero(scores > MIN_MATCH_SCORE)
+        
+            # Top-k of (previous top-k + this chunk) is the top-k of everything
+            # scored so far; previous rows come first, so catalog order holds
+            rows = np.concatenate([best_rows, eligible + start])
+            candidate_scores = np.concatenate([best_scores, scores[eligible]])
+            candidate_breakdown = np.concatenate([
+                best_breakdown,
+                np.column_stack([columns[key][eligible] for key in factors])
+            ])
+            keep = self._top_rows(candidate_scores, np.arange(len(rows)), top_k)
+            best_rows, best_scores, best_breakdown = rows[keep], candidate_scores[keep], candidate_breakdown[keep]
+        
+            result = CompactRecommendations(
+                tuple(index.ids[r] for r in best_rows.tolist()),
+                best_scores.copy(),
+                best_breakdown.copy(),
+                factors,
+                index.version
+            )
+        
+            if stop >= index.size:
+                # Whole-catalog columns, so rerank() can reuse this run
+                self._remember_columns(student_profile, index, {
+                    key: np.concatenate([c[key] for c in chunks]) for key in factors
+                })
+            yield stop, (result if compact else self.hydrate(result, student_profile, index))
+        
+            if stop >= index.size:
+                return
+            start, size = stop, min(size * 2, chunk_size)
+        
+    def rerank(
+        self,
+        student_profile: Dict,
+        index: CatalogIndex,
+        weights: Dict[str, float],
+        top_k: int = 5,
+        compact: bool = False,
+        constraints: Optional[RecommendationConstraints] = None
+    ) -> Union[List[Dict], CompactRecommendations]:
+        """
+        Re-rank with different factor weights without re-running any matching
+        
+        Reuses the factor columns kept from this profile's last scoring run
+        against `index` (computing them once if there is none), so a new
+        ranking costs a weighted sum plus top-k selection.
+        
+        Args:
+            weights: New weight per factor; factors left out keep theirs.
+                Weights are rescaled to sum to 1 so MIN_MATCH_SCORE keeps
+                its meaning.
+            constraints: Hard filters; top-k is picked among the postings
+                passing them, still from the cached columns.
+        """
+        unknown = set(weights) - set(self.weights)
+        if unknown:
+            raise ValueError(f"Unknown factors: {', '.join(sorted(unknown))}")
+        if not all(math.isfinite(w) and w >= 0 for w in weights.values()):
+            raise ValueError("Factor weights must be finite and non-negative")
+        columns = self._cached_columns(student_profile, index)
+        # A cold-start student has no collaborative column; its weight is ignored
+        base = self._active_weights(columns)
+        weights = {**base, **{key: w for key, w in weights.items() if key in base}}
+        total = sum(weights.values())
+        if total <= 0:
+            raise ValueError("At least one factor weight must be positive")
+        if abs(total - 1.0) > 1e-9:
+            weights = {key: w / total for key, w in weights.items()}
+        
+        rows = index.select(constraints)
+        if rows is not None:
+            columns = {key: column[rows] for key, column in columns.items()}
+            result = self._compact_top_k(columns, index.take(rows), top_k, weights)
+        else:
+            result = self._compact_top_k(columns, index, top_k, weights)
+        
+        return result if compact else self.hydrate(result, student_profile, index)
+    
+    def _constrained(
+        self,
+        index: CatalogIndex,
+        constraints: Optional[RecommendationConstraints]
+    ) -> Optional[CatalogIndex]:
+        """Sub-index of the postings passing `constraints` (None when nothing is filtered)"""
+        rows = index.select(constraints)
+        if rows is None:
+            return None
+        if self.career_goal_method == 'bm25':
+            # Keep BM25 statistics of the whole catalog in the sub-index
+            index.text_relevance
+        return index.take(rows)
+    
+    def _catalog_index(self, internships: List[Dict]) -> CatalogIndex:
+        """
+        CatalogIndex of a catalog list, reused while the same posting objects are passed
+        
+        Keyed on the identity of the list and of every posting in it, so a
+        replaced, added or removed posting builds a new index (postings
+        edited in place are not detected).
+        """
+        key = (id(internships), len(internships), hash(tuple(map(id, internships))))
+        with self._factor_cache_lock:
+            entry = self._index_cache.get(key)
+            if entry is not None and entry[0] is internships:
+                self._index_cache.move_to_end(key)
+                return entry[1]
+        index = CatalogIndex(internships)
+        with self._factor_cache_lock:
+            # The list is held too, so its id cannot be reused while cached
+            self._index_cache[key] = (internships, index)
+            while len(self._index_cache) > INDEX_CACHE_SIZE:
+                self._index_cache.popitem(last=False)
+        return index
+    
+    def _factor_cache_key(self, student: Dict, index: CatalogIndex) -> Tuple:
+        fields = tuple(
+            (field, tuple(value) if isinstance(value, list) else value)
+            for field, value in ((f, student.get(f)) for f in SCORING_FIELDS)
+        )
+        if self.collaborative is not None:
+            # Only the collaborative factor depends on who the student is; without
+            # it, sessions with the same inputs share one entry
+            fields += (('student_id', student.get('student_id')), ('model_version', self.collaborative.version))
+        return id(index), self.career_goal_method, fields
+    
+    def _remember_columns(self, student: Dict, index: CatalogIndex, columns: Dict[str, np.ndarray]):
+        """Keep a profile's factor columns for rerank() (least recently used are dropped)"""
+        if self.factor_cache_size <= 0:
+            return
+        key = self._factor_cache_key(student, index)
+        with self._factor_cache_lock:
+            self._factor_cache[key] = (index, columns)
+            self._factor_cache.move_to_end(key)
+            while len(self._factor_cache) > self.factor_cache_size:
+                self._factor_cache.popitem(last=False)
+    
+    def _cached_columns(self, student: Dict, index: CatalogIndex) -> Dict[str, np.ndarray]:
+        key = self._factor_cache_key(student, index)
+        with self._factor_cache_lock:
+            entry = self._factor_cache.get(key)
+            if entry is not None and entry[0] is index:
+                self._factor_cache.move_to_end(key)
+                return entry[1]
+        columns = self._factor_columns(student, index)
+        self._remember_columns(student, index, columns)
+        return columns
+    
+    def hydrate(
+        self,
+        compact: CompactRecommendations,
+        student_profile: Dict,
+        index: CatalogIndex
+    ) -> List[Dict]:
+        """
+        Expand compact results into full recommendation dicts
+        
+        Postings that no longer exist in the index are skipped.
+        """
+        recommendations = []
+        for posting_id, score, row in compact:
+            internship = index.get(posting_id)
+            if internship is not None:
+                recommendations.append(self._build_recommendation(
+                    student_profile, internship, score, dict(zip(compact.factors, row))
+                ))
+        return recommendations
+    
+    def _compact_top_k(
+        self,
+        columns: Dict[str, np.ndarray],
+        index: CatalogIndex,
+        top_k: int,
+        weights: Optional[Dict[str, float]] = None
+    ) -> CompactRecommendations:
+        """Top-k of one student's factor columns as a compact record"""
+        start = time.perf_counter()
+        scores = self._weighted_sum(columns, index.size, weights)
+        eligible = np.flatnonzero(scores > MIN_MATCH_SCORE)
+        
+        if self.instrumentation is not None:
+            self.instrumentation.record('recommender_scoring_seconds_total', time.perf_counter() - start, path='indexed')
+            self.instrumentation.record('recommender_postings_scored_total', index.size, path='indexed')
+            self.instrumentation.record('recommender_postings_above_threshold_total', len(eligible), path='indexed')
+        
+        rows = self._top_rows(scores, eligible, top_k)
+        
+        factors = tuple(self._active_weights(columns))
+        breakdown = np.empty((len(rows), len(factors)))
+        for col, key in enumerate(factors):
+            breakdown[:, col] = columns[key][rows]
+        
+        return CompactRecommendations(
+            tuple(index.ids[r] for r in rows),
+            scores[rows].copy(),
+            breakdown,
+            factors,
+            index.version
+        )
+    
+    def _build_recommendation(
+        self,
+        student_profile: Dict,
+        internship: Dict,
+        score: float,
+        breakdown: Dict
+    ) -> Dict:
+        """Attach score, explanation, gaps and success probability to a posting"""
+        
+        # Generate explanation
+        reasons = self._generate_match_reasons(breakdown, student_profile, internship)
+        
+        # Identify skill gaps
+        gaps = self._identify_skill_gaps(
+            student_profile.get('skills', []),
+            internship['required_skills']
+        )
+        
+        # Success probability
+        success_prob = self._calculate_success_probability(score, breakdown)
+        
+        return {
+            **internship,
+            'match_score': round(score, 3),
+            'match_percentage': round(score * 100, 1),
+            'match_reasons': reasons,
+            'skill_gaps': gaps,
+            'success_probability': round(success_prob, 3),
+            'breakdown': breakdown
+        }
+    
+    def _top_rows(self, scores: np.ndarray, rows: np.ndarray, top_k: int) -> List[int]:
+        """Pick the top_k rows, ordered exactly like recommend() sorts them"""
+        
+        # recommend() sorts on the score rounded to 3 places and keeps catalog
+        # order for ties, so keep every row that can round level with the k-th
+        if 0 < top_k < len(rows):
+            kth = np.partition(scores[rows], -top_k)[-top_k]
+            cutoff = round(float(kth), 3) - 0.0005 - 1e-9
+            rows = rows[scores[rows] >= cutoff]
+        
+        ordered = sorted(rows.tolist(), key=lambda r: round(float(scores[r]), 3), reverse=True)
+        return ordered[:top_k]
+    
+    def recommend_batch(
+        self,
+        student_profiles: List[Dict],
+        index: CatalogIndex,
+        top_k: Union[int, List[int]] = 5,
+        compact: bool = False
+    ) -> List[Union[List[Dict], CompactRecommendations]]:
+        """
+        recommend_indexed() for many students in one pass over the catalog
+        
+        Factor columns are shared between students with the same inputs
+        (e.g. the same preferred locations or education level), so a batch
+        costs less than scoring each student on its own.
+        
+        Args:
+            student_profiles: Profiles to score together
+            index: Prebuilt CatalogIndex
+            top_k: One top-k for all students, or one per student
+            compact: Return CompactRecommendations instead of dicts
+            
+        Returns:
+            One recommendation list per profile, in input order
+        """
+        top_ks = top_k if isinstance(top_k, list) else [top_k] * len(student_profiles)
+        cache = {}
+        results = []
+        
+        for student, k in zip(student_profiles, top_ks):
+            columns = self._factor_columns(student, index, cache)
+            self._remember_columns(student, index, columns)
+            result = self._compact_top_k(columns, index, k)
+            results.append(result if compact else self.hydrate(result, student, index))
+        
+        return results
+    
+    def score_index(self, student: Dict, index: CatalogIndex) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every posting of a CatalogIndex for one student
+        
+        Returns:
+            (scores, breakdown matrix) with one row per posting and the
+            matrix columns in weights_for(student) order
+        """
+        columns = self._factor_columns(student, index)
+        factors = tuple(self._active_weights(columns))
+        matrix = np.column_stack([columns[key] for key in factors]) if index.size \
+            else np.empty((0, len(factors)))
+        
+        return self._weighted_sum(columns, index.size), matrix
+    
+    def _weighted_sum(
+        self,
+        columns: Dict[str, np.ndarray],
+        n: int,
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """Weighted sum, accumulated in the same order as _calculate_match_score"""
+        weights = weights or self._active_weights(columns)
+        scores = np.zeros(n)
+        for key in weights:
+            scores = scores + columns[key] * weights[key]
+        return scores
+    
+    def _factor_columns(
+        self,
+        student: Dict,
+        index: CatalogIndex,
+        cache: Optional[Dict] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Per-factor score arrays over the whole catalog
+        
+        With a cache dict, columns are reused for any later student whose
+        inputs to that factor are identical.
+        """
+        cache = {} if cache is None else cache
+        n = index.size
+        
+        def column(factor, key, compute):
+            if (factor, key) not in cache:
+                if self.instrumentation is None:
+                    cache[(factor, key)] = compute()
+                else:
+                    start = time.perf_counter()
+                    cache[(factor, key)] = compute()
+                    self.instrumentation.record(
+                        'recommender_factor_seconds_total', time.perf_counter() - start, factor=factor, path='indexed'
+                    )
+                    self.instrumentation.record('recommender_factor_postings_total', n, factor=factor, path='indexed')
+            return cache[(factor, key)]
+        
+        # 1. Skills matching
+        expanded_student = frozenset(self._expand_skills(
+            set(s.lower().strip() for s in student.get('skills', []))
+        ))
+        
+        def skills():
+            # Intersections as bitmap AND + popcount over the catalog's skill vocabulary
+            student_words = index.vocabulary.encode_words(expanded_student)
+            
+            def coverage(bitmap, counts):
+                matches = popcount_rows(bitmap & student_words)
+                ratio = np.divide(matches, counts, out=np.ones(n), where=counts > 0)
+                return np.minimum(ratio, 1.0)
+            
+            return 0.7 * coverage(index.required_bitmap, index.required_counts) \
+                + 0.3 * coverage(index.preferred_bitmap, index.preferred_counts)
+        
+        # 2. Interest alignment
+        interests = tuple(i.lower() for i in student.get('interests', []))
+        
+        def interest():
+            if not interests:
+                return np.full(n, 0.6)
+            return np.array([
+                min(sum(1 for i in interests if i in text) / max(len(interests), 1), 1.0)
+                for text in index.interest_text
+            ], dtype=np.float64)
+        
+        # 3. Experience fit
+        experience_months = student.get('experience_months', 0)
+        education = student.get('education', '')
+        
+        def experience():
+            return self._match_experience_array(experience_months, education, index.experience_required)
+        
+        # 4. Location match (once per distinct location)
+        preferred_locations = tuple(student.get('preferred_locations', []))
+        
+        def location():
+            # Class attribute on purpose: bypasses per-call instrumentation hooks,
+            # the whole column is timed by column()
+            location_scores = np.array([
+                InternshipRecommender._match_location(self, list(preferred_locations), loc)
+                for loc in index.location_values
+            ], dtype=np.float64)
+            return location_scores[index.location_codes] if n else np.empty(0)
+        
+        # 5. Career goals alignment
+        goals = student.get('career_goals', '')
+        goal_keywords = frozenset(goals.lower().split())
+        goal_key = (self.career_goal_method, goal_keywords if self.career_goal_method == 'overlap' else goals)
+        
+        def career():
+            if not goal_keywords:
+                return np.full(n, 0.5)
+            if self.career_goal_method == 'bm25':
+                return np.minimum(index.text_relevance.score(goals) * 2, 1.0)
+            overlap = index.career_token_sets.overlap(goal_keywords)
+            return np.minimum(overlap / len(goal_keywords) * 2, 1.0)
+        
+        columns = {
+            'skills_match': column('skills_match', expanded_student, skills),
+            'interest_alignment': column('interest_alignment', interests, interest),
+            'experience_fit': column(
+                'experience_fit', (experience_months, self._education_boost(education)), experience
+            ),
+            'location_match': column('location_match', preferred_locations, location),
+            'career_goals': column('career_goals', goal_key, career)
+        }
+        
+        # 6. Collaborative signal (optional): one dot product per posting,
+        # skipped for students the model has no events for
+        model = self.collaborative
+        student_id = student.get('student_id')
+        if model is not None and model.knows(student_id):
+            columns['collaborative'] = column(
+                'collaborative', (id(model), model.version, student_id), lambda: model.scores(student_id, index)
+            )
+        
+        return columns
+    
     def _calculate_match_score(
         self,
         student: Dict,
@@ -135,10 +775,16 @@ class InternshipRecommender:
         )
         breakdown['career_goals'] = career_score
         
+        # 6. Collaborative signal (only when enabled and the student has events)
+        model = self.collaborative
+        if model is not None and model.knows(student.get('student_id')):
+            breakdown['collaborative'] = model.score(student.get('student_id'), internship.get('id'))
+        
         # Calculate weighted sum
+        weights = self._active_weights(breakdown)
         total_score = sum(
-            breakdown[key] * self.weights[key]
-            for key in self.weights.keys()
+            breakdown[key] * weights[key]
+            for key in weights.keys()
         )
         
         return total_score, breakdown
@@ -151,25 +797,26 @@ class InternshipRecommender:
     ) -> float:
         """Match student skills with job requirements"""
         
-        # Normalize to lowercase
-        student_set = set(s.lower().strip() for s in student_skills)
-        required_set = set(s.lower().strip() for s in required_skills)
-        preferred_set = set(s.lower().strip() for s in preferred_skills)
+        # Normalized skill sets as bitmasks over the shared registry (postings first,
+        # so a student skill a posting lists always has its bit)
+        required_mask = SKILLS.add(required_skills)
+        preferred_mask = SKILLS.add(preferred_skills)
+        student_mask, unknown = SKILLS.split(student_skills)
         
         # Expand skills using synonyms
-        expanded_student = self._expand_skills(student_set)
+        expanded_student = self._expand_mask(student_mask, unknown)
         
         # Required skills match (70% weight)
-        if required_set:
-            required_matches = len(expanded_student & required_set)
-            required_score = min(required_matches / len(required_set), 1.0)
+        if required_mask:
+            required_matches = popcount(expanded_student & required_mask)
+            required_score = min(required_matches / popcount(required_mask), 1.0)
         else:
             required_score = 1.0
         
         # Preferred skills match (30% weight)
-        if preferred_set:
-            preferred_matches = len(expanded_student & preferred_set)
-            preferred_score = min(preferred_matches / len(preferred_set), 1.0)
+        if preferred_mask:
+            preferred_matches = popcount(expanded_student & preferred_mask)
+            preferred_score = min(preferred_matches / popcount(preferred_mask), 1.0)
         else:
             preferred_score = 1.0
         
@@ -177,15 +824,46 @@ class InternshipRecommender:
     
     def _expand_skills(self, skills: set) -> set:
         """Expand skills using synonyms for better matching"""
-        expanded = set(skills)
+        mask, unknown = SKILLS.split(skills)
+        return set(skills) | set(SKILLS.names(self._expand_mask(mask, unknown) & ~mask))
+    
+    def _expand_mask(self, mask: int, unknown: Tuple[str, ...] = ()) -> int:
+        """_expand_skills on a skill bitmask plus the names SKILLS.split() left out"""
+        if self._expansion_source is not self.skill_synonyms:
+            self._expansion_source = self.skill_synonyms
+            self._skill_expansions = {}
+            self._student_expansions = {}
         
-        for skill in skills:
-            for category, synonyms in self.skill_synonyms.items():
-                if skill in synonyms or category in skill:
-                    expanded.update(synonyms)
+        expanded = self._student_expansions.get(mask)
+        if expanded is None:
+            expanded = mask
+            for skill_id in SKILLS.ids_of(mask):
+                expanded |= self._skill_expansion(skill_id)
+            if len(self._student_expansions) > 4096:
+                self._student_expansions = {}
+            self._student_expansions[mask] = expanded
         
+        # Skills outside the registry match nothing themselves, but can still pull in
+        # synonyms; not cached, so untrusted names are never kept
+        for skill in unknown:
+            expanded |= self._synonyms_of(skill)
         return expanded
     
+    def _skill_expansion(self, skill_id: int) -> int:
+        """_synonyms_of a registered skill, cached per id"""
+        expansion = self._skill_expansions.get(skill_id)
+        if expansion is None:
+            expansion = self._skill_expansions[skill_id] = self._synonyms_of(SKILLS.skills[skill_id])
+        return expansion
+    
+    def _synonyms_of(self, skill: str) -> int:
+        """Synonyms one skill pulls in: lists it belongs to, or whose category it contains"""
+        expansion = 0
+        for category, synonyms in self.skill_synonyms.items():
+            if skill in synonyms or category in skill:
+                expansion |= SKILLS.add(synonyms)
+        return expansion
+    
     def _match_interests(
         self,
         student_interests: List[str],
@@ -217,12 +895,7 @@ class InternshipRecommender:
         """Match experience level"""
         
         # Education boost
-        education_boost = 0.0
-        edu_lower = education.lower()
-        if 'master' in edu_lower or 'phd' in edu_lower or 'm.tech' in edu_lower:
-            education_boost = 0.25
-        elif 'bachelor' in edu_lower or 'b.tech' in edu_lower or 'b.e' in edu_lower:
-            education_boost = 0.15
+        education_boost = self._education_boost(education)
         
         # Experience matching
         if required_exp == 0:
@@ -237,6 +910,33 @@ class InternshipRecommender:
         
         return min(exp_score + education_boost, 1.0)
     
+    def _education_boost(self, education: str) -> float:
+        """Experience boost granted by the education level"""
+        edu_lower = education.lower()
+        if 'master' in edu_lower or 'phd' in edu_lower or 'm.tech' in edu_lower:
+            return 0.25
+        elif 'bachelor' in edu_lower or 'b.tech' in edu_lower or 'b.e' in edu_lower:
+            return 0.15
+        return 0.0
+    
+    def _match_experience_array(
+        self,
+        student_exp: int,
+        education: str,
+        required_exp: np.ndarray
+    ) -> np.ndarray:
+        """_match_experience over an array of required experience"""
+        
+        education_boost = self._education_boost(education)
+        
+        exp_score = np.where(
+            (required_exp == 0) | (student_exp >= required_exp),
+            1.0,
+            student_exp / np.maximum(required_exp, 1)
+        )
+        
+        return np.minimum(exp_score + education_boost, 1.0)
+    
     def _match_location(
         self,
         preferred_locations: List[str],
@@ -299,16 +999,13 @@ class InternshipRecommender:
     ) -> List[str]:
         """Identify missing skills"""
         
-        student_set = set(s.lower().strip() for s in student_skills)
-        required_set = set(s.lower().strip() for s in required_skills)
+        required_mask = SKILLS.add(required_skills)
         
         # Expand student skills
-        expanded_student = self._expand_skills(student_set)
+        expanded_student = self._expand_mask(*SKILLS.split(student_skills))
         
-        # Find gaps
-        gaps = list(required_set - expanded_student)
-        
-        return gaps
+        # Find gaps (decoded to names only here, for displayed results)
+        return SKILLS.names(required_mask & ~expanded_student)
     
     def _calculate_success_probability(self, match_score: float, breakdown: Dict) -> float:
         """Estimate application success probability"""
@@ -326,50 +1023,34 @@ class InternshipRecommender:
         
         return min(base_prob, 0.95)  # Cap at 95%
     
+    # Plain function (no reference back to the recommender) unless instrumented
+    _render_match_reasons = staticmethod(render_match_reasons)
+    
     def _generate_match_reasons(
         self,
         breakdown: Dict,
         student: Dict,
         internship: Dict
-    ) -> List[str]:
-        """Generate human-readable match reasons"""
-        
-        reasons = []
+    ) -> MatchReasons:
+        """
+        Generate human-readable match reasons
         
-        # Skills
-        if breakdown.get('skills_match', 0) > 0.7:
-            matched_skills = set(s.lower() for s in student.get('skills', [])) & \
-                           set(s.lower() for s in internship['required_skills'])
-            if matched_skills:
-                skill_list = ', '.join(list(matched_skills)[:3])
-                reasons.append(f"✅ Strong skill match: {skill_list}")
+        Only the facts are collected here; the strings are rendered when the
+        reasons are first read (see models.explanations).
+        """
+        strong_skills = breakdown.get('skills_match', 0) > 0.7
         
-        # Experience
-        if breakdown.get('experience_fit', 0) > 0.8:
-            exp = student.get('experience_months', 0)
-            if exp > 0:
-                reasons.append(f"✅ Your {exp} months experience aligns well")
-            else:
-                reasons.append(f"✅ Perfect for entry-level candidates")
-        
-        # Location
-        if breakdown.get('location_match', 0) > 0.9:
-            reasons.append(f"✅ Matches your location preference")
-        
-        # Career goals
-        if breakdown.get('career_goals', 0) > 0.6:
-            reasons.append(f"✅ Aligns with your career aspirations")
-        
-        # Company prestige
-        top_companies = ['google', 'microsoft', 'amazon', 'meta', 'apple']
-        if any(company in internship['company'].lower() for company in top_companies):
-            reasons.append(f"🌟 Top-tier company: {internship['company']}")
-        
-        # High stipend
-        if internship.get('stipend', 0) >= 50000:
-            reasons.append(f"💰 Competitive stipend: ₹{internship['stipend']:,}/month")
-        
-        return reasons[:5]  # Top 5 reasons
+        return MatchReasons((
+            strong_skills,
+            breakdown.get('experience_fit', 0) > 0.8,
+            breakdown.get('location_match', 0) > 0.9,
+            breakdown.get('career_goals', 0) > 0.6,
+            tuple(student.get('skills', [])) if strong_skills else (),
+            tuple(internship['required_skills']) if strong_skills else (),
+            student.get('experience_months', 0),
+            internship['company'],
+            internship.get('stipend', 0)
+        ), self._render_match_reasons)
 
 def calculate_profile_strength(student: Dict) -> Dict:
     """Calculate student profile strength score"""
@@ -0,0 +1,159 @@
+"""
+Approximate Candidate Retrieval - Hashed embeddings + IVF index
+Fetches a few thousand likely matches so exact scoring only runs on those
+"""
+
+import zlib
+import numpy as np
+from typing import Dict, Iterable, Tuple
+
+from models.catalog_index import CatalogIndex, normalize_skills
+from models.text_relevance import tokenize
+
+# Feature weights roughly follow the recommender's factor weights
+SKILL_REQUIRED_WEIGHT = 3.0
+SKILL_PREFERRED_WEIGHT = 1.5
+TERM_WEIGHT = 0.5
+DEPARTMENT_WEIGHT = 1.0
+LOCATION_WEIGHT = 1.0
+
+# Default search width: fraction of inverted lists probed and of the catalog kept for
+# exact scoring (bench_retrieval.py recall@10: ~0.94 at 10k postings, ~0.93 at 100k)
+PROBE_FRACTION = 0.5
+CANDIDATE_FRACTION = 0.1
+MIN_CANDIDATES = 2000
+
+def hash_features(features: Iterable[Tuple[str, float]], dim: int) -> np.ndarray:
+    """
+    Signed feature hashing into a dense, L2-normalized vector
+
+    crc32 keeps the hash stable across processes (str hash() is salted).
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    for token, weight in features:
+        h = zlib.crc32(token.encode('utf-8'))
+        vector[h % dim] += weight if (h >> 31) & 1 else -weight
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+class CandidateRetriever:
+    """
+    In-process IVF index over hashed posting embeddings.
+
+    Postings are embedded from skills, description/title terms, department
+    and location; k-means centroids partition them into inverted lists.
+    A profile probes its n_probe nearest lists and the best n_candidates
+    postings by dot product go on to exact scoring. Larger n_probe /
+    n_candidates trade latency for recall.
+
+    By default half the lists are probed and a tenth of the catalog (at least
+    MIN_CANDIDATES) is kept, which reaches ~0.93 recall@10 on the synthetic
+    benchmark at 10k and 100k postings for 2-3x less latency than exact scoring.
+    A fixed n_probe=8 / n_candidates=2000 is ~5x faster at 100k but only reaches
+    ~0.58 recall at 10k and ~0.47 at 100k.
+    """
+
+    def __init__(
+        self,
+        index: CatalogIndex,
+        recommender,
+        dim: int = 256,
+        n_lists: int = None,
+        kmeans_iters: int = 10,
+        seed: int = 0
+    ):
+        self.index = index
+        self.recommender = recommender
+        self.dim = dim
+
+        self.embeddings = np.vstack([
+            self._embed_posting(internship) for internship in index.internships
+        ]) if index.size else np.zeros((0, dim), dtype=np.float32)
+
+        self.n_lists = n_lists or max(int(np.sqrt(index.size)), 1)
+        self.centroids, assignment = self._kmeans(min(self.n_lists, max(index.size, 1)), kmeans_iters, seed)
+
+        # Inverted lists in CSR form: rows of list c are order[offsets[c]:offsets[c + 1]]
+        self.order = np.argsort(assignment, kind='stable')
+        self.offsets = np.searchsorted(assignment[self.order], np.arange(len(self.centroids) + 1))
+
+    def _embed_posting(self, internship: Dict) -> np.ndarray:
+        features = [('skill:' + s, SKILL_REQUIRED_WEIGHT) for s in normalize_skills(internship['required_skills'])]
+        features += [('skill:' + s, SKILL_PREFERRED_WEIGHT)
+                     for s in normalize_skills(internship.get('preferred_skills', []))]
+        features += [('term:' + t, TERM_WEIGHT)
+                     for t in set(tokenize(f"{internship['title']} {internship['description']}"))]
+        features.append(('dept:' + internship.get('department', '').lower(), DEPARTMENT_WEIGHT))
+        features.append(('loc:' + internship.get('location', '').lower(), LOCATION_WEIGHT))
+        return hash_features(features, self.dim)
+
+    def embed_profile(self, profile: Dict) -> np.ndarray:
+        """Profile vector in the same space as the postings"""
+        skills = self.recommender._expand_skills(set(s.lower().strip() for s in profile.get('skills', [])))
+        features = [('skill:' + s, SKILL_REQUIRED_WEIGHT) for s in skills]
+        text = ' '.join(profile.get('interests', [])) + ' ' + profile.get('career_goals', '')
+        features += [('term:' + t, TERM_WEIGHT) for t in set(tokenize(text))]
+        features += [('dept:' + i.lower(), DEPARTMENT_WEIGHT) for i in profile.get('interests', [])]
+        features += [('loc:' + loc.lower(), LOCATION_WEIGHT) for loc in profile.get('preferred_locations', [])]
+        return hash_features(features, self.dim)
+
+    def _kmeans(self, k: int, iters: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Spherical k-means (cosine) on the posting embeddings"""
+        n = len(self.embeddings)
+        if n == 0:
+            return np.zeros((1, self.dim), dtype=np.float32), np.zeros(0, dtype=np.int64)
+
+        rng = np.random.default_rng(seed)
+        centroids = self.embeddings[rng.choice(n, size=k, replace=False)].copy()
+        # Train on a sample for big catalogs, then assign everything once
+        sample = self.embeddings[rng.choice(n, size=min(n, 50000), replace=False)]
+        for _ in range(iters):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(k):
+                members = sample[labels == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[c] = centroid / norm if norm else centroid
+
+        assignment = np.empty(n, dtype=np.int64)
+        for start in range(0, n, 65536):
+            block = self.embeddings[start:start + 65536]
+            assignment[start:start + 65536] = np.argmax(block @ centroids.T, axis=1)
+        return centroids, assignment
+
+    def candidates(self, profile: Dict, n_candidates: int = None, n_probe: int = None) -> np.ndarray:
+        """Ascending row numbers of the approximate best matches"""
+        if n_candidates is None:
+            n_candidates = max(MIN_CANDIDATES, int(self.index.size * CANDIDATE_FRACTION))
+        if n_probe is None:
+            n_probe = max(int(len(self.centroids) * PROBE_FRACTION), 1)
+        if self.index.size <= n_candidates:
+            return np.arange(self.index.size)
+
+        query = self.embed_profile(profile)
+        n_probe = min(n_probe, len(self.centroids))
+        probe = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+        rows = np.concatenate([self.order[self.offsets[c]:self.offsets[c + 1]] for c in probe])
+
+        if len(rows) > n_candidates:
+            similarity = self.embeddings[rows] @ query
+            rows = rows[np.argpartition(-similarity, n_candidates - 1)[:n_candidates]]
+        return np.sort(rows)
+
+    def recommend(
+        self,
+        profile: Dict,
+        top_k: int = 5,
+        n_candidates: int = None,
+        n_probe: int = None,
+        compact: bool = False
+    ):
+        """Exact scoring over the retrieved candidates only"""
+        candidates = self.candidates(profile, n_candidates, n_probe)
+        if self.recommender.career_goal_method == 'bm25':
+            # Build BM25 statistics over the whole catalog before take() copies them
+            self.index.text_relevance
+        sub_index = self.index.take(candidates)
+        result = self.recommender.recommend_indexed(profile, sub_index, top_k, compact=True)
+        return result if compact else self.recommender.hydrate(result, profile, self.index)
@@ -0,0 +1,190 @@
+"""
+Learning Roadmaps - Skill prerequisite graph
+Orders a set of skill gaps into a learning path (prerequisites first, then
+skills related to what the student knows) and packs it into weekly steps;
+paths are memoized by gap-set signature
+"""
+
+import heapq
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Iterable, Tuple, FrozenSet
+
+DEFAULT_GRAPH = Path(__file__).resolve().parent.parent / 'data' / 'skill_graph.json'
+
+def _normalize(skills: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(s.lower().strip() for s in skills if s and s.strip()))
+
+class SkillGraph:
+    """
+    Prerequisite / relatedness graph over normalized skill names.
+
+    learning_path() returns the gaps plus every prerequisite the student
+    does not know yet, in topological order. Among skills that are ready at
+    the same time, prerequisites shared by more gaps come first, then skills
+    related to one the student knows (a head start), then the order the
+    gaps were given in. Relatedness is symmetric. Skills missing from the
+    graph have no prerequisites and no related skills.
+    """
+
+    def __init__(self, prerequisites: Dict[str, List[str]], related: Dict[str, List[str]] = None):
+        self.prerequisites = {
+            skill.lower().strip(): _normalize(required) for skill, required in prerequisites.items()
+        }
+        self.related = {skill.lower().strip(): _normalize(others) for skill, others in (related or {}).items()}
+        self._neighbours: Dict[str, set] = {}
+        for skill, others in self.related.items():
+            for other in others:
+                self._neighbours.setdefault(skill, set()).add(other)
+                self._neighbours.setdefault(other, set()).add(skill)
+        self._check_acyclic()
+
+        self._closure = lru_cache(maxsize=4096)(self._build_closure)
+        self._known = lru_cache(maxsize=4096)(self._build_known)
+        self._path = lru_cache(maxsize=16384)(self._build_path)
+        self._roadmap = lru_cache(maxsize=16384)(self._build_roadmap)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_GRAPH) -> 'SkillGraph':
+        """Graph from a JSON file shaped like data/skill_graph.json"""
+        with open(path, 'r', encoding='utf-8') as f:
+            skills = json.load(f)['skills']
+        return cls(
+            {skill: node.get('prerequisites', []) for skill, node in skills.items()},
+            {skill: node.get('related', []) for skill, node in skills.items()}
+        )
+
+    def _check_acyclic(self):
+        state = {}
+
+        def visit(skill, trail):
+            if state.get(skill) == 'done':
+                return
+            if state.get(skill) == 'visiting':
+                raise ValueError(f"Prerequisite cycle: {' -> '.join(trail + [skill])}")
+            state[skill] = 'visiting'
+            for required in self.prerequisites.get(skill, ()):
+                visit(required, trail + [skill])
+            state[skill] = 'done'
+
+        for skill in self.prerequisites:
+            visit(skill, [])
+
+    def ancestors(self, skill: str) -> FrozenSet[str]:
+        """Every direct or indirect prerequisite of a skill"""
+        return self._closure((skill,)).difference((skill,))
+
+    def _build_closure(self, skills: Tuple[str, ...]) -> FrozenSet[str]:
+        closure = set()
+        stack = list(skills)
+        while stack:
+            skill = stack.pop()
+            if skill not in closure:
+                closure.add(skill)
+                stack.extend(self.prerequisites.get(skill, ()))
+        return frozenset(closure)
+
+    def _build_known(self, known: FrozenSet[str]) -> FrozenSet[str]:
+        # Knowing a skill implies knowing what it builds on
+        return self._closure(tuple(sorted(known)))
+
+    def _familiar(self, skills: FrozenSet[str], known: FrozenSet[str]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """(skill, related skills the student knows) for each of `skills` with a head start"""
+        return tuple(
+            (skill, tuple(sorted(self._neighbours[skill] & known)))
+            for skill in sorted(skills)
+            if skill not in known and self._neighbours.get(skill, set()) & known
+        )
+
+    def _build_path(
+        self,
+        gaps: Tuple[str, ...],
+        known: FrozenSet[str],
+        familiar: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+    ) -> Tuple[str, ...]:
+        targets = set(gaps)
+        needed = {s for s in self._closure(gaps) if s in targets or s not in known}
+
+        # How many gaps each needed skill unlocks (for ordering shared prerequisites)
+        shared = {skill: sum(1 for gap in gaps if skill in self._closure((gap,))) for skill in needed}
+        first_seen = {}
+        for gap in gaps:
+            for skill in sorted(self._closure((gap,)) & needed):
+                first_seen.setdefault(skill, len(first_seen))
+
+        waiting = {skill: len(set(self.prerequisites.get(skill, ())) & needed) for skill in needed}
+        unlocks = {skill: [] for skill in needed}
+        for skill in needed:
+            for required in set(self.prerequisites.get(skill, ())) & needed:
+                unlocks[required].append(skill)
+
+        head_start = {skill for skill, _ in familiar}
+        order = {s: (-shared[s], s not in head_start, first_seen[s], s) for s in needed}
+        ready = [order[s] for s in needed if waiting[s] == 0]
+        heapq.heapify(ready)
+        path = []
+        while ready:
+            skill = heapq.heappop(ready)[-1]
+            path.append(skill)
+            for dependent in unlocks[skill]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    heapq.heappush(ready, order[dependent])
+        return tuple(path)
+
+    def learning_path(self, gaps: Iterable[str], known_skills: Iterable[str] = ()) -> List[str]:
+        """Gaps and their unknown prerequisites, in learning order"""
+        gaps = _normalize(gaps)
+        if not gaps:
+            return []
+        return list(self._path(gaps, *self._context(gaps, known_skills)))
+
+    def _context(self, gaps: Tuple[str, ...], known_skills: Iterable[str]) -> Tuple:
+        """(known, familiar) cache-key parts: only what touches the gaps' closure affects the path"""
+        closure = self._closure(gaps)
+        known = self._known(frozenset(_normalize(known_skills)))
+        return known & closure, self._familiar(closure, known)
+
+    def roadmap(self, gaps: Iterable[str], known_skills: Iterable[str] = (), weeks: int = 4) -> Dict[str, str]:
+        """Learning path spread over `weeks` weeks, or one per task if shorter ({'Week 1': task, ...})"""
+        gaps = _normalize(gaps)
+        if not gaps:
+            return {}
+        return dict(self._roadmap(gaps, *self._context(gaps, known_skills), weeks))
+
+    def _build_roadmap(
+        self,
+        gaps: Tuple[str, ...],
+        known: FrozenSet[str],
+        familiar: Tuple[Tuple[str, Tuple[str, ...]], ...],
+        weeks: int
+    ) -> Tuple[Tuple[str, str], ...]:
+        path = self._path(gaps, known, familiar)
+        related_known = dict(familiar)
+        tasks = []
+        for skill in path:
+            if skill in gaps and skill in related_known:
+                tasks.append(f"Learn {skill} fundamentals (builds on your {', '.join(related_known[skill])}) "
+                             f"and build 1 small project")
+            elif skill in gaps:
+                tasks.append(f"Learn {skill} fundamentals and build 1 small project")
+            else:
+                needed_for = [gap for gap in gaps if skill in self._closure((gap,))]
+                tasks.append(f"Learn {skill} first (prerequisite for {', '.join(needed_for)})")
+
+        # Spread evenly so every week has work: exactly `weeks` weeks, or one per task if fewer
+        weeks = min(weeks, len(tasks))
+        bounds = [n * len(tasks) // weeks for n in range(weeks + 1)]
+        return tuple(
+            (f"Week {n + 1}", '; '.join(tasks[bounds[n]:bounds[n + 1]]))
+            for n in range(weeks)
+        )
+
+    def cache_info(self) -> Dict[str, Tuple]:
+        """Hit/miss counters of the memoized paths and closures"""
+        return {
+            'roadmaps': self._roadmap.cache_info(),
+            'paths': self._path.cache_info(),
+            'closures': self._closure.cache_info()
+        }
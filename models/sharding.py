@@ -0,0 +1,276 @@
+"""
+Sharded Recommender - Parallel scoring over catalog shards
+Each worker process keeps one contiguous shard indexed in memory; a query is
+fanned out to every shard and the per-shard top-k lists are merged
+"""
+
+import heapq
+import itertools
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Dict, Optional, Union
+
+import numpy as np
+
+from models.catalog_index import CatalogIndex
+from models.compact_results import CompactRecommendations
+from models.recommender import InternshipRecommender
+from models.text_relevance import TextRelevanceIndex
+
+# How often the pool checks that its shard processes are still alive
+HEALTH_CHECK_S = 1.0
+
+def _shard_worker(internships: List[Dict], config: Dict, tasks, results, bm25: Optional[Dict] = None):
+    """Process entry point: index one shard once, then score requests until told to stop"""
+    recommender = InternshipRecommender(config['career_goal_method'])
+    recommender.weights = config['weights']
+    recommender.skill_synonyms = config['skill_synonyms']
+    recommender.collaborative = config['collaborative']
+    recommender.content_weights = config['content_weights']
+    recommender.factor_cache_size = 0
+    index = CatalogIndex(internships)
+    if bm25 is not None:
+        # This shard's part of the full-catalog BM25 index (catalog-wide IDF)
+        index.text_relevance = TextRelevanceIndex.from_features(bm25)
+    results.put(('ready', None))
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        request_id, profiles, top_ks = task
+        try:
+            outcome = recommender.recommend_batch(profiles, index, top_ks, compact=True)
+        except Exception as e:
+            try:
+                pickle.dumps(e)
+                outcome = e
+            except Exception:
+                outcome = RuntimeError(f"{type(e).__name__}: {e}")
+        results.put((request_id, outcome))
+
+class ShardedRecommender:
+    """
+    recommend_indexed() results computed by a pool of shard processes.
+
+    The catalog is split into n_shards contiguous ranges and each range is
+    sent to its worker once, at start-up; requests only carry profiles.
+    Every shard returns its own top-k, and a k-way merge on
+    (rounded score, catalog position) yields exactly the ranking of
+    scoring the whole catalog in one process. With BM25 career goals the
+    term statistics are computed once over the whole catalog and each
+    shard gets its slice of the weights.
+
+    If a shard process dies, pending and later requests fail with
+    RuntimeError instead of waiting for it.
+    """
+
+    def __init__(
+        self,
+        internships: List[Dict],
+        n_shards: Optional[int] = None,
+        recommender: Optional[InternshipRecommender] = None,
+        start_method: Optional[str] = None,
+        startup_timeout: Optional[float] = None
+    ):
+        self.internships = internships
+        self.recommender = recommender or InternshipRecommender()
+        self.n_shards = max(1, min(n_shards or os.cpu_count() or 1, max(len(internships), 1)))
+
+        self.ids = [i.get('id', f"ROW{n}") for n, i in enumerate(internships)]
+        self.position = {pid: n for n, pid in enumerate(self.ids)}
+
+        config = {
+            'career_goal_method': self.recommender.career_goal_method,
+            'weights': dict(self.recommender.weights),
+            'skill_synonyms': self.recommender.skill_synonyms,
+            'collaborative': self.recommender.collaborative,
+            'content_weights': self.recommender.content_weights,
+        }
+        context = multiprocessing.get_context(start_method)
+        self._results = context.Queue()
+        self._tasks = []
+        self._workers = []
+        bounds = np.linspace(0, len(internships), self.n_shards + 1).astype(int)
+        text_relevance = None
+        if self.recommender.career_goal_method == 'bm25':
+            text_relevance = TextRelevanceIndex.from_internships(internships)
+        for shard in range(self.n_shards):
+            start, stop = int(bounds[shard]), int(bounds[shard + 1])
+            bm25 = text_relevance.shard(start, stop).to_features() if text_relevance is not None else None
+            tasks = context.Queue()
+            worker = context.Process(
+                target=_shard_worker,
+                args=(internships[start:stop], config, tasks, self._results, bm25),
+                name=f"recommend-shard-{shard}",
+                daemon=True
+            )
+            worker.start()
+            self._tasks.append(tasks)
+            self._workers.append(worker)
+
+        self._closed = False
+        self._failure: Optional[str] = None
+
+        # Wait until every shard has built its index
+        deadline = None if startup_timeout is None else time.monotonic() + startup_timeout
+        ready = 0
+        while ready < self.n_shards:
+            try:
+                self._results.get(timeout=HEALTH_CHECK_S)
+                ready += 1
+                continue
+            except queue.Empty:
+                pass
+            failure = self._dead_worker()
+            if failure is None and deadline is not None and time.monotonic() > deadline:
+                failure = f"shards not ready after {startup_timeout}s"
+            if failure is not None:
+                self._stop_workers()
+                raise RuntimeError(f"ShardedRecommender failed to start: {failure}")
+
+        self._request_ids = itertools.count()
+        self._pending: Dict[int, List] = {}
+        self._lock = threading.Lock()
+        self._collector = threading.Thread(target=self._collect, name='recommend-shard-merge', daemon=True)
+        self._collector.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, posting_id: str) -> Optional[Dict]:
+        """Look up a posting by id (lets hydrate() use this object as its index)"""
+        pos = self.position.get(posting_id)
+        return None if pos is None else self.internships[pos]
+
+    def submit_batch(self, student_profiles: List[Dict], top_k: Union[int, List[int]] = 5) -> Future:
+        """Send profiles to every shard; the Future resolves to one CompactRecommendations per profile"""
+        top_ks = top_k if isinstance(top_k, list) else [top_k] * len(student_profiles)
+        future = Future()
+        request_id = next(self._request_ids)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ShardedRecommender is closed")
+            if self._failure is not None:
+                raise RuntimeError(f"ShardedRecommender is broken: {self._failure}")
+            self._pending[request_id] = [future, top_ks, []]
+        for tasks in self._tasks:
+            tasks.put((request_id, student_profiles, top_ks))
+        return future
+
+    def recommend(
+        self,
+        student_profile: Dict,
+        top_k: int = 5,
+        compact: bool = False,
+        timeout: Optional[float] = None
+    ) -> Union[List[Dict], CompactRecommendations]:
+        """Same result as recommender.recommend_indexed() over the whole catalog"""
+        return self.recommend_batch([student_profile], top_k, compact, timeout)[0]
+
+    def recommend_batch(
+        self,
+        student_profiles: List[Dict],
+        top_k: Union[int, List[int]] = 5,
+        compact: bool = False,
+        timeout: Optional[float] = None
+    ) -> List[Union[List[Dict], CompactRecommendations]]:
+        """Score many profiles in one round trip to the shards (TimeoutError after `timeout` seconds)"""
+        results = self.submit_batch(student_profiles, top_k).result(timeout)
+        if compact:
+            return results
+        return [self.recommender.hydrate(r, p, self) for r, p in zip(results, student_profiles)]
+
+    def close(self):
+        """Stop the shard processes"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._stop_workers()
+        self._results.put((None, None))
+        self._collector.join()
+
+    def _stop_workers(self):
+        for tasks in self._tasks:
+            tasks.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    def _dead_worker(self) -> Optional[str]:
+        for worker in self._workers:
+            if not worker.is_alive():
+                return f"{worker.name} exited with code {worker.exitcode}"
+        return None
+
+    def _fail_pending(self, message: str):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future, _, _ in pending.values():
+            future.set_exception(RuntimeError(message))
+
+    def _collect(self):
+        """Gather shard replies and resolve a request once every shard has answered"""
+        next_check = time.monotonic() + HEALTH_CHECK_S
+        while True:
+            try:
+                request_id, outcome = self._results.get(timeout=HEALTH_CHECK_S)
+            except queue.Empty:
+                request_id = outcome = Ellipsis
+            if not self._closed and time.monotonic() >= next_check:
+                next_check = time.monotonic() + HEALTH_CHECK_S
+                failure = self._dead_worker()
+                if failure is not None:
+                    # A dead shard never answers: fail what is waiting and refuse new work
+                    with self._lock:
+                        self._failure = failure
+                    self._fail_pending(f"ShardedRecommender is broken: {failure}")
+            if request_id is Ellipsis:
+                continue
+            if request_id is None:
+                break
+            with self._lock:
+                entry = self._pending.get(request_id)
+                if entry is None:
+                    continue
+                entry[2].append(outcome)
+                if len(entry[2]) < self.n_shards:
+                    continue
+                del self._pending[request_id]
+
+            future, top_ks, parts = entry
+            errors = [part for part in parts if isinstance(part, Exception)]
+            if errors:
+                future.set_exception(errors[0])
+            else:
+                future.set_result([
+                    self._merge([shard[n] for shard in parts], k) for n, k in enumerate(top_ks)
+                ])
+
+        self._fail_pending("ShardedRecommender is closed")
+
+    def _merge(self, shard_results: List[CompactRecommendations], top_k: int) -> CompactRecommendations:
+        """k-way merge of per-shard top-k lists, ordered like recommend() sorts"""
+        streams = [
+            [(-round(score, 3), self.position[pid], pid, score, row) for pid, score, row in result]
+            for result in shard_results
+        ]
+        merged = list(itertools.islice(heapq.merge(*streams), top_k))
+        factors = shard_results[0].factors if shard_results else tuple(self.recommender.weights)
+
+        return CompactRecommendations(
+            tuple(item[2] for item in merged),
+            np.array([item[3] for item in merged], dtype=np.float64),
+            np.array([item[4] for item in merged], dtype=np.float64).reshape(len(merged), len(factors)),
+            factors
+        )
@@ -0,0 +1,248 @@
+"""
+Shared Catalog Index - Cross-process, read-only catalog arrays
+One process publishes the catalog's numeric and skill-bitmap arrays into an
+mmap'd file (tmpfs-backed under /dev/shm on Linux); every worker maps the
+same pages read-only instead of holding its own copy.
+
+Publish / inspect:
+    python -m models.shared_index publish [--catalog data/real_internships_2025.json]
+    python -m models.shared_index info
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+from models.skill_vocab import SkillVocabulary
+
+DEFAULT_DIR = (
+    '/dev/shm/internship_index' if os.path.isdir('/dev/shm')
+    else os.path.join(tempfile.gettempdir(), 'internship_index')
+)
+MAGIC = b'INTIDX01'
+ALIGN = 64
+POINTER_FILE = 'CURRENT'
+
+def _segment_path(directory: str, version: int) -> str:
+    return os.path.join(directory, f"catalog.v{version:06d}.bin")
+
+def _current_version(directory: str) -> Optional[int]:
+    try:
+        with open(os.path.join(directory, POINTER_FILE), 'r', encoding='ascii') as f:
+            return int(f.read().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+def catalog_arrays(
+    internships: List[Dict],
+    vocabulary: SkillVocabulary
+) -> Tuple[Dict[str, np.ndarray], List[str]]:
+    """Numeric and skill-bitmap columns published for a catalog, plus the location table"""
+    locations = {}
+    location_codes = np.array(
+        [locations.setdefault(i.get('location', ''), len(locations)) for i in internships],
+        dtype=np.int32
+    )
+    return {
+        'experience_required': np.array([i.get('experience_required', 0) for i in internships], dtype=np.float64),
+        'stipend': np.array([i.get('stipend', 0) for i in internships], dtype=np.float64),
+        'duration_months': np.array([i.get('duration_months', 0) for i in internships], dtype=np.float64),
+        'location_codes': location_codes,
+        'required_skills': vocabulary.encode_matrix([i['required_skills'] for i in internships]),
+        'preferred_skills': vocabulary.encode_matrix([i.get('preferred_skills', []) for i in internships]),
+    }, list(locations)
+
+def publish_catalog(internships: List[Dict], directory: str = DEFAULT_DIR, keep: int = 2) -> int:
+    """
+    Write a new catalog version and make it current
+
+    The segment is fully written under a temporary name before the CURRENT
+    pointer is atomically replaced, so readers only ever see complete
+    versions. Older segments beyond `keep` are unlinked; processes that
+    still map them keep working until they refresh.
+
+    Returns:
+        The new version number
+    """
+    os.makedirs(directory, exist_ok=True)
+    version = (_current_version(directory) or 0) + 1
+
+    vocabulary = SkillVocabulary.from_catalog(internships)
+    arrays, location_values = catalog_arrays(internships, vocabulary)
+    catalog_blob = json.dumps(internships, ensure_ascii=False).encode('utf-8')
+
+    # Header first, then 64-byte aligned arrays, then the catalog JSON
+    header = {
+        'version': version,
+        'created_at': time.time(),
+        'count': len(internships),
+        'catalog_hash': hashlib.sha256(catalog_blob).hexdigest(),
+        'ids': [i.get('id', f"ROW{n}") for n, i in enumerate(internships)],
+        'location_values': location_values,
+        'vocabulary': vocabulary.skills,
+        'arrays': {},
+        'catalog': {},
+    }
+    # Offsets depend on the header size, which depends on the offsets: reserve room
+    header_room = len(json.dumps(header).encode('utf-8')) + 4096
+    offset = _aligned(len(MAGIC) + 8 + header_room)
+    for name, array in arrays.items():
+        header['arrays'][name] = {'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+        offset = _aligned(offset + array.nbytes)
+    header['catalog'] = {'offset': offset, 'length': len(catalog_blob)}
+    total = offset + len(catalog_blob)
+
+    header_bytes = json.dumps(header).encode('utf-8')
+    if len(header_bytes) > header_room:
+        raise ValueError(f"Catalog header needs {len(header_bytes)} bytes, only {header_room} reserved")
+
+    path = _segment_path(directory, version)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.truncate(total)
+        f.write(MAGIC)
+        f.write(np.uint64(len(header_bytes)).tobytes())
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(header['arrays'][name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.seek(header['catalog']['offset'])
+        f.write(catalog_blob)
+    os.replace(tmp_path, path)
+
+    # Atomic swap of the CURRENT pointer
+    pointer_tmp = os.path.join(directory, f"{POINTER_FILE}.tmp{os.getpid()}")
+    with open(pointer_tmp, 'w', encoding='ascii') as f:
+        f.write(str(version))
+    os.replace(pointer_tmp, os.path.join(directory, POINTER_FILE))
+
+    # Drop versions nobody should attach to any more
+    for old in range(version - keep, 0, -1):
+        try:
+            os.remove(_segment_path(directory, old))
+        except FileNotFoundError:
+            break
+        except OSError:
+            pass  # still mapped on platforms that forbid unlinking
+
+    return version
+
+def _aligned(offset: int) -> int:
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+class CatalogSnapshot:
+    """One immutable, read-only mapped catalog version"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a shared catalog segment")
+        header_len = int(np.frombuffer(self._map, dtype=np.uint64, count=1, offset=len(MAGIC))[0])
+        start = len(MAGIC) + 8
+        header = json.loads(self._map[start:start + header_len])
+
+        self.path = path
+        self.version = header['version']
+        self.created_at = header['created_at']
+        self.count = header['count']
+        self.catalog_hash = header['catalog_hash']
+        self.ids = header['ids']
+        self.location_values = header['location_values']
+        self.vocabulary = SkillVocabulary(header['vocabulary'])
+
+        # Zero-copy views; the mapping is read-only so writes raise
+        self.arrays = {
+            name: np.frombuffer(
+                self._map,
+                dtype=np.dtype(spec['dtype']),
+                count=int(np.prod(spec['shape'])),
+                offset=spec['offset']
+            ).reshape(spec['shape'])
+            for name, spec in header['arrays'].items()
+        }
+        self._catalog = header['catalog']
+        self._internships = None
+        self._lock = threading.Lock()
+
+    def internships(self) -> List[Dict]:
+        """The catalog records of this version (decoded once per process)"""
+        with self._lock:
+            if self._internships is None:
+                start = self._catalog['offset']
+                self._internships = json.loads(self._map[start:start + self._catalog['length']])
+            return self._internships
+
+class SharedCatalogReader:
+    """
+    Attaches to the current published catalog and follows new versions.
+
+    `current` is swapped with a single assignment, so a caller that reads it
+    once keeps a consistent snapshot even while refresh() moves on.
+    """
+
+    def __init__(self, directory: str = DEFAULT_DIR, check_interval_s: float = 0.5):
+        self.directory = directory
+        self.check_interval_s = check_interval_s
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+        version = _current_version(directory)
+        if version is None:
+            raise FileNotFoundError(f"No shared catalog published in {directory}")
+        self.current = self._attach(version)
+
+    def _attach(self, version: int) -> CatalogSnapshot:
+        # The pointer may move (and old segments vanish) between read and open
+        for _ in range(5):
+            try:
+                return CatalogSnapshot(_segment_path(self.directory, version))
+            except FileNotFoundError:
+                version = _current_version(self.directory) or version
+        raise FileNotFoundError(f"Shared catalog version {version} disappeared from {self.directory}")
+
+    def refresh(self, force: bool = False) -> bool:
+        """Switch to a newer published version; True if the snapshot changed"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.check_interval_s:
+            return False
+        with self._lock:
+            self._last_check = now
+            version = _current_version(self.directory)
+            if version is None or version == self.current.version:
+                return False
+            self.current = self._attach(version)
+            return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Publish or inspect the shared catalog index")
+    parser.add_argument("command", choices=["publish", "info"])
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="segment directory")
+    parser.add_argument("--catalog", help="catalog JSON (default: built-in 2025 data)")
+    args = parser.parse_args()
+
+    if args.command == "publish":
+        if args.catalog:
+            with open(args.catalog, 'r', encoding='utf-8') as f:
+                internships = json.load(f)
+        else:
+            from data.real_internships import get_all_internships
+            internships = get_all_internships()
+        version = publish_catalog(internships, args.dir)
+        print(f"✅ Published {len(internships)} internships as version {version} in {args.dir}")
+    else:
+        snapshot = SharedCatalogReader(args.dir).current
+        print(f"📦 Version {snapshot.version} ({snapshot.count} internships, {len(snapshot.vocabulary)} skills)")
+        print(f"   Path: {snapshot.path}")
+        print(f"   Catalog hash: {snapshot.catalog_hash[:16]}")
+        for name, array in snapshot.arrays.items():
+            print(f"   {name:<20} {str(array.dtype):<8} {array.shape}")
@@ -0,0 +1,151 @@
+"""
+Skill Vocabulary - Integer ids and bitmaps for skill sets
+"""
+
+import threading
+from functools import lru_cache
+from typing import List, Dict, Iterable, Tuple
+
+import numpy as np
+
+# Set bits per byte value, for popcounts over uint64 bitmaps
+_POPCOUNT8 = np.array([bin(n).count('1') for n in range(256)], dtype=np.uint8)
+
+def popcount(mask: int) -> int:
+    """Number of set bits of a Python int bitmask"""
+    return bin(mask).count('1')
+
+def popcount_rows(matrix: np.ndarray) -> np.ndarray:
+    """Set bits per row of a uint64 bitmap matrix"""
+    as_bytes = np.ascontiguousarray(matrix, dtype='<u8').view(np.uint8)
+    return _POPCOUNT8[as_bytes].sum(axis=-1, dtype=np.int64)
+
+class SkillVocabulary:
+    """
+    Maps normalized (lowercase, stripped) skill names to dense integer ids.
+
+    A skill set becomes a row of uint64 words with bit `id` set for every
+    skill it contains, so catalogs can be stored as fixed-size arrays.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills = sorted({s.lower().strip() for s in skills})
+        self.ids = {skill: n for n, skill in enumerate(self.skills)}
+        self.words = max((len(self.skills) + 63) // 64, 1)
+
+    @classmethod
+    def from_catalog(cls, internships: List[Dict]) -> 'SkillVocabulary':
+        """Vocabulary of every required/preferred skill in a catalog"""
+        return cls(
+            skill
+            for i in internships
+            for skill in i['required_skills'] + i.get('preferred_skills', [])
+        )
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def encode_words(self, skills: Iterable[str]) -> np.ndarray:
+        """Skill list -> uint64 bitmap row (unknown skills are ignored)"""
+        row = np.zeros(self.words, dtype=np.uint64)
+        for skill in skills:
+            n = self.ids.get(skill.lower().strip())
+            if n is not None:
+                row[n >> 6] |= np.uint64(1 << (n & 63))
+        return row
+
+    def encode_matrix(self, skill_lists: List[Iterable[str]]) -> np.ndarray:
+        """One bitmap row per skill list"""
+        matrix = np.zeros((len(skill_lists), self.words), dtype=np.uint64)
+        for r, skills in enumerate(skill_lists):
+            for skill in skills:
+                n = self.ids.get(skill.lower().strip())
+                if n is not None:
+                    matrix[r, n >> 6] |= np.uint64(1 << (n & 63))
+        return matrix
+
+    def decode_words(self, row: np.ndarray) -> List[str]:
+        """uint64 bitmap row -> skill names"""
+        names = []
+        for w, word in enumerate(row.tolist()):
+            while word:
+                low = word & -word
+                names.append(self.skills[(w << 6) + low.bit_length() - 1])
+                word ^= low
+        return names
+
+    def unpack(self, matrix: np.ndarray) -> np.ndarray:
+        """Bitmap rows -> boolean (rows x skills) array, column n for skill id n"""
+        as_bytes = np.ascontiguousarray(matrix, dtype='<u8').view(np.uint8)
+        return np.unpackbits(as_bytes, axis=-1, bitorder='little')[..., :len(self.skills)].astype(bool)
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """Skill list -> Python int bitmask (unknown skills are ignored)"""
+        mask = 0
+        for skill in skills:
+            n = self.ids.get(skill.lower().strip())
+            if n is not None:
+                mask |= 1 << n
+        return mask
+
+    def ids_of(self, mask: int) -> List[int]:
+        """Skill ids set in an int bitmask, ascending"""
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return ids
+
+    def names(self, mask: int) -> List[str]:
+        """Skill names of an int bitmask, in id order"""
+        return [self.skills[n] for n in self.ids_of(mask)]
+
+class SkillRegistry(SkillVocabulary):
+    """
+    Process-wide vocabulary that grows with the skills of scored postings.
+
+    Only trusted lists (posting skills and the synonym table) are added;
+    student skills are looked up with split(), which leaves unknown names
+    out of the registry, so arbitrary profiles cannot grow it. Masks of
+    added lists are memoized, so a catalog's lists are normalized once.
+    """
+
+    def __init__(self):
+        super().__init__(())
+        self._lock = threading.Lock()
+        self._mask_of = lru_cache(maxsize=1 << 16)(self._build_mask)
+
+    def add(self, skills: Iterable[str]) -> int:
+        """Bitmask of a posting or synonym skill list, adding unseen skills"""
+        return self._mask_of(skills if isinstance(skills, (tuple, frozenset)) else tuple(skills))
+
+    def _build_mask(self, skills: Tuple[str, ...]) -> int:
+        mask = 0
+        for skill in skills:
+            name = skill.lower().strip()
+            n = self.ids.get(name)
+            if n is None:
+                with self._lock:
+                    n = self.ids.get(name)
+                    if n is None:
+                        n = self.ids[name] = len(self.skills)
+                        self.skills.append(name)
+                        self.words = (len(self.skills) + 63) // 64
+            mask |= 1 << n
+        return mask
+
+    def split(self, skills: Iterable[str]) -> Tuple[int, Tuple[str, ...]]:
+        """(bitmask of known skills, normalized names of the rest) without adding anything"""
+        mask, unknown = 0, []
+        for skill in skills:
+            name = skill.lower().strip()
+            n = self.ids.get(name)
+            if n is None:
+                unknown.append(name)
+            else:
+                mask |= 1 << n
+        return mask, tuple(unknown)
+
+# Shared by every recommender in the process
+SKILLS = SkillRegistry()
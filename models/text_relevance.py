@@ -0,0 +1,207 @@
+"""
+Text Relevance - BM25 over posting titles and descriptions
+Tokenizes the catalog once; a query is scored against every posting by
+summing the precomputed weights of its terms
+"""
+
+import re
+import numpy as np
+from typing import List, Dict, Optional
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+STOPWORDS = frozenset("""
+a about an and are as at be become been being build by can do for from get grow has have i in into
+is it its looking me my of on or our so that the their this to towards want we will with work working
+would you your
+""".split())
+
+# Sub-indexes with fewer rows than catalog / ratio score only their rows
+SUBSET_SEARCH_RATIO = 16
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase terms without punctuation or stopwords ('node.js' and 'c++' stay whole)"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+class TextRelevanceIndex:
+    """
+    BM25 weights of every (term, posting) pair, stored term-major.
+
+    score(query) adds up the weight columns of the query's terms, i.e. one
+    sparse matrix-vector product that only touches postings containing a
+    query term. Scores are normalized by the best possible BM25 score of
+    the query's known terms, so they fall in [0, 1].
+    """
+
+    def __init__(self, documents: List[str], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.size = len(documents)
+        self.rows = None  # set on sub-indexes from take()
+        self._consecutive = self._sorted = None
+
+        vocabulary: Dict[str, int] = {}
+        doc_ids, term_ids, term_freqs = [], [], []
+        lengths = np.zeros(self.size)
+        for doc, text in enumerate(documents):
+            tokens = tokenize(text)
+            lengths[doc] = len(tokens)
+            counts: Dict[int, int] = {}
+            for token in tokens:
+                term = vocabulary.setdefault(token, len(vocabulary))
+                counts[term] = counts.get(term, 0) + 1
+            doc_ids.extend([doc] * len(counts))
+            term_ids.extend(counts)
+            term_freqs.extend(counts.values())
+
+        self.vocabulary = vocabulary
+        doc_ids = np.array(doc_ids, dtype=np.int64)
+        term_ids = np.array(term_ids, dtype=np.int64)
+        tf = np.array(term_freqs, dtype=np.float64)
+
+        df = np.bincount(term_ids, minlength=len(vocabulary))
+        self.idf = np.log(1 + (self.size - df + 0.5) / (df + 0.5))
+        avg_length = lengths.mean() if self.size and lengths.mean() else 1.0
+        norm = k1 * (1 - b + b * lengths[doc_ids] / avg_length)
+        weights = self.idf[term_ids] * tf * (k1 + 1) / (tf + norm)
+
+        # CSC layout: postings of term t are docs[indptr[t]:indptr[t + 1]]
+        order = np.argsort(term_ids, kind='stable')
+        self.docs = doc_ids[order]
+        self.weights = weights[order]
+        self.indptr = np.searchsorted(term_ids[order], np.arange(len(vocabulary) + 1))
+
+    @classmethod
+    def from_internships(cls, internships: List[Dict], **params) -> 'TextRelevanceIndex':
+        """Index over the text career-goal matching reads (title + description)"""
+        return cls([f"{i['title']} {i['description']}" for i in internships], **params)
+
+    def to_features(self) -> Dict[str, object]:
+        """Term table and weight arrays (see models.feature_cache)"""
+        if self.rows is not None:
+            raise ValueError("Only a full-catalog index can be exported")
+        return {
+            'params': np.array([self.k1, self.b, self.size], dtype=np.float64),
+            'terms': list(self.vocabulary),
+            'idf': self.idf,
+            'docs': self.docs,
+            'weights': self.weights,
+            'indptr': self.indptr
+        }
+
+    @classmethod
+    def from_features(cls, features: Dict[str, object]) -> 'TextRelevanceIndex':
+        """Index rebuilt from to_features() output without re-tokenizing"""
+        index = object.__new__(cls)
+        k1, b, size = features['params'].tolist()
+        index.k1, index.b, index.size = k1, b, int(size)
+        index.rows = index._consecutive = index._sorted = None
+        index.vocabulary = {term: n for n, term in enumerate(features['terms'])}
+        for name in ('idf', 'docs', 'weights', 'indptr'):
+            setattr(index, name, features[name])
+        return index
+
+    def term_ids(self, query: str) -> List[int]:
+        """Distinct known terms of a query"""
+        return sorted({self.vocabulary[t] for t in tokenize(query) if t in self.vocabulary})
+
+    def score(self, query: str) -> np.ndarray:
+        """Normalized BM25 relevance of every posting (of a take() sub-index: of its rows) to the query"""
+        terms = self.term_ids(query)
+        best = self.idf[terms].sum() * (self.k1 + 1)
+        if not terms or best <= 0:
+            return np.zeros(len(self))
+        if self.rows is not None:
+            return self._score_rows(terms) / best
+        docs = np.concatenate([self.docs[self.indptr[t]:self.indptr[t + 1]] for t in terms])
+        weights = np.concatenate([self.weights[self.indptr[t]:self.indptr[t + 1]] for t in terms])
+        return np.bincount(docs, weights, minlength=self.size) / best
+
+    def _score_rows(self, terms: List[int]) -> np.ndarray:
+        """
+        Unnormalized scores of a sub-index's rows, without scoring the catalog
+
+        Consecutive rows (streaming chunks) cut their range out of each
+        term's row-sorted postings. A small set of rows (retrieval candidates, selective filters)
+        is binary-searched in each term's row-sorted postings, so the cost
+        follows the rows, not the catalog. Only a subset covering a large
+        share of the catalog scores it whole and gathers its rows. Every
+        branch adds the terms in the same order, so sums match the full index.
+        """
+        n = len(self.rows)
+        start = self._first_row()
+        if start is not None:
+            # Each term's postings are sorted by row: cut out the range by binary search
+            spans = []
+            for t in terms:
+                first = self.indptr[t]
+                lo, hi = first + np.searchsorted(self.docs[first:self.indptr[t + 1]], [start, start + n])
+                spans.append((lo, hi))
+            docs = np.concatenate([self.docs[lo:hi] for lo, hi in spans]) - start
+            weights = np.concatenate([self.weights[lo:hi] for lo, hi in spans])
+            return np.bincount(docs, weights, minlength=n)
+        if n * SUBSET_SEARCH_RATIO >= self.size:
+            docs = np.concatenate([self.docs[self.indptr[t]:self.indptr[t + 1]] for t in terms])
+            weights = np.concatenate([self.weights[self.indptr[t]:self.indptr[t + 1]] for t in terms])
+            return np.bincount(docs, weights, minlength=self.size)[self.rows]
+
+        if self._sorted is None:
+            order = np.argsort(self.rows, kind='stable')
+            self._sorted = (self.rows[order], order)
+        sorted_rows, order = self._sorted
+        scores = np.zeros(n)
+        for t in terms:
+            docs = self.docs[self.indptr[t]:self.indptr[t + 1]]
+            if not len(docs):
+                continue
+            pos = np.minimum(np.searchsorted(docs, sorted_rows), len(docs) - 1)
+            hit = docs[pos] == sorted_rows
+            scores[hit] += self.weights[self.indptr[t] + pos[hit]]
+        local = np.empty(n)
+        local[order] = scores
+        return local
+
+    def _first_row(self) -> Optional[int]:
+        """First row of a sub-index whose rows are consecutive (None otherwise)"""
+        if self._consecutive is None:
+            rows = self.rows
+            self._consecutive = bool(len(rows)) and rows[-1] - rows[0] == len(rows) - 1 \
+                and bool(np.all(np.diff(rows) == 1))
+        return int(self.rows[0]) if self._consecutive else None
+
+    def take(self, rows) -> 'TextRelevanceIndex':
+        """
+        Same index restricted to some postings
+
+        Term statistics stay those of the full catalog, so scores match the
+        full index row for row. `rows` must be distinct: score() maps each
+        posting to its position among them.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        sub = object.__new__(type(self))
+        sub.__dict__.update(self.__dict__)
+        sub.rows = rows if self.rows is None else self.rows[rows]
+        sub._consecutive = sub._sorted = None
+        return sub
+
+    def shard(self, start: int, stop: int) -> 'TextRelevanceIndex':
+        """
+        Standalone index of postings start..stop-1 (renumbered from 0)
+
+        Unlike take(), only that range's weights are copied, so each worker
+        of a sharded pool holds its own part; IDF and length normalization
+        stay those of the full catalog, so scores match it row for row.
+        """
+        if self.rows is not None:
+            raise ValueError("Only a full-catalog index can be sharded")
+        terms = np.repeat(np.arange(len(self.vocabulary)), np.diff(self.indptr))
+        keep = (self.docs >= start) & (self.docs < stop)
+        sub = object.__new__(type(self))
+        sub.__dict__.update(self.__dict__)
+        sub.size = stop - start
+        sub.docs = self.docs[keep] - start
+        sub.weights = self.weights[keep]
+        sub.indptr = np.searchsorted(terms[keep], np.arange(len(self.vocabulary) + 1))
+        return sub
+
+    def __len__(self) -> int:
+        return self.size if self.rows is None else len(self.rows)
@@ -0,0 +1,162 @@
+"""
+Trending - Sliding-window view/save/apply counters for postings and skills
+Counts live in time-bucketed ring buffers, so memory is bounded by the
+activity inside the longest window and old buckets expire as time moves on.
+"""
+
+import heapq
+import threading
+import time
+from typing import List, Dict, Callable, Iterable, Optional, Tuple
+
+# Window name -> (bucket width in seconds, buckets in the ring)
+WINDOWS = {
+    'hour': (60, 60),
+    'day': (900, 96),
+    'week': (3600, 168)
+}
+
+EVENTS = ('view', 'save', 'apply')
+
+# Event store types -> trending events (shares are not counted)
+EVENT_STORE_TYPES = {'impression': 'view', 'save': 'save', 'apply': 'apply'}
+
+# Combined 'trending' score: a save or apply says more than a view
+TREND_WEIGHTS = {'view': 1.0, 'save': 3.0, 'apply': 5.0}
+
+KINDS = ('posting', 'skill')
+
+class SlidingWindowCounter:
+    """
+    Per-key counts over the last `buckets` x `width` seconds.
+
+    Each ring slot holds the counts of one bucket; a running total per key
+    is kept alongside, and a slot's counts are subtracted from it when the
+    slot is reused for a newer bucket. Not thread-safe on its own.
+    """
+
+    def __init__(self, width: float, buckets: int):
+        if width <= 0 or buckets < 1:
+            raise ValueError("width must be positive and buckets at least 1")
+        self.width = width
+        self.buckets = buckets
+        self._slots: List[Dict[str, float]] = [{} for _ in range(buckets)]
+        self._stamps = [-1] * buckets
+        self._totals: Dict[str, float] = {}
+
+    def _advance(self, bucket: int):
+        """Expire every slot older than the window ending at `bucket`"""
+        oldest = bucket - self.buckets + 1
+        for slot, stamp in enumerate(self._stamps):
+            if 0 <= stamp < oldest:
+                self._expire(slot)
+
+    def _expire(self, slot: int):
+        totals = self._totals
+        for key, count in self._slots[slot].items():
+            remaining = totals[key] - count
+            if remaining > 1e-9:
+                totals[key] = remaining
+            else:
+                del totals[key]
+        self._slots[slot] = {}
+        self._stamps[slot] = -1
+
+    def add(self, key: str, count: float, now: float):
+        bucket = int(now // self.width)
+        slot = bucket % self.buckets
+        stamp = self._stamps[slot]
+        if stamp > bucket:
+            # The slot already holds a bucket a whole ring newer: outside the window
+            return
+        if stamp != bucket:
+            if stamp >= 0:
+                self._expire(slot)
+            self._stamps[slot] = bucket
+        counts = self._slots[slot]
+        counts[key] = counts.get(key, 0) + count
+        self._totals[key] = self._totals.get(key, 0) + count
+
+    def count(self, key: str, now: float) -> float:
+        self._advance(int(now // self.width))
+        return self._totals.get(key, 0)
+
+    def top(self, n: int, now: float) -> List[Tuple[str, float]]:
+        """n largest keys (ties by key) over the window: O(keys log n)"""
+        self._advance(int(now // self.width))
+        return heapq.nsmallest(n, self._totals.items(), key=lambda item: (-item[1], item[0]))
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+class TrendingCounters:
+    """
+    Thread-safe trending counters shared by every session.
+
+    One SlidingWindowCounter per (kind, event, window), where kind is
+    'posting' or 'skill' and event is a view/save/apply or the weighted
+    'trending' score. record() and top() take a single lock for a few
+    dict updates, so concurrent sessions can call them freely.
+    """
+
+    def __init__(self, windows: Optional[Dict[str, Tuple[float, int]]] = None, clock: Callable[[], float] = time.time):
+        self.windows = dict(windows or WINDOWS)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._counters = {
+            (kind, event, window): SlidingWindowCounter(width, buckets)
+            for kind in KINDS
+            for event in EVENTS + ('trending',)
+            for window, (width, buckets) in self.windows.items()
+        }
+
+    def record(self, event: str, posting_id: str, skills: Iterable[str] = (), now: Optional[float] = None, count: int = 1):
+        """Count one view/save/apply of a posting and of each of its skills"""
+        if event not in EVENTS:
+            raise ValueError(f"event must be one of {EVENTS}")
+        now = self.clock() if now is None else now
+        keys = [('posting', posting_id)] + [('skill', skill) for skill in dict.fromkeys(skills)]
+        weight = TREND_WEIGHTS[event] * count
+        with self._lock:
+            for window in self.windows:
+                for kind, key in keys:
+                    self._counters[(kind, event, window)].add(key, count, now)
+                    self._counters[(kind, 'trending', window)].add(key, weight, now)
+
+    def top(
+        self,
+        kind: str = 'posting',
+        window: str = 'day',
+        event: str = 'trending',
+        n: int = 10,
+        now: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """Top n (key, count) of a kind in a window, highest first"""
+        counter = self._counters.get((kind, event, window))
+        if counter is None:
+            raise ValueError(f"Unknown counter: kind={kind!r}, event={event!r}, window={window!r}")
+        now = self.clock() if now is None else now
+        with self._lock:
+            return counter.top(n, now)
+
+    def count(self, key: str, kind: str = 'posting', window: str = 'day', event: str = 'trending',
+              now: Optional[float] = None) -> float:
+        now = self.clock() if now is None else now
+        with self._lock:
+            return self._counters[(kind, event, window)].count(key, now)
+
+    def replay(self, events: Iterable[Tuple], skills_of: Callable[[str], Iterable[str]] = lambda posting_id: ()) -> int:
+        """Feed read_events() rows (e.g. the last week at startup); returns how many were counted"""
+        counted = 0
+        for _, ts, _, event_type, posting_id in events:
+            event = EVENT_STORE_TYPES.get(event_type)
+            if event is not None:
+                self.record(event, posting_id, skills_of(posting_id), now=ts)
+                counted += 1
+        return counted
+
+    def stats(self) -> Dict:
+        """Tracked keys per kind in the longest window"""
+        longest = max(self.windows, key=lambda w: self.windows[w][0] * self.windows[w][1])
+        with self._lock:
+            return {kind: len(self._counters[(kind, 'trending', longest)]) for kind in KINDS}
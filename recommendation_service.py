@@ -0,0 +1,387 @@
+"""
+Headless Recommendation Service
+Local HTTP/JSON API over the recommendation engine (stdlib only)
+
+Run:
+    python recommendation_service.py --port 8600 --workers 8
+
+Several processes can share one catalog copy (see models/shared_index.py):
+    python -m models.shared_index publish
+    python recommendation_service.py --port 8600 --shared-index /dev/shm/internship_index
+
+Endpoints:
+    GET  /health
+    GET  /metrics              (Prometheus text, with --instrument)
+    GET  /internships/search?q=python&location=Bangalore,%20Karnataka&min_stipend=20000&limit=20
+    GET  /internships/<id>
+    POST /recommend            {"profile": {...}, "top_k": 10}
+    POST /recommend/batch      {"profiles": [{...}, ...], "top_k": 10}
+    POST /recommend/rerank     {"profile": {...}, "weights": {"skills_match": 0.5, ...}, "top_k": 10}
+                               (/recommend and /recommend/rerank also take "constraints":
+                                {"locations": [...], "min_stipend": 20000, "max_experience": 6, ...})
+                               (/recommend also takes "recency": {"max_age_days": 90, "half_life_days": 30,
+                                "as_of": "2025-03-01"}, scored over posted_date segments)
+    POST /profile-strength     {"profile": {...}}
+"""
+
+import argparse
+import json
+from datetime import date
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlparse, parse_qs
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from data.real_internships import get_all_internships
+from models.batching import RecommendationBatcher
+from models.catalog_index import CatalogIndex
+from models.constraints import RecommendationConstraints
+from models.feature_cache import load_or_build
+from models.partitioned import PartitionedCatalog
+from models.recommender import InternshipRecommender, calculate_profile_strength
+from models.shared_index import SharedCatalogReader
+
+MAX_BODY_BYTES = 1 << 20
+MAX_BATCH_SIZE = 256
+
+class RecommendationService:
+    """Holds the engine and the in-memory catalog index for the process lifetime"""
+
+    def __init__(
+        self,
+        internships: List[Dict] = None,
+        batch_wait_ms: float = 0.0,
+        max_batch_size: int = 32,
+        shared_dir: str = None,
+        instrument: bool = False
+    ):
+        self.recommender = InternshipRecommender()
+        if instrument:
+            self.recommender.enable_instrumentation()
+        self.started_at = time.time()
+        self.batch_wait_ms = batch_wait_ms
+        self.max_batch_size = max_batch_size
+        self.batcher = None
+        self._swap_lock = threading.Lock()
+
+        # With a shared index the catalog comes from the published segment
+        # and follows new versions; otherwise it is loaded once
+        self.reader = SharedCatalogReader(shared_dir) if shared_dir else None
+        if self.reader is not None:
+            self._install(CatalogIndex.from_snapshot(self.reader.current))
+        else:
+            catalog = internships if internships is not None else get_all_internships()
+            self._install(load_or_build(catalog, self.recommender))
+
+    def _install(self, index: CatalogIndex):
+        """Swap in a new index (and batcher); in-flight requests keep the old one"""
+        old_batcher = self.batcher
+        # Coalesce concurrent /recommend calls into batches when enabled
+        batcher = None
+        if self.batch_wait_ms > 0:
+            batcher = RecommendationBatcher(self.recommender, index, self.max_batch_size, self.batch_wait_ms)
+        self.index, self.batcher = index, batcher
+        self.internships = index.internships
+        # posted_date segments for recency queries, built on the first one
+        self._partitioned = None
+        if old_batcher is not None:
+            threading.Thread(target=old_batcher.close, daemon=True).start()
+
+    def _partitioned_catalog(self) -> PartitionedCatalog:
+        with self._swap_lock:
+            if self._partitioned is None or self._partitioned[0] is not self.index:
+                self._partitioned = (self.index, PartitionedCatalog(self.index.internships, self.recommender))
+            return self._partitioned[1]
+
+    def _refresh(self):
+        if self.reader is not None and self.reader.refresh():
+            with self._swap_lock:
+                if self.index.version != self.reader.current.version:
+                    self._install(CatalogIndex.from_snapshot(self.reader.current))
+
+    def health(self) -> Dict:
+        self._refresh()
+        health = {
+            'status': 'ok',
+            'internships': self.index.size,
+            'catalog_version': self.index.version,
+            'uptime_s': round(time.time() - self.started_at, 1)
+        }
+        if self.batcher is not None:
+            health['batching'] = self.batcher.stats()
+        return health
+
+    def recommend(self, payload: Dict) -> Dict:
+        profile = _require_profile(payload.get('profile'))
+        top_k = _top_k(payload)
+        constraints = RecommendationConstraints.from_dict(payload.get('constraints'))
+        recency = _recency(payload)
+        self._refresh()
+        if recency:
+            if not constraints.is_empty:
+                raise ValueError("'recency' cannot be combined with 'constraints'")
+            return {'recommendations': self._partitioned_catalog().recommend(profile, top_k, **recency)}
+        index, batcher = self.index, self.batcher
+        if batcher is not None and constraints.is_empty:
+            try:
+                future = batcher.submit(profile, top_k)
+            except RuntimeError:
+                # Closed by a catalog swap since we read it: score on the index we hold
+                future = None
+            if future is not None:
+                return {'recommendations': future.result()}
+        return {'recommendations': self.recommender.recommend_indexed(profile, index, top_k, constraints=constraints)}
+
+    def recommend_batch(self, payload: Dict) -> Dict:
+        profiles = payload.get('profiles')
+        if not isinstance(profiles, list) or not profiles:
+            raise ValueError("'profiles' must be a non-empty list")
+        if len(profiles) > MAX_BATCH_SIZE:
+            raise ValueError(f"At most {MAX_BATCH_SIZE} profiles per batch")
+        top_k = _top_k(payload)
+        profiles = [_require_profile(p) for p in profiles]
+        self._refresh()
+        return {'results': self.recommender.recommend_batch(profiles, self.index, top_k)}
+
+    def rerank(self, payload: Dict) -> Dict:
+        profile = _require_profile(payload.get('profile'))
+        weights = payload.get('weights')
+        if not isinstance(weights, dict) or not all(isinstance(w, (int, float)) for w in weights.values()):
+            raise ValueError("'weights' must map factor names to numbers")
+        top_k = _top_k(payload)
+        constraints = RecommendationConstraints.from_dict(payload.get('constraints'))
+        self._refresh()
+        return {'recommendations': self.recommender.rerank(profile, self.index, weights, top_k, constraints=constraints)}
+
+    def metrics(self) -> str:
+        """Prometheus text dump of the scoring instrumentation"""
+        if self.recommender.instrumentation is None:
+            raise KeyError('metrics (start the service with --instrument)')
+        return self.recommender.instrumentation.to_prometheus()
+
+    def profile_strength(self, payload: Dict) -> Dict:
+        return calculate_profile_strength(_require_profile(payload.get('profile')))
+
+    def search(self, params: Dict[str, List[str]]) -> Dict:
+        query = params.get('q', [''])[0]
+        locations = params.get('location') or None
+        min_stipend = float(params.get('min_stipend', ['0'])[0])
+        limit = int(params.get('limit', ['50'])[0])
+        self._refresh()
+        results = self.index.search(query, locations, min_stipend)
+        return {'total': len(results), 'internships': results[:max(limit, 0)]}
+
+    def get_internship(self, posting_id: str) -> Dict:
+        self._refresh()
+        internship = self.index.get(posting_id)
+        if internship is None:
+            raise KeyError(posting_id)
+        return internship
+
+# Profile fields the scorer reads, by expected JSON type
+_LIST_FIELDS = ('skills', 'interests', 'preferred_locations')
+_TEXT_FIELDS = ('education', 'career_goals', 'name', 'student_id')
+_NUMBER_FIELDS = ('experience_months', 'gpa')
+
+def _require_profile(profile) -> Dict:
+    """Reject malformed profiles with a 400 instead of failing inside scoring"""
+    if not isinstance(profile, dict):
+        raise ValueError("'profile' must be a JSON object")
+    for field in _LIST_FIELDS:
+        value = profile.get(field, [])
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise ValueError(f"'profile.{field}' must be a list of strings")
+    for field in _TEXT_FIELDS:
+        value = profile.get(field, '')
+        if not isinstance(value, str):
+            raise ValueError(f"'profile.{field}' must be a string")
+    for field in _NUMBER_FIELDS:
+        value = profile.get(field, 0)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"'profile.{field}' must be a number")
+    return profile
+
+def _top_k(payload: Dict) -> int:
+    top_k = payload.get('top_k', 10)
+    if not isinstance(top_k, int) or top_k < 1:
+        raise ValueError("'top_k' must be a positive integer")
+    return top_k
+
+def _recency(payload: Dict) -> Dict:
+    """PartitionedCatalog.recommend() options of a /recommend call ({} when absent)"""
+    recency = payload.get('recency')
+    if recency is None:
+        return {}
+    if not isinstance(recency, dict) or set(recency) - {'max_age_days', 'half_life_days', 'as_of'}:
+        raise ValueError("'recency' takes only 'max_age_days', 'half_life_days' and 'as_of'")
+    options = {}
+    max_age_days = recency.get('max_age_days')
+    if max_age_days is not None:
+        if not isinstance(max_age_days, int) or isinstance(max_age_days, bool) or max_age_days < 0:
+            raise ValueError("'recency.max_age_days' must be a non-negative integer")
+        options['max_age_days'] = max_age_days
+    half_life_days = recency.get('half_life_days')
+    if half_life_days is not None:
+        if isinstance(half_life_days, bool) or not isinstance(half_life_days, (int, float)) or half_life_days <= 0:
+            raise ValueError("'recency.half_life_days' must be a positive number")
+        options['half_life_days'] = half_life_days
+    as_of = recency.get('as_of')
+    if as_of is not None:
+        try:
+            options['as_of'] = date.fromisoformat(as_of)
+        except (TypeError, ValueError):
+            raise ValueError("'recency.as_of' must be an ISO date (YYYY-MM-DD)")
+    return options
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """Routes JSON requests to the RecommendationService bound on the server"""
+
+    server_version = "InternshipRecommender/1.0"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        service = self.server.service
+        if url.path == '/health':
+            self._dispatch(service.health)
+        elif url.path == '/metrics':
+            try:
+                self._send_text(200, service.metrics())
+            except KeyError as e:
+                self._send(404, {'error': f'Not found: {e}'})
+        elif url.path == '/internships/search':
+            self._dispatch(service.search, parse_qs(url.query))
+        elif url.path.startswith('/internships/'):
+            self._dispatch(service.get_internship, url.path[len('/internships/'):])
+        else:
+            self._send(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        routes = {
+            '/recommend': self.server.service.recommend,
+            '/recommend/batch': self.server.service.recommend_batch,
+            '/recommend/rerank': self.server.service.rerank,
+            '/profile-strength': self.server.service.profile_strength,
+        }
+        handler = routes.get(urlparse(self.path).path)
+        if handler is None:
+            self._send(404, {'error': 'Not found'})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            self._send(413, {'error': 'Request body too large'})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            self._send(400, {'error': f'Invalid JSON: {e}'})
+            return
+        if not isinstance(payload, dict):
+            self._send(400, {'error': 'Request body must be a JSON object'})
+            return
+        self._dispatch(handler, payload)
+
+    def _dispatch(self, func, *args):
+        try:
+            self._send(200, func(*args))
+        except KeyError as e:
+            self._send(404, {'error': f'Not found: {e}'})
+        except ValueError as e:
+            self._send(400, {'error': str(e)})
+        except Exception as e:
+            self._send(500, {'error': f'{type(e).__name__}: {e}'})
+
+    def _send(self, status: int, body: Dict):
+        # default=list renders lazy match_reasons (models.explanations.MatchReasons)
+        data = json.dumps(body, ensure_ascii=False, default=list).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_text(self, status: int, text: str):
+        data = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that handles connections on a fixed-size worker pool"""
+
+    daemon_threads = True
+
+    def __init__(self, address, service: RecommendationService, workers: int = 8, verbose: bool = False):
+        super().__init__(address, ServiceRequestHandler)
+        self.service = service
+        self.verbose = verbose
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='recommend')
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+        if self.service.batcher is not None:
+            self.service.batcher.close()
+
+def create_server(
+    host: str = '127.0.0.1',
+    port: int = 8600,
+    workers: int = 8,
+    verbose: bool = False,
+    batch_wait_ms: float = 0.0,
+    max_batch_size: int = 32,
+    shared_dir: str = None,
+    instrument: bool = False
+) -> PooledHTTPServer:
+    """Build the service and bind it (port 0 picks a free port)"""
+    service = RecommendationService(
+        batch_wait_ms=batch_wait_ms, max_batch_size=max_batch_size, shared_dir=shared_dir, instrument=instrument
+    )
+    return PooledHTTPServer((host, port), service, workers=workers, verbose=verbose)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless internship recommendation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--workers", type=int, default=8, help="request worker threads")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    parser.add_argument("--batch-wait-ms", type=float, default=0.0,
+                        help="coalesce /recommend calls arriving within this window (0 disables)")
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--shared-index", metavar="DIR",
+                        help="attach to a catalog published with `python -m models.shared_index publish`")
+    parser.add_argument("--instrument", action="store_true", help="record scoring metrics, served on /metrics")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.workers, args.verbose,
+                           args.batch_wait_ms, args.max_batch_size, args.shared_index, args.instrument)
+    print(f"🚀 Serving {server.service.index.size} internships on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()